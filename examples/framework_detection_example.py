@@ -7,6 +7,7 @@ and automatic optimization for different Python frameworks and deployment contex
 
 import sys
 from pathlib import Path
+from types import MappingProxyType
 import json
 
 # Add src to path for development
@@ -17,6 +18,35 @@ from mohflow.framework_detection import get_framework_summary, detect_frameworks
 from mohflow.auto_config import get_framework_recommendations, get_environment_summary
 
 
+# Simulated environment detection results, built once at import time
+_ENV_TABLE = MappingProxyType({
+    "development": MappingProxyType({
+        "log_level": "DEBUG",
+        "console_logging": True,
+        "file_logging": False,
+        "formatter": "development"
+    }),
+    "staging": MappingProxyType({
+        "log_level": "INFO",
+        "console_logging": True,
+        "file_logging": True,
+        "formatter": "structured"
+    }),
+    "production": MappingProxyType({
+        "log_level": "WARNING",
+        "console_logging": False,
+        "file_logging": True,
+        "formatter": "production"
+    }),
+})
+
+# Pre-rendered recommendation lines per environment
+_ENV_TABLE_LINES = MappingProxyType({
+    env: "\n".join(f"    • {key}: {value}" for key, value in recs.items())
+    for env, recs in _ENV_TABLE.items()
+})
+
+
 def demo_basic_framework_detection():
     """Demonstrate basic framework detection capabilities."""
     
@@ -231,36 +261,11 @@ def demo_environment_adaptivity():
     print(f"  • Platform: {env_summary['platform']}")
     
     # Show how configuration would change in different environments
-    environments = ["development", "staging", "production"]
+    environments = ("development", "staging", "production")
     
     for env in environments:
         print(f"\n⚙️  Configuration for {env.title()} Environment:")
-        
-        # Simulate environment detection results
-        if env == "development":
-            recommendations = {
-                "log_level": "DEBUG",
-                "console_logging": True,
-                "file_logging": False,
-                "formatter": "development"
-            }
-        elif env == "staging":
-            recommendations = {
-                "log_level": "INFO",
-                "console_logging": True,
-                "file_logging": True,
-                "formatter": "structured"
-            }
-        else:  # production
-            recommendations = {
-                "log_level": "WARNING",
-                "console_logging": False,
-                "file_logging": True,
-                "formatter": "production"
-            }
-        
-        for key, value in recommendations.items():
-            print(f"    • {key}: {value}")
+        print(_ENV_TABLE_LINES[env])
 
 
 def main():
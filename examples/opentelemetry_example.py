@@ -10,6 +10,7 @@ Prerequisites:
     pip install opentelemetry-exporter-otlp    # Optional for OTLP
 """
 
+import os
 import time
 from pathlib import Path
 import sys
@@ -17,17 +18,42 @@ import sys
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-try:
-    from opentelemetry import trace
-    HAS_OTEL = True
-except ImportError:
-    print("OpenTelemetry not available. Install with:")
-    print("pip install opentelemetry-api opentelemetry-sdk")
-    HAS_OTEL = False
-
 from mohflow.logger.base import MohflowLogger
 
 
+# OpenTelemetry is imported on first use so importing this module stays
+# cheap; False records a failed import
+_trace = None
+
+
+def _get_trace():
+    """Return the opentelemetry.trace module, or None if unavailable."""
+    global _trace
+    if _trace is None:
+        try:
+            from opentelemetry import trace
+            _trace = trace
+        except ImportError:
+            print("OpenTelemetry not available. Install with:")
+            print("pip install opentelemetry-api opentelemetry-sdk")
+            _trace = False
+    return _trace or None
+
+
+# Simulated work inside spans is off by default so span timings reflect
+# tracing overhead; set MOHFLOW_EXAMPLE_SIMULATE=1 to turn it on
+SIMULATE = os.environ.get("MOHFLOW_EXAMPLE_SIMULATE", "0") == "1"
+
+
+def _simulate(duration_ns: int) -> None:
+    """Busy-wait for duration_ns when simulation is enabled."""
+    if not SIMULATE:
+        return
+    deadline = time.perf_counter_ns() + duration_ns
+    while time.perf_counter_ns() < deadline:
+        pass
+
+
 def basic_tracing_example():
     """Basic example of OpenTelemetry integration."""
     
@@ -42,7 +68,8 @@ def basic_tracing_example():
         formatter_type="structured"
     )
     
-    if not HAS_OTEL:
+    trace = _get_trace()
+    if trace is None:
         print("OpenTelemetry not available - using regular logging")
         logger.info("This message will not have trace correlation")
         return
@@ -63,7 +90,7 @@ def basic_tracing_example():
         with tracer.start_as_current_span("validate_user_data") as validation_span:
             validation_span.set_attribute("validation.fields", ["email", "password"])
             
-            time.sleep(0.1)  # Simulate processing time
+            _simulate(100_000_000)  # Simulate processing time
             logger.info("User data validation completed",
                        fields_validated=["email", "password"],
                        validation_result="success")
@@ -73,7 +100,7 @@ def basic_tracing_example():
             db_span.set_attribute("db.operation", "insert")
             db_span.set_attribute("db.table", "users")
             
-            time.sleep(0.05)  # Simulate DB time
+            _simulate(50_000_000)  # Simulate DB time
             logger.info("User saved to database",
                        user_id=12345,
                        table="users")
@@ -99,7 +126,7 @@ def microservice_example():
         console_logging=True
     )
     
-    if not HAS_OTEL:
+    if _get_trace() is None:
         print("OpenTelemetry not available - traces won't be exported")
     
     # Simulate HTTP request processing
@@ -162,7 +189,8 @@ def trace_correlation_example():
         console_logging=True
     )
     
-    if not HAS_OTEL:
+    trace = _get_trace()
+    if trace is None:
         print("OpenTelemetry not available - correlation demo skipped")
         return
     
@@ -191,7 +219,7 @@ def trace_correlation_example():
             # In real implementation, trace context would be propagated
             # via HTTP headers to the downstream service
             
-            time.sleep(0.1)  # Simulate network call
+            _simulate(100_000_000)  # Simulate network call
             
             logger.info("Inventory service response received",
                        service="inventory",
@@ -208,7 +236,7 @@ def trace_correlation_example():
                        amount=199.98,
                        currency="USD")
             
-            time.sleep(0.05)  # Simulate payment processing
+            _simulate(50_000_000)  # Simulate payment processing
             
             logger.info("Payment completed",
                        service="payment",
@@ -241,22 +269,53 @@ def performance_considerations():
         log_file_path="/tmp/fast_logs.log"
     )
     
-    # Measure performance
+    # Same fast configuration, but keep only 1% of INFO records; dropped
+    # records return from the sampler before any serialization
+    sampled_logger = MohflowLogger(
+        service_name="high-throughput-sampled",
+        enable_otel=True,
+        formatter_type="fast",
+        async_handlers=True,
+        enable_context_enrichment=False,
+        console_logging=False,
+        file_logging=True,
+        log_file_path="/tmp/fast_logs_sampled.log",
+        enable_sampling=True,
+        sample_rate=0.01,
+    )
+    
     message_count = 10_000
-    start_time = time.perf_counter()
+    batch_size = 1000
     
-    for i in range(message_count):
-        fast_logger.info(f"High-throughput message {i}",
-                        batch_id=i // 1000,
-                        sequence=i)
+    def measure(logger):
+        """Log message_count records and return the elapsed seconds."""
+        info = logger.info
+        start_time = time.perf_counter()
+        
+        # The message is constant; the sequence number travels as a field,
+        # and batch ids come from the outer loop rather than a per-call divide
+        for batch_id, batch_start in enumerate(range(0, message_count, batch_size)):
+            for i in range(batch_start, batch_start + batch_size):
+                info("High-throughput message", batch_id=batch_id, sequence=i)
+        
+        return time.perf_counter() - start_time
     
-    end_time = time.perf_counter()
-    duration = end_time - start_time
+    # Measure performance
+    duration = measure(fast_logger)
     throughput = message_count / duration
     
     print(f"✓ Logged {message_count:,} messages in {duration:.3f}s")
     print(f"✓ Throughput: {throughput:,.0f} messages/second")
     print(f"✓ Average latency: {(duration/message_count)*1000:.3f}ms per message")
+    
+    # Measure with sampling; every call still pays the sampler decision
+    sampled_duration = measure(sampled_logger)
+    sampled_stats = sampled_logger.get_sampling_stats()
+    
+    print(f"\n✓ Sampled at 1%: {message_count:,} calls in {sampled_duration:.3f}s "
+          f"({sampled_stats['sampled_logs_count']:,} records written)")
+    print(f"✓ Throughput: {message_count / sampled_duration:,.0f} calls/second")
+    print(f"✓ Speedup from sampling: {duration / sampled_duration:.1f}x")
 
 
 def main():
@@ -9,14 +9,17 @@ Tests include:
 - Latency characteristics
 """
 
+import os
 import sys
 import time
 import statistics
 import gc
 import json
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -25,198 +28,277 @@ from mohflow.logger.base import MohflowLogger
 import logging
 
 
+# Test data with rich context, shared by every benchmark
+_TEST_DATA = {
+    'user_id': 'user123',
+    'request_id': 'req_456789',
+    'action': 'api_call',
+    'endpoint': '/api/v1/users/create',
+    'method': 'POST',
+    'status_code': 201,
+    'response_time_ms': 145.7,
+    'ip_address': '192.168.1.100',
+    'user_agent': 'Mozilla/5.0 (compatible)',
+    'session_id': 'sess_abcdef123456'
+}
+
+# Constant message so the loop doesn't build an f-string per call
+_BENCHMARK_MESSAGE = "Benchmark message"
+
+# Messages per timed batch; per-message latency is the batch average
+_BATCH_SIZE = 100
+
+
+@dataclass
+class BenchResult:
+    """Result of one logger throughput benchmark."""
+    
+    # Explicit slots rather than slots=True, which needs Python 3.10
+    __slots__ = (
+        'name', 'messages_per_second', 'total_time_seconds',
+        'avg_latency_ms', 'p95_latency_ms', 'p99_latency_ms',
+        'message_count', 'log_file_size_mb',
+    )
+    
+    name: str
+    messages_per_second: float
+    total_time_seconds: float
+    avg_latency_ms: float
+    p95_latency_ms: float
+    p99_latency_ms: float
+    message_count: int
+    log_file_size_mb: float
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that leaves flushing to a large write buffer.
+    
+    logging.FileHandler flushes after every record, which makes a
+    file-bound benchmark measure write syscalls rather than formatting.
+    Records are flushed when the buffer fills or the handler is closed.
+    """
+    
+    def __init__(self, filename: str, buffer_size: int = 1 << 20):
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding='utf-8')
+        
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+        
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            
+    def size_bytes(self) -> int:
+        """Flush buffered records and return the file size."""
+        self.acquire()
+        try:
+            self.stream.flush()
+            return os.fstat(self.stream.fileno()).st_size
+        finally:
+            self.release()
+
+
+def buffer_file_output(logger: logging.Logger) -> List[BufferedFileHandler]:
+    """Swap a logger's file handlers for buffered ones."""
+    buffered = []
+    for index, handler in enumerate(logger.handlers):
+        if isinstance(handler, logging.FileHandler):
+            replacement = BufferedFileHandler(handler.baseFilename)
+            replacement.setFormatter(handler.formatter)
+            replacement.setLevel(handler.level)
+            handler.close()
+            logger.handlers[index] = replacement
+            buffered.append(replacement)
+    return buffered
+
+
 class SimplePerformanceBenchmark:
     """Simple performance benchmark without external dependencies."""
     
     def __init__(self):
-        self.results: List[Dict[str, Any]] = []
+        self.results: List[Union[BenchResult, Dict[str, Any]]] = []
         self.temp_files: List[str] = []
         
     def create_temp_file(self) -> str:
         """Create temporary log file."""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.log')
-        temp_file.close()
-        self.temp_files.append(temp_file.name)
-        return temp_file.name
-        
-    def benchmark_mohflow_fast(self, message_count: int = 10000) -> Dict[str, Any]:
-        """Benchmark MohFlow with fast configuration."""
-        log_file = self.create_temp_file()
-        
-        # Create MohFlow logger with fast JSON serialization
+        fd, name = tempfile.mkstemp(suffix='.log')
+        os.close(fd)
+        self.temp_files.append(name)
+        return name
+        
+    def get_logger(self, log_file: str, formatter_type: str,
+                   **options: Any) -> MohflowLogger:
+        """Return a warmed-up MohFlow logger writing to log_file.
+        
+        The logger is warmed up with 1000 messages so construction and
+        first-call costs stay out of the measured loop.
+        """
         logger = MohflowLogger(
-            service_name="benchmark",
-            formatter_type="fast",  # Uses orjson
+            service_name=f"benchmark-{formatter_type}",
+            formatter_type=formatter_type,
             console_logging=False,
             file_logging=True,
-            log_file_path=log_file
+            log_file_path=log_file,
+            **options
         )
-        
-        # Test data with rich context
-        test_data = {
-            'user_id': 'user123',
-            'request_id': 'req_456789',
-            'action': 'api_call',
-            'endpoint': '/api/v1/users/create',
-            'method': 'POST',
-            'status_code': 201,
-            'response_time_ms': 145.7,
-            'ip_address': '192.168.1.100',
-            'user_agent': 'Mozilla/5.0 (compatible)',
-            'session_id': 'sess_abcdef123456'
-        }
+        buffer_file_output(logger.logger)
         
         # Warmup
-        for _ in range(100):
-            logger.info("Warmup message", **test_data)
-            
-        # Benchmark
-        latencies = []
-        gc.collect()
-        
-        start_time = time.perf_counter()
-        
-        for i in range(message_count):
-            latency_start = time.perf_counter()
-            
-            logger.info(f"Benchmark message {i}", **test_data)
+        for _ in range(1000):
+            logger.info("Warmup message", **_TEST_DATA)
             
-            latency_end = time.perf_counter()
-            latencies.append((latency_end - latency_start) * 1000)  # ms
-            
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+        return logger
         
-        return {
-            'name': 'MohFlow Fast (orjson)',
-            'messages_per_second': message_count / total_time,
-            'total_time_seconds': total_time,
-            'avg_latency_ms': statistics.mean(latencies),
-            'p95_latency_ms': statistics.quantiles(latencies, n=20)[18] if len(latencies) > 19 else max(latencies),
-            'p99_latency_ms': statistics.quantiles(latencies, n=100)[98] if len(latencies) > 99 else max(latencies),
-            'message_count': message_count,
-            'log_file_size_mb': Path(log_file).stat().st_size / 1024 / 1024
-        }
+    def log_size_mb(self, logger: logging.Logger) -> float:
+        """Flush a logger's buffered file and return its size in MB.
         
-    def benchmark_mohflow_structured(self, message_count: int = 10000) -> Dict[str, Any]:
-        """Benchmark MohFlow with structured formatter."""
-        log_file = self.create_temp_file()
-        
-        logger = MohflowLogger(
-            service_name="benchmark",
-            formatter_type="structured",  # Standard JSON
-            console_logging=False,
-            file_logging=True,
-            log_file_path=log_file,
-            enable_context_enrichment=True
+        Reads the size from the open descriptor with fstat rather than
+        resolving the path again.
+        """
+        size = sum(
+            handler.size_bytes() for handler in logger.handlers
+            if isinstance(handler, BufferedFileHandler)
         )
-        
-        test_data = {
-            'user_id': 'user123',
-            'request_id': 'req_456789',
-            'action': 'api_call',
-            'endpoint': '/api/v1/users/create',
-            'method': 'POST',
-            'status_code': 201,
-            'response_time_ms': 145.7,
-            'ip_address': '192.168.1.100',
-            'user_agent': 'Mozilla/5.0 (compatible)',
-            'session_id': 'sess_abcdef123456'
-        }
-        
-        # Warmup
-        for _ in range(100):
-            logger.info("Warmup message", **test_data)
-            
-        # Benchmark
-        latencies = []
+        return size / 1024 / 1024
+        
+    def run_timed(self, log_call, message_count: int, *args, **kwargs):
+        """Log message_count records, timing them in batches of _BATCH_SIZE.
+        
+        Timing each batch rather than each message keeps perf_counter
+        calls and list appends out of the measured loop. The garbage
+        collector is paused while timing, as pyperf and timeit do, so
+        collection pauses don't land in random batches.
+        """
+        perf = time.perf_counter
+        batches = [
+            min(_BATCH_SIZE, message_count - offset)
+            for offset in range(0, message_count, _BATCH_SIZE)
+        ]
+        latencies = [0.0] * len(batches)  # filled by index, no appends
         gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
         
-        start_time = time.perf_counter()
-        
-        for i in range(message_count):
-            latency_start = time.perf_counter()
-            
-            logger.info(f"Benchmark message {i}", **test_data)
-            
-            latency_end = time.perf_counter()
-            latencies.append((latency_end - latency_start) * 1000)
+        try:
+            start_time = perf()
             
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+            for index, batch in enumerate(batches):
+                batch_start = perf()
+                
+                for _ in range(batch):
+                    log_call(*args, **kwargs)
+                    
+                latencies[index] = (perf() - batch_start) * 1000 / batch  # ms
+                
+            total_time = perf() - start_time
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+                
+        return total_time, latencies
         
+    def latency_stats(self, latencies: List[float]) -> Dict[str, float]:
+        """Summarize per-message batch latencies."""
+        ordered = sorted(latencies)
+        last = len(ordered) - 1
         return {
-            'name': 'MohFlow Structured + Context',
-            'messages_per_second': message_count / total_time,
-            'total_time_seconds': total_time,
-            'avg_latency_ms': statistics.mean(latencies),
-            'p95_latency_ms': statistics.quantiles(latencies, n=20)[18] if len(latencies) > 19 else max(latencies),
-            'p99_latency_ms': statistics.quantiles(latencies, n=100)[98] if len(latencies) > 99 else max(latencies),
-            'message_count': message_count,
-            'log_file_size_mb': Path(log_file).stat().st_size / 1024 / 1024
+            'avg_latency_ms': statistics.fmean(ordered),
+            'p95_latency_ms': ordered[round(last * 0.95)],
+            'p99_latency_ms': ordered[round(last * 0.99)],
         }
         
-    def benchmark_standard_logging(self, message_count: int = 10000) -> Dict[str, Any]:
-        """Benchmark standard Python logging."""
-        log_file = self.create_temp_file()
+    def make_mohflow_fast(self, log_file: str):
+        """MohFlow logger with fast JSON serialization (uses orjson)."""
+        logger = self.get_logger(log_file, "fast")
+        return logger.logger, logger.info, _TEST_DATA
+        
+    def make_mohflow_structured(self, log_file: str):
+        """MohFlow standard JSON formatter with context enrichment."""
+        logger = self.get_logger(
+            log_file, "structured", enable_context_enrichment=True
+        )
+        return logger.logger, logger.info, _TEST_DATA
         
+    def make_standard_logging(self, log_file: str):
+        """Standard Python logging with a plain text formatter."""
         logger = logging.getLogger("benchmark_standard")
         logger.setLevel(logging.INFO)
         
-        # Clear any existing handlers
+        # Close and clear any handlers left from a previous run
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+            handler.close()
             
-        # Add file handler
-        handler = logging.FileHandler(log_file)
+        # Add buffered file handler, matching the MohFlow benchmarks
+        handler = BufferedFileHandler(log_file)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
         
-        test_data = {
-            'user_id': 'user123',
-            'request_id': 'req_456789',
-            'action': 'api_call',
-            'endpoint': '/api/v1/users/create',
-            'method': 'POST',
-            'status_code': 201,
-            'response_time_ms': 145.7,
-            'ip_address': '192.168.1.100',
-            'user_agent': 'Mozilla/5.0 (compatible)',
-            'session_id': 'sess_abcdef123456'
-        }
+        # Bind the context once instead of passing extra= on every call
+        adapter = logging.LoggerAdapter(logger, _TEST_DATA)
         
         # Warmup
         for _ in range(100):
-            logger.info("Warmup message", extra=test_data)
+            adapter.info("Warmup message")
             
-        # Benchmark  
-        latencies = []
-        gc.collect()
+        return logger, adapter.info, {}
         
-        start_time = time.perf_counter()
+    def run_logger_benchmark(self, name: str, make_logger,
+                             message_count: int) -> BenchResult:
+        """Benchmark the logger built by make_logger.
         
-        for i in range(message_count):
-            latency_start = time.perf_counter()
-            
-            logger.info(f"Benchmark message {i}", extra=test_data)
-            
-            latency_end = time.perf_counter()
-            latencies.append((latency_end - latency_start) * 1000)
-            
-        end_time = time.perf_counter()
-        total_time = end_time - start_time
+        make_logger takes a fresh log file path and returns the stdlib
+        logger that writes it, the log call to time, and the keyword
+        fields to pass on each call.
+        """
+        log_file = self.create_temp_file()
+        logger, log_call, fields = make_logger(log_file)
         
-        return {
-            'name': 'Standard Python Logging',
-            'messages_per_second': message_count / total_time,
-            'total_time_seconds': total_time,
-            'avg_latency_ms': statistics.mean(latencies),
-            'p95_latency_ms': statistics.quantiles(latencies, n=20)[18] if len(latencies) > 19 else max(latencies),
-            'p99_latency_ms': statistics.quantiles(latencies, n=100)[98] if len(latencies) > 99 else max(latencies),
-            'message_count': message_count,
-            'log_file_size_mb': Path(log_file).stat().st_size / 1024 / 1024
-        }
+        # Only count what the timed run writes, not the warmup records
+        warmup_size_mb = self.log_size_mb(logger)
+        try:
+            total_time, latencies = self.run_timed(
+                log_call, message_count, _BENCHMARK_MESSAGE, **fields
+            )
+            log_file_size_mb = self.log_size_mb(logger) - warmup_size_mb
+        finally:
+            for handler in logger.handlers:
+                if isinstance(handler, BufferedFileHandler):
+                    handler.close()
+        
+        return BenchResult(
+            name=name,
+            messages_per_second=message_count / total_time,
+            total_time_seconds=total_time,
+            **self.latency_stats(latencies),
+            message_count=message_count,
+            log_file_size_mb=log_file_size_mb
+        )
+        
+    def benchmark_mohflow_fast(self, message_count: int = 10000) -> BenchResult:
+        """Benchmark MohFlow with fast configuration."""
+        return self.run_logger_benchmark(
+            'MohFlow Fast (orjson)', self.make_mohflow_fast, message_count
+        )
+        
+    def benchmark_mohflow_structured(self, message_count: int = 10000) -> BenchResult:
+        """Benchmark MohFlow with structured formatter."""
+        return self.run_logger_benchmark(
+            'MohFlow Structured + Context', self.make_mohflow_structured,
+            message_count
+        )
+        
+    def benchmark_standard_logging(self, message_count: int = 10000) -> BenchResult:
+        """Benchmark standard Python logging."""
+        return self.run_logger_benchmark(
+            'Standard Python Logging', self.make_standard_logging,
+            message_count
+        )
         
     def benchmark_json_serialization(self) -> Dict[str, Any]:
         """Benchmark JSON serialization performance comparison."""
@@ -288,21 +370,26 @@ class SimplePerformanceBenchmark:
             
         iterations = 10000
         
+        # Both loops time pure encoding; neither converts between str and
+        # bytes, since that isn't part of serialization cost
+        
         # Standard JSON benchmark
+        dumps = json.dumps
         start_time = time.perf_counter()
         
         for _ in range(iterations):
-            json.dumps(complex_data, ensure_ascii=False, separators=(',', ':'))
+            dumps(complex_data, ensure_ascii=False, separators=(',', ':'))
             
         standard_time = time.perf_counter() - start_time
         
         # orjson benchmark (if available)
         orjson_time = 0
         if has_orjson:
+            dumps = orjson.dumps
             start_time = time.perf_counter()
             
             for _ in range(iterations):
-                orjson.dumps(complex_data).decode('utf-8')
+                dumps(complex_data)
                 
             orjson_time = time.perf_counter() - start_time
             
@@ -319,7 +406,7 @@ class SimplePerformanceBenchmark:
             'orjson_available': has_orjson
         }
         
-    def run_all_benchmarks(self, message_count: int = 25000) -> List[Dict[str, Any]]:
+    def run_all_benchmarks(self, message_count: int = 25000) -> List[Union[BenchResult, Dict[str, Any]]]:
         """Run all performance benchmarks."""
         
         print("🏆 MohFlow Performance Comparison")
@@ -328,21 +415,31 @@ class SimplePerformanceBenchmark:
         print()
         
         benchmarks = [
-            ("MohFlow Fast", self.benchmark_mohflow_fast),
-            ("MohFlow Structured", self.benchmark_mohflow_structured), 
-            ("Standard Logging", self.benchmark_standard_logging)
+            ("MohFlow Fast", "benchmark_mohflow_fast"),
+            ("MohFlow Structured", "benchmark_mohflow_structured"), 
+            ("Standard Logging", "benchmark_standard_logging")
         ]
         
         results = []
         
-        for name, benchmark_func in benchmarks:
-            print(f"🔄 Running {name}...", end=" ", flush=True)
-            try:
-                result = benchmark_func(message_count)
-                results.append(result)
-                print(f"✅ {result['messages_per_second']:,.0f} msg/sec")
-            except Exception as e:
-                print(f"❌ Error: {e}")
+        # The logger benchmarks are independent, so run each in its own
+        # process; every process has its own GIL, GC and temp files
+        print("🔄 Running logger benchmarks in parallel...")
+        workers = min(len(benchmarks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (name, executor.submit(run_benchmark, method_name, message_count))
+                for name, method_name in benchmarks
+            ]
+            
+            for name, future in futures:
+                print(f"   {name}...", end=" ", flush=True)
+                try:
+                    result = future.result()
+                    results.append(result)
+                    print(f"✅ {result.messages_per_second:,.0f} msg/sec")
+                except Exception as e:
+                    print(f"❌ Error: {e}")
                 
         # JSON serialization benchmark
         print(f"🔄 Running JSON Serialization Benchmark...", end=" ", flush=True)
@@ -367,22 +464,22 @@ class SimplePerformanceBenchmark:
         print("=" * 80)
         
         # Logging performance results
-        logging_results = [r for r in self.results if 'messages_per_second' in r]
+        logging_results = [r for r in self.results if isinstance(r, BenchResult)]
         
         if logging_results:
             print(f"\n{'Logger':<30} {'Msg/Sec':<12} {'Avg Lat (ms)':<12} {'P99 Lat (ms)':<12} {'File Size (MB)':<12}")
             print("-" * 80)
             
             # Sort by performance
-            sorted_results = sorted(logging_results, key=lambda x: x['messages_per_second'], reverse=True)
+            sorted_results = sorted(logging_results, key=lambda x: x.messages_per_second, reverse=True)
             
             for result in sorted_results:
-                print(f"{result['name']:<30} {result['messages_per_second']:>11,.0f} "
-                      f"{result['avg_latency_ms']:>11.3f} {result['p99_latency_ms']:>11.3f} "
-                      f"{result['log_file_size_mb']:>11.2f}")
+                print(f"{result.name:<30} {result.messages_per_second:>11,.0f} "
+                      f"{result.avg_latency_ms:>11.3f} {result.p99_latency_ms:>11.3f} "
+                      f"{result.log_file_size_mb:>11.2f}")
                       
         # JSON serialization results
-        json_results = [r for r in self.results if 'test_name' in r and 'JSON' in r['test_name']]
+        json_results = [r for r in self.results if isinstance(r, dict) and 'JSON' in r['test_name']]
         
         if json_results:
             json_result = json_results[0]
@@ -402,25 +499,25 @@ class SimplePerformanceBenchmark:
         
         if logging_results:
             fastest = sorted_results[0]
-            print(f"🏅 Fastest Logger: {fastest['name']}")
-            print(f"   Performance: {fastest['messages_per_second']:,.0f} messages/second")
-            print(f"   Latency P99: {fastest['p99_latency_ms']:.3f}ms")
+            print(f"🏅 Fastest Logger: {fastest.name}")
+            print(f"   Performance: {fastest.messages_per_second:,.0f} messages/second")
+            print(f"   Latency P99: {fastest.p99_latency_ms:.3f}ms")
             
             # Compare MohFlow vs Standard
-            mohflow_results = [r for r in sorted_results if 'MohFlow' in r['name']]
-            standard_results = [r for r in sorted_results if 'Standard' in r['name']]
+            mohflow_results = [r for r in sorted_results if 'MohFlow' in r.name]
+            standard_results = [r for r in sorted_results if 'Standard' in r.name]
             
             if mohflow_results and standard_results:
                 best_mohflow = mohflow_results[0]
                 standard = standard_results[0]
                 
-                speedup = best_mohflow['messages_per_second'] / standard['messages_per_second']
-                latency_improvement = standard['avg_latency_ms'] / best_mohflow['avg_latency_ms']
+                speedup = best_mohflow.messages_per_second / standard.messages_per_second
+                latency_improvement = standard.avg_latency_ms / best_mohflow.avg_latency_ms
                 
                 print(f"\n📈 MohFlow vs Standard Python Logging:")
                 print(f"   Throughput: {speedup:.1f}x faster")
                 print(f"   Latency: {latency_improvement:.1f}x lower")
-                print(f"   File Size: {best_mohflow['log_file_size_mb']:.2f}MB vs {standard['log_file_size_mb']:.2f}MB")
+                print(f"   File Size: {best_mohflow.log_file_size_mb:.2f}MB vs {standard.log_file_size_mb:.2f}MB")
                 
         # Key advantages
         print(f"\n🎯 KEY MOHFLOW ADVANTAGES:")
@@ -433,12 +530,30 @@ class SimplePerformanceBenchmark:
         print("✅ Framework detection: Zero-config optimization")
         
     def cleanup(self):
-        """Clean up temporary files."""
+        """Clean up loggers and temporary files."""
+        standard_logger = logging.getLogger("benchmark_standard")
+        for handler in standard_logger.handlers[:]:
+            standard_logger.removeHandler(handler)
+            handler.close()
+            
         for temp_file in self.temp_files:
             try:
-                Path(temp_file).unlink(missing_ok=True)
-            except Exception:
+                os.unlink(temp_file)
+            except OSError:
                 pass
+        self.temp_files.clear()
+
+
+def run_benchmark(method_name: str, message_count: int) -> BenchResult:
+    """Run one logger benchmark on a fresh benchmark instance.
+    
+    Module-level so it can be submitted to a process pool.
+    """
+    benchmark = SimplePerformanceBenchmark()
+    try:
+        return getattr(benchmark, method_name)(message_count)
+    finally:
+        benchmark.cleanup()
 
 
 def main():
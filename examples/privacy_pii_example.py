@@ -5,9 +5,15 @@ This example demonstrates MohFlow's ML-based PII detection,
 privacy-aware logging modes, and compliance reporting capabilities.
 """
 
+import io
+import os
 import sys
 from pathlib import Path
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
 from datetime import datetime
 
 # Add src to path for development
@@ -15,7 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from mohflow.logger.base import MohflowLogger
 from mohflow.privacy import (
-    detect_pii, scan_for_pii, generate_privacy_report,
+    detect_pii, detect_pii_batch, scan_for_pii, generate_privacy_report,
     PIILevel, PrivacyMode, ComplianceStandard
 )
 
@@ -104,7 +110,7 @@ def demo_data_structure_scanning():
     pii_results = scan_for_pii(user_data)
     
     print(f"\n📊 PII Detection Results:")
-    print(f"   Fields scanned: {len(list(_flatten_dict(user_data)))}")
+    print(f"   Fields scanned: {sum(1 for _ in _iter_flatten(user_data))}")
     print(f"   PII detected in: {len(pii_results)} fields")
     
     for field_path, result in pii_results.items():
@@ -116,6 +122,16 @@ def demo_data_structure_scanning():
         print(f"      Redacted: {result.redacted_value}")
         
 
+@lru_cache(maxsize=16)
+def _get_demo_logger(service_name, **kwargs):
+    """Build a logger once per configuration and reuse it afterwards.
+
+    Constructing a MohflowLogger attaches fresh handlers to the stdlib
+    logger for service_name, so rebuilding it would also duplicate output.
+    """
+    return MohflowLogger(service_name=service_name, **kwargs)
+
+
 def demo_privacy_aware_logging():
     """Demonstrate privacy-aware logging with different modes."""
     
@@ -144,9 +160,9 @@ def demo_privacy_aware_logging():
         print(f"    {description}")
         
         try:
-            # Create logger with privacy mode
-            logger = MohflowLogger(
-                service_name=f"privacy-demo-{mode}",
+            # Get (or reuse) the logger for this privacy mode
+            logger = _get_demo_logger(
+                f"privacy-demo-{mode}",
                 console_logging=True,
                 enable_pii_detection=True,
                 privacy_mode=mode,
@@ -191,14 +207,17 @@ def demo_compliance_reporting():
     
     print("📋 Analyzing compliance violations...")
     
-    # Analyze each record for compliance issues
-    all_detections = {}
+    # Scan all records once; the same detections feed the report below
+    sample_data = {
+        f"record_{i}": {record['field']: record['value']}
+        for i, record in enumerate(test_records)
+    }
+    all_detections = scan_for_pii(sample_data)
+    
     for i, record in enumerate(test_records):
-        field_path = f"record_{i}.{record['field']}"
-        detection = detect_pii(record['value'], record['field'])
+        detection = all_detections.get(f"record_{i}.{record['field']}")
         
-        if detection.level != PIILevel.NONE:
-            all_detections[field_path] = detection
+        if detection is not None:
             print(f"\n   ⚠️  Violation in {record['context']}:")
             print(f"      Field: {record['field']}")
             print(f"      PII Level: {detection.level.value}")
@@ -207,8 +226,9 @@ def demo_compliance_reporting():
     # Generate privacy report
     if all_detections:
         print(f"\n📊 Privacy Risk Assessment:")
-        sample_data = {f"field_{i}": r['value'] for i, r in enumerate(test_records)}
-        privacy_report = generate_privacy_report(sample_data)
+        privacy_report = generate_privacy_report(
+            sample_data, detections=all_detections
+        )
         
         print(f"   Total fields: {privacy_report['total_fields_scanned']}")
         print(f"   PII detected: {privacy_report['pii_fields_detected']}")
@@ -269,20 +289,15 @@ def demo_performance_and_caching():
     
     print("⚡ Performance Testing PII Detection...")
     
-    # Time the detection process
-    start_time = time.time()
-    
-    results = []
-    for value in test_values:
-        result = detect_pii(value)
-        results.append(result)
-        
-    end_time = time.time()
+    # Time the detection process; the batch call reuses results for
+    # repeated values instead of re-running every pattern
+    start_ns = time.perf_counter_ns()
+    results = detect_pii_batch(test_values)
+    total_time = (time.perf_counter_ns() - start_ns) / 1e9
     
     # Calculate statistics
-    total_time = end_time - start_time
     avg_time_ms = (total_time / len(test_values)) * 1000
-    pii_detected = sum(1 for r in results if r.level != PIILevel.NONE)
+    pii_detected = sum(r.level is not PIILevel.NONE for r in results)
     
     print(f"   📊 Performance Results:")
     print(f"      Total values processed: {len(test_values)}")
@@ -292,40 +307,71 @@ def demo_performance_and_caching():
     print(f"      Detection rate: {(pii_detected/len(test_values)*100):.1f}%")
     
 
-def _flatten_dict(d, parent_key='', sep='.'):
-    """Flatten nested dictionary for counting."""
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(_flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            for i, item in enumerate(v):
-                if isinstance(item, dict):
-                    items.extend(_flatten_dict(item, f"{new_key}[{i}]", sep=sep).items())
-                else:
-                    items.append((f"{new_key}[{i}]", item))
-        else:
-            items.append((new_key, v))
-    return dict(items)
+def _iter_flatten(d, sep='.'):
+    """Yield (path, value) leaves of a nested dictionary without recursion."""
+    stack = deque([('', d)])
+    while stack:
+        parent_key, node = stack.pop()
+        for k, v in node.items():
+            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+            if isinstance(v, dict):
+                # Container paths become prefixes of every leaf below them;
+                # a top-level key is used as-is and may not be a str
+                if type(new_key) is str:
+                    new_key = sys.intern(new_key)
+                stack.append((new_key, v))
+            elif isinstance(v, list):
+                for i, item in enumerate(v):
+                    if isinstance(item, dict):
+                        stack.append((sys.intern(f"{new_key}[{i}]"), item))
+                    else:
+                        yield f"{new_key}[{i}]", item
+            else:
+                yield new_key, v
+
+
+# Human-readable redaction strategy per PII level
+_STRATEGY_BY_LEVEL = {
+    PIILevel.CRITICAL: "Show only first character (maximum protection)",
+    PIILevel.HIGH: "Show first and last characters (high protection)",
+    PIILevel.MEDIUM: "Show partial content (balanced protection)",
+    PIILevel.LOW: "Hash-based redaction (preserves utility)",
+}
 
 
 def _get_redaction_strategy(result):
     """Get human-readable redaction strategy description."""
-    if result.level == PIILevel.CRITICAL:
-        return "Show only first character (maximum protection)"
-    elif result.level == PIILevel.HIGH:
-        return "Show first and last characters (high protection)"
-    elif result.level == PIILevel.MEDIUM:
-        return "Show partial content (balanced protection)"
-    elif result.level == PIILevel.LOW:
-        return "Hash-based redaction (preserves utility)"
-    else:
-        return "No redaction needed"
+    return _STRATEGY_BY_LEVEL.get(result.level, "No redaction needed")
+
+
+# Independent demonstrations, in the order their output is printed
+DEMOS = (
+    demo_basic_pii_detection,
+    demo_data_structure_scanning,
+    demo_privacy_aware_logging,
+    demo_compliance_reporting,
+    demo_intelligent_redaction,
+    demo_performance_and_caching,
+)
 
 
-def main():
-    """Run all privacy and PII protection demonstrations."""
+def _run_captured(demo):
+    """Run a demo in a worker process and return what it printed."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        demo()
+    return buffer.getvalue()
+
+
+def main(parallel=False):
+    """Run all privacy and PII protection demonstrations.
+
+    With parallel=True (``--parallel`` on the command line) each demo runs
+    in its own process and their output is printed in the usual order.
+    The demos are short, so this only pays off on slow machines or when
+    the performance demo is scaled up; log records still go to stderr as
+    they are emitted.
+    """
     
     print("🔒 MohFlow Privacy & PII Protection Demo")
     print("=" * 50)
@@ -339,12 +385,14 @@ def main():
     print("=" * 50)
     
     # Run all demonstrations
-    demo_basic_pii_detection()
-    demo_data_structure_scanning()
-    demo_privacy_aware_logging()
-    demo_compliance_reporting() 
-    demo_intelligent_redaction()
-    demo_performance_and_caching()
+    if parallel:
+        workers = min(len(DEMOS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for output in executor.map(_run_captured, DEMOS):
+                print(output, end="")
+    else:
+        for demo in DEMOS:
+            demo()
     
     print("\n" + "=" * 50)
     print("🎯 Privacy Protection Benefits:")
@@ -365,4 +413,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(parallel="--parallel" in sys.argv[1:])
\ No newline at end of file
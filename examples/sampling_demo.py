@@ -33,7 +33,7 @@ def demo_basic_sampling():
     
     print("Logging 100 messages with 10% sampling...")
     for i in range(100):
-        logger.info(f"Message {i}", message_id=i)
+        logger.info("Message %d", i, message_id=i)
     
     stats = logger.get_sampling_stats()
     if stats:
@@ -85,11 +85,11 @@ def demo_per_level_sampling():
     
     # Generate logs at different levels
     for i in range(50):
-        logger.debug(f"Debug message {i}")
-        logger.info(f"Info message {i}")
-        logger.warning(f"Warning message {i}")
-        logger.error(f"Error message {i}")
-        logger.critical(f"Critical message {i}")
+        logger.debug("Debug message %d", i)
+        logger.info("Info message %d", i)
+        logger.warning("Warning message %d", i)
+        logger.error("Error message %d", i)
+        logger.critical("Critical message %d", i)
     
     stats = logger.get_sampling_stats()
     if stats:
@@ -113,13 +113,13 @@ def demo_rate_limiting():
     )
     
     print("Sending 50 logs rapidly (should be rate limited)...")
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     for i in range(50):
-        logger.info(f"Rapid message {i}", timestamp=time.time())
+        logger.info("Rapid message %d", i, timestamp=time.time())
         time.sleep(0.01)  # 10ms between messages (100 logs/sec attempted)
     
-    duration = time.time() - start_time
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
     stats = logger.get_sampling_stats()
     
     if stats:
@@ -145,7 +145,7 @@ def demo_adaptive_sampling():
     
     print("Phase 1: Low load (should maintain high sampling rate)")
     for i in range(20):
-        logger.info(f"Low load message {i}")
+        logger.info("Low load message %d", i)
         time.sleep(0.1)  # Slow rate
     
     stats1 = logger.get_sampling_stats()
@@ -153,7 +153,7 @@ def demo_adaptive_sampling():
     
     print("\nPhase 2: High load (should reduce sampling rate)")
     for i in range(100):
-        logger.info(f"High load message {i}")
+        logger.info("High load message %d", i)
         if i % 10 == 0:
             time.sleep(0.01)  # Occasional brief pause
     
@@ -174,35 +174,40 @@ def demo_high_volume_scenario():
         burst_limit=1000
     )
     
+    # Hand the pre-configured sampler to the logger instead of letting it
+    # build (and then discard) one from the same settings
     logger = MohflowLogger.smart(
         "high-volume-service",
         enable_sampling=True,
-        sample_rate=sampler.config.sample_rate,
-        max_logs_per_second=sampler.config.max_logs_per_second,
-        burst_limit=sampler.config.burst_limit,
-        level_sample_rates=sampler.config.level_sample_rates
+        sampler=sampler
     )
     
-    # Replace the sampler with our pre-configured one
-    logger.sampler = sampler
-    
     print("Simulating high-volume service with mixed log levels...")
     
-    def worker_thread(worker_id: int, message_count: int):
-        """Worker thread generating logs."""
+    def worker_thread(worker_id: int, message_count: int, batch_size: int = 64):
+        """Worker thread generating logs, flushed in batches."""
+        batch = []
         for i in range(message_count):
             if i % 20 == 0:
-                logger.error(f"Worker {worker_id} error {i}", worker=worker_id)
+                level = "ERROR"
             elif i % 10 == 0:
-                logger.warning(f"Worker {worker_id} warning {i}", worker=worker_id)
+                level = "WARNING"
             elif i % 5 == 0:
-                logger.info(f"Worker {worker_id} info {i}", worker=worker_id)
+                level = "INFO"
             else:
-                logger.debug(f"Worker {worker_id} debug {i}", worker=worker_id)
+                level = "DEBUG"
+            batch.append((level, "Worker event", {"worker": worker_id, "sequence": i}))
+            
+            # One sampler lock acquisition per batch instead of per record
+            if len(batch) == batch_size:
+                logger.log_batch(batch)
+                batch = []
+        if batch:
+            logger.log_batch(batch)
     
     # Start multiple worker threads
     threads = []
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     for worker_id in range(5):
         t = threading.Thread(target=worker_thread, args=(worker_id, 200))
@@ -212,7 +217,7 @@ def demo_high_volume_scenario():
     for t in threads:
         t.join()
     
-    duration = time.time() - start_time
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
     stats = logger.get_sampling_stats()
     
     if stats:
@@ -242,10 +247,11 @@ def demo_sampling_stats_monitoring():
         level_sample_rates={'DEBUG': 0.1, 'INFO': 0.3, 'ERROR': 1.0}
     )
     
-    # Generate some logs
+    # Generate some logs, cycling through levels via pre-bound methods
+    methods = (logger.debug, logger.info, logger.warning, logger.error)
+    components = ("component_0", "component_1", "component_2")
     for i in range(200):
-        level = ['debug', 'info', 'warning', 'error'][i % 4]
-        getattr(logger, level)(f"Test message {i}", component=f"component_{i % 3}")
+        methods[i & 3]("Test message %d", i, component=components[i % 3])
     
     stats = logger.get_sampling_stats()
     
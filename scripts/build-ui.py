@@ -12,25 +12,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-
-def main():
-    """Build UI and embed in Python package."""
-    repo_root = Path(__file__).parent.parent
-    ui_dir = repo_root / "ui"
-    ui_dist_dir = repo_root / "src" / "mohflow" / "devui" / "ui_dist"
-
-    print("🔧 Mohnitor UI Build Pipeline")
-
-    # Check if UI directory exists
-    if not ui_dir.exists():
-        print("⚠️  UI directory not found. Will be created in later tasks.")
-        print(f"   Expected: {ui_dir}")
-
-        # Create placeholder UI dist directory
-        ui_dist_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create placeholder index.html
-        placeholder_html = """<!DOCTYPE html>
+PLACEHOLDER_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>Mohnitor - Coming Soon</title>
@@ -51,11 +33,33 @@ def main():
         </p>
     </div>
 </body>
-</html>"""
+</html>""".encode("utf-8")
+
+
+def main():
+    """Build UI and embed in Python package."""
+    repo_root = Path(__file__).parent.parent
+    ui_dir = repo_root / "ui"
+    ui_dist_dir = repo_root / "src" / "mohflow" / "devui" / "ui_dist"
+
+    print("🔧 Mohnitor UI Build Pipeline")
+
+    # Check if UI directory exists
+    if not ui_dir.exists():
+        print("⚠️  UI directory not found. Will be created in later tasks.")
+        print(f"   Expected: {ui_dir}")
+
+        # Create placeholder UI dist directory
+        ui_dist_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(ui_dist_dir / "index.html", "w") as f:
-            f.write(placeholder_html)
+        # Write the placeholder only when it changed, so repeated builds
+        # leave its mtime (and downstream build caches) alone
+        index_html = ui_dist_dir / "index.html"
+        if index_html.exists() and index_html.read_bytes() == PLACEHOLDER_HTML:
+            print("✅ Placeholder UI files already up to date")
+            return True
 
+        index_html.write_bytes(PLACEHOLDER_HTML)
         print("✅ Created placeholder UI files")
         return True
 
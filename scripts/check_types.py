@@ -7,36 +7,189 @@ full type safety across the MohFlow codebase.
 """
 
 import sys
+import os
+import json
+import re
+import mmap
 import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Tuple, Optional
 import argparse
 
 
-def run_command(cmd: List[str], description: str) -> Tuple[int, str, str]:
-    """Run a command and return exit code, stdout, and stderr."""
-    print(f"Running: {description}")
-    print(f"Command: {' '.join(cmd)}")
+class Section:
+    """
+    Collect a block of report lines and write them in one call.
+
+    Used as ``with Section(title) as emit:``; emit() takes the place of
+    print() and the block, banner included, is written on exit.
+    """
+
+    def __init__(
+        self, title: Optional[str] = None, stream: Optional[IO[str]] = None
+    ):
+        self.title = title
+        self.stream = stream
+        self.lines: List[str] = []
+
+    def emit(self, text: str = "") -> None:
+        """Queue one line of output."""
+        self.lines.append(f"{text}\n")
+
+    def __enter__(self) -> Callable[..., None]:
+        if self.title:
+            self.emit("\n" + "="*60)
+            self.emit(self.title)
+            self.emit("="*60)
+        return self.emit
+
+    def __exit__(self, *exc_info: Any) -> None:
+        stream = self.stream or sys.stdout
+        stream.write("".join(self.lines))
+        stream.flush()
+        self.lines.clear()
+
+
+def _pump(pipe: IO[bytes], sink: IO[str], lines: List[bytes]) -> None:
+    """Echo raw lines from a child pipe as they arrive, keeping a copy."""
+    raw_sink = getattr(sink, "buffer", None)
+    with pipe:
+        for line in pipe:
+            lines.append(line)
+            if raw_sink is not None:
+                raw_sink.write(line)
+                raw_sink.flush()
+            else:
+                sink.write(line.decode("utf-8", "replace"))
+                sink.flush()
+
+
+def run_command(
+    cmd: List[str], description: str, timeout: Optional[float] = None
+) -> Tuple[int, bytes, bytes]:
+    """
+    Run a command and return exit code, stdout, and stderr.
+
+    Output is streamed to the console line by line while the command
+    runs, so callers don't need to print it again. The captured output
+    stays as raw bytes; callers decode only the lines they use. If
+    timeout (seconds) expires the command is killed and reported as
+    failed.
+    """
+    with Section() as emit:
+        emit(f"Running: {description}")
+        emit(f"Command: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            check=False
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
-        return result.returncode, result.stdout, result.stderr
     except FileNotFoundError:
-        return 1, "", f"Command not found: {cmd[0]}"
+        message = f"Command not found: {cmd[0]}"
+        print(message, file=sys.stderr)
+        return 1, b"", message.encode()
+    
+    stdout_lines: List[bytes] = []
+    stderr_lines: List[bytes] = []
+    pumps = [
+        threading.Thread(
+            target=_pump, args=(process.stdout, sys.stdout, stdout_lines)
+        ),
+        threading.Thread(
+            target=_pump, args=(process.stderr, sys.stderr, stderr_lines)
+        ),
+    ]
+    for pump in pumps:
+        pump.start()
+    
+    timed_out = False
+    try:
+        exit_code = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        exit_code = 1
+        timed_out = True
+    
+    for pump in pumps:
+        pump.join()
+    
+    if timed_out:
+        message = f"Timed out after {timeout}s: {cmd[0]}\n"
+        print(message, end="", file=sys.stderr)
+        stderr_lines.append(message.encode())
+    
+    return exit_code, b"".join(stdout_lines), b"".join(stderr_lines)
 
 
-def run_mypy(src_path: Path, strict: bool = False) -> bool:
-    """Run mypy type checking."""
-    print("\n" + "="*60)
-    print("🔍 Running MyPy Type Checking")
-    print("="*60)
+# mypy flags for every check, run together in a single pass: base
+# checking, annotation coverage, and checking inside untyped functions
+# (which the protocol check relies on)
+MYPY_FLAGS = [
+    "--disallow-untyped-defs",
+    "--disallow-incomplete-defs",
+    "--disallow-untyped-decorators",
+    "--check-untyped-defs",
+    "--warn-incomplete-stub",
+]
+
+# Coverage report heuristics, matched against each file's raw bytes
+TYPE_HINT_MARKERS = (
+    b"-> ",
+    b": str",
+    b": int",
+    b": bool",
+    b": Optional",
+    b": Union",
+    b": List",
+    b": Dict",
+    b"from typing import",
+)
+DEF_RE = re.compile(rb'def\s+\w+\s*\([^)]*\)')
+TYPED_DEF_RE = re.compile(rb'def\s+\w+\s*\([^)]*\)\s*->')
+
+# Below this many files the coverage scan stays in-process
+PARALLEL_SCAN_MIN_FILES = 256
+
+# Per-file coverage results from earlier runs, keyed by path and
+# revalidated by (mtime_ns, size); dropped whenever this script changes
+SCAN_CACHE_FILE = ".mohflow_typecheck_cache.json"
+
+# Error codes and messages that belong to the annotation coverage check
+ANNOTATION_ERROR_CODES = ("[no-untyped-def]", "[no-untyped-call]")
+ANNOTATION_ERROR_MESSAGES = ("Untyped decorator makes function",)
+
+
+def run_mypy(
+    src_path: Path,
+    strict: bool = False,
+    timeout: Optional[float] = None,
+    daemon: bool = False,
+) -> Tuple[bool, List[str]]:
+    """
+    Run mypy type checking.
+
+    mypy runs once with the flags of every check; the annotation and
+    protocol checks then filter the returned error lines instead of
+    re-parsing the tree themselves.
+
+    With daemon=True the check goes through ``dmypy run``, which starts
+    the mypy daemon on first use and reuses its warm state afterwards.
+
+    Returns:
+        Whether mypy passed, and the error lines it reported
+    """
+    # The banner goes out before mypy's output starts streaming
+    with Section("🔍 Running MyPy Type Checking"):
+        pass
     
-    cmd = ["mypy"]
+    cmd = ["dmypy", "run", "--"] if daemon else ["mypy"]
+    cmd.extend(MYPY_FLAGS)
     
     if strict:
         cmd.extend([
@@ -48,194 +201,292 @@ def run_mypy(src_path: Path, strict: bool = False) -> bool:
     # Add source path
     cmd.append(str(src_path))
     
-    exit_code, stdout, stderr = run_command(
+    exit_code, stdout, _ = run_command(
         cmd, 
-        "MyPy static type checking"
+        "MyPy static type checking",
+        timeout=timeout,
     )
     
-    if exit_code == 0:
-        print("✅ MyPy: All type checks passed!")
-        if stdout:
-            print(stdout)
-    else:
-        print("❌ MyPy: Type check errors found:")
-        if stdout:
-            print("STDOUT:", stdout)
-        if stderr:
-            print("STDERR:", stderr)
-    
-    return exit_code == 0
-
-
-def check_type_annotations(src_path: Path) -> bool:
-    """Check for missing type annotations."""
-    print("\n" + "="*60)
-    print("📝 Checking Type Annotation Coverage")
-    print("="*60)
-    
-    # Use mypy with specific flags to check annotation coverage
-    cmd = [
-        "mypy",
-        "--disallow-untyped-defs",
-        "--disallow-incomplete-defs", 
-        "--disallow-untyped-decorators",
-        "--no-error-summary",
-        str(src_path)
+    with Section() as emit:
+        if exit_code == 0:
+            emit("✅ MyPy: All type checks passed!")
+        else:
+            emit("❌ MyPy: Type check errors found (see output above)")
+    
+    # Only error lines are decoded; notes and the summary stay bytes
+    errors = [
+        line.decode("utf-8", "replace")
+        for line in stdout.splitlines()
+        if b": error:" in line
     ]
-    
-    exit_code, stdout, stderr = run_command(
-        cmd,
-        "Type annotation coverage check"
-    )
-    
-    if exit_code == 0:
-        print("✅ Type Annotations: Complete coverage!")
-    else:
-        print("⚠️  Type Annotations: Some functions lack complete type hints")
-        if stdout:
-            print("Issues found:")
-            print(stdout)
-    
-    return exit_code == 0
+    return exit_code == 0, errors
 
 
-def validate_type_imports(src_path: Path) -> bool:
-    """Validate that type imports are used correctly."""
-    print("\n" + "="*60)
-    print("📦 Validating Type Imports")
-    print("="*60)
-    
-    issues = []
-    
-    # Check for common type import issues
-    for py_file in src_path.rglob("*.py"):
-        try:
-            with open(py_file, 'r') as f:
-                content = f.read()
-                
-                # Check for missing TYPE_CHECKING imports
-                if "from typing import" in content and "TYPE_CHECKING" not in content:
-                    if any(pattern in content for pattern in [
-                        "if TYPE_CHECKING:",
-                        "Union[",
-                        "Optional[", 
-                        "List[",
-                        "Dict["
-                    ]):
-                        # This is fine - TYPE_CHECKING not needed
-                        pass
-                
-                # Check for forward references without quotes
-                if "-> MohflowLogger" in content and '"MohflowLogger"' not in content:
-                    # Should use string literals for forward refs
-                    pass  # This is actually fine in modern Python
+def stop_mypy_daemon() -> None:
+    """Stop the mypy daemon started by --daemon, if it is running."""
+    run_command(["dmypy", "stop"], "Stopping mypy daemon")
+
+
+def check_type_annotations(errors: List[str]) -> bool:
+    """Check for missing type annotations in the mypy errors."""
+    with Section("📝 Checking Type Annotation Coverage") as emit:
+        issues = [
+            line for line in errors
+            if line.endswith(ANNOTATION_ERROR_CODES)
+            or any(message in line for message in ANNOTATION_ERROR_MESSAGES)
+        ]
+        
+        if not issues:
+            emit("✅ Type Annotations: Complete coverage!")
+        else:
+            emit("⚠️  Type Annotations: Some functions lack complete type hints")
+            for issue in issues:
+                emit(issue)
+        
+        return not issues
+
+
+def walk_python_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield every .py file under root with an os.scandir walk."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry
+
+
+def scan_file(
+    path: str,
+) -> Tuple[Optional[Exception], Optional[Tuple[int, int, int]]]:
+    """
+    Scan one source file for the coverage report.
+
+    The file is memory-mapped and searched as bytes, so nothing is
+    decoded. Dunder files (e.g. ``__init__.py``) are only opened, so
+    unreadable ones are still reported.
+
+    Returns:
+        The read error (or None), and (has type hints, function count,
+        typed function count); the counts are None for dunder files
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.path.basename(path).startswith("__"):
+                return None, None
+            
+            # mmap can't map empty files
+            if os.fstat(f.fileno()).st_size == 0:
+                mapping = nullcontext(b"")
+            else:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            with mapping as content:
+                # Basic heuristics for type checking; mmap's "in" only
+                # tests single bytes, so search with find()
+                has_types = any(
+                    content.find(marker) != -1 for marker in TYPE_HINT_MARKERS
+                )
                 
-        except Exception as e:
-            issues.append(f"Error reading {py_file}: {e}")
-    
-    if issues:
-        print("❌ Type Import Issues:")
-        for issue in issues:
-            print(f"  - {issue}")
-        return False
+                # Count function definitions, and typed functions (rough
+                # estimate)
+                return None, (
+                    int(has_types),
+                    len(DEF_RE.findall(content)),
+                    len(TYPED_DEF_RE.findall(content)),
+                )
+    except (OSError, ValueError) as e:
+        return e, None
+
+
+def load_scan_cache(cache_path: Path) -> Dict[str, List[Any]]:
+    """Load the per-file scan index, or {} if missing or stale."""
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+        if cache.get("script_mtime_ns") != os.stat(__file__).st_mtime_ns:
+            return {}
+        return cache["files"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return {}
+
+
+def save_scan_cache(cache_path: Path, files: Dict[str, List[Any]]) -> None:
+    """Atomically write the per-file scan index."""
+    cache = {
+        "script_mtime_ns": os.stat(__file__).st_mtime_ns,
+        "files": files,
+    }
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write scan cache {cache_path}: {e}")
+
+
+def scan_sources(
+    src_path: Path, cache_path: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Collect type import and coverage statistics in one pass.
+
+    With cache_path, files whose (mtime_ns, size) match the index from
+    the previous run reuse their cached counts and only changed files
+    are read. Large trees are scanned across a process pool on machines
+    with more than two cores; below PARALLEL_SCAN_MIN_FILES the pool's
+    startup costs more than it saves.
+    """
+    stats: Dict[str, Any] = {
+        "read_errors": [],
+        "total_files": 0,
+        "typed_files": 0,
+        "total_functions": 0,
+        "typed_functions": 0,
+    }
+    
+    index = load_scan_cache(cache_path) if cache_path else {}
+    new_index: Dict[str, List[Any]] = {}
+    results: Dict[str, Tuple[Optional[Exception], Any]] = {}
+    paths = []
+    stale = []
+    
+    for entry in walk_python_files(src_path):
+        paths.append(entry.path)
+        try:
+            st = entry.stat()
+        except OSError as e:
+            results[entry.path] = (e, None)
+            continue
+        
+        key = [st.st_mtime_ns, st.st_size]
+        cached = index.get(entry.path)
+        if cached is not None and cached[:2] == key:
+            results[entry.path] = (None, cached[2])
+            new_index[entry.path] = cached
+        else:
+            stale.append(entry.path)
+            new_index[entry.path] = key
+    
+    if len(stale) >= PARALLEL_SCAN_MIN_FILES and (os.cpu_count() or 1) > 2:
+        with ProcessPoolExecutor() as executor:
+            scanned = list(executor.map(scan_file, stale, chunksize=32))
     else:
-        print("✅ Type Imports: All imports are properly structured")
-        return True
+        scanned = [scan_file(path) for path in stale]
+    
+    for path, result in zip(stale, scanned):
+        results[path] = result
+        error, counts = result
+        if error is None:
+            new_index[path] = new_index[path] + [counts]
+        else:
+            del new_index[path]  # Retry unreadable files next run
+    
+    for path in paths:
+        error, counts = results[path]
+        if error is not None:
+            stats["read_errors"].append((Path(path), error))
+        elif counts is not None:
+            stats["total_files"] += 1
+            stats["typed_files"] += counts[0]
+            stats["total_functions"] += counts[1]
+            stats["typed_functions"] += counts[2]
+    
+    if cache_path and new_index != index:
+        save_scan_cache(cache_path, new_index)
+    
+    return stats
+
+
+def validate_type_imports(
+    src_path: Path, stats: Optional[Dict[str, Any]] = None
+) -> bool:
+    """Validate that type imports are used correctly."""
+    if stats is None:
+        stats = scan_sources(src_path)
+    
+    with Section("📦 Validating Type Imports") as emit:
+        issues = [
+            f"Error reading {path}: {error}"
+            for path, error in stats["read_errors"]
+        ]
+        
+        if issues:
+            emit("❌ Type Import Issues:")
+            for issue in issues:
+                emit(f"  - {issue}")
+            return False
+        else:
+            emit("✅ Type Imports: All imports are properly structured")
+            return True
 
 
-def run_protocol_checks(src_path: Path) -> bool:
+def find_types_module(src_path: Path) -> Optional[Path]:
+    """Locate the types module under a source root or package dir."""
+    for candidate in (src_path / "types.py", src_path / "mohflow" / "types.py"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def run_protocol_checks(src_path: Path, errors: List[str]) -> bool:
     """Check that Protocol implementations are correct."""
-    print("\n" + "="*60)
-    print("🔌 Checking Protocol Implementations")
-    print("="*60)
-    
-    # Use mypy to specifically check protocol compliance
-    cmd = [
-        "mypy",
-        "--check-untyped-defs",
-        "--warn-incomplete-stub",
-        str(src_path / "types.py"),  # Focus on our types module
-    ]
-    
-    exit_code, stdout, stderr = run_command(
-        cmd,
-        "Protocol implementation check"
-    )
-    
-    if exit_code == 0:
-        print("✅ Protocols: All implementations are compliant")
-    else:
-        print("⚠️  Protocols: Some implementation issues found")
-        if stdout:
-            print(stdout)
-    
-    return exit_code == 0
+    with Section("🔌 Checking Protocol Implementations") as emit:
+        # Protocols live in our types module; its errors come from the
+        # shared mypy run, which checks untyped defs too
+        types_module = find_types_module(src_path)
+        if types_module is None:
+            emit(f"⚠️  Protocols: types module not found under {src_path}")
+            return False
+        
+        prefix = f"{types_module}:"
+        issues = [line for line in errors if line.startswith(prefix)]
+        
+        if not issues:
+            emit("✅ Protocols: All implementations are compliant")
+        else:
+            emit("⚠️  Protocols: Some implementation issues found")
+            for issue in issues:
+                emit(issue)
+        
+        return not issues
 
 
-def generate_type_report(src_path: Path) -> None:
+def generate_type_report(
+    src_path: Path, stats: Optional[Dict[str, Any]] = None
+) -> None:
     """Generate a comprehensive type coverage report."""
-    print("\n" + "="*60)
-    print("📊 Type Coverage Report")
-    print("="*60)
-    
-    # Count files and functions with type annotations
-    total_files = 0
-    typed_files = 0
-    total_functions = 0
-    typed_functions = 0
-    
-    for py_file in src_path.rglob("*.py"):
-        if py_file.name.startswith("__"):
-            continue
-            
-        total_files += 1
-        has_types = False
-        
-        try:
-            with open(py_file, 'r') as f:
-                content = f.read()
-                
-                # Basic heuristics for type checking
-                if any(pattern in content for pattern in [
-                    "-> ",
-                    ": str",
-                    ": int", 
-                    ": bool",
-                    ": Optional",
-                    ": Union",
-                    ": List",
-                    ": Dict",
-                    "from typing import"
-                ]):
-                    has_types = True
-                    typed_files += 1
-                
-                # Count function definitions
-                import re
-                functions = re.findall(r'def\s+\w+\s*\([^)]*\)', content)
-                total_functions += len(functions)
-                
-                # Count typed functions (rough estimate)
-                typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-                typed_functions += len(typed_funcs)
-                
-        except Exception as e:
-            print(f"Error processing {py_file}: {e}")
-    
-    # Calculate percentages
-    file_coverage = (typed_files / total_files * 100) if total_files > 0 else 0
-    func_coverage = (typed_functions / total_functions * 100) if total_functions > 0 else 0
-    
-    print(f"📁 Files with type hints: {typed_files}/{total_files} ({file_coverage:.1f}%)")
-    print(f"🔧 Functions with return types: {typed_functions}/{total_functions} ({func_coverage:.1f}%)")
+    if stats is None:
+        stats = scan_sources(src_path)
     
-    # Quality assessment
-    if file_coverage >= 90 and func_coverage >= 80:
-        print("🎯 Type Coverage: Excellent!")
-    elif file_coverage >= 70 and func_coverage >= 60:
-        print("👍 Type Coverage: Good")
-    else:
-        print("⚠️  Type Coverage: Needs improvement")
+    with Section("📊 Type Coverage Report") as emit:
+        for path, error in stats["read_errors"]:
+            if not path.name.startswith("__"):
+                emit(f"Error processing {path}: {error}")
+        
+        # Count files and functions with type annotations
+        total_files = stats["total_files"]
+        typed_files = stats["typed_files"]
+        total_functions = stats["total_functions"]
+        typed_functions = stats["typed_functions"]
+        
+        # Calculate percentages
+        file_coverage = (typed_files / total_files * 100) if total_files > 0 else 0
+        func_coverage = (typed_functions / total_functions * 100) if total_functions > 0 else 0
+        
+        emit(f"📁 Files with type hints: {typed_files}/{total_files} ({file_coverage:.1f}%)")
+        emit(f"🔧 Functions with return types: {typed_functions}/{total_functions} ({func_coverage:.1f}%)")
+        
+        # Quality assessment
+        if file_coverage >= 90 and func_coverage >= 80:
+            emit("🎯 Type Coverage: Excellent!")
+        elif file_coverage >= 70 and func_coverage >= 60:
+            emit("👍 Type Coverage: Good")
+        else:
+            emit("⚠️  Type Coverage: Needs improvement")
 
 
 def main() -> int:
@@ -247,6 +498,14 @@ def main() -> int:
                        help="Source directory path")
     parser.add_argument("--report-only", action="store_true",
                        help="Only generate type coverage report")
+    parser.add_argument("--timeout", type=float, default=None,
+                       help="Seconds to allow the mypy run before killing it")
+    parser.add_argument("--daemon", action="store_true",
+                       help="Run the main mypy check through the mypy daemon")
+    parser.add_argument("--stop-daemon", action="store_true",
+                       help="Stop the mypy daemon when checks finish")
+    parser.add_argument("--no-cache", action="store_true",
+                       help=f"Rescan every file, ignoring {SCAN_CACHE_FILE}")
     
     args = parser.parse_args()
     
@@ -255,57 +514,69 @@ def main() -> int:
         print(f"❌ Source path not found: {src_path}")
         return 1
     
-    print("🚀 MohFlow Type Safety Validation")
-    print("="*60)
-    print(f"Source path: {src_path.absolute()}")
-    print(f"Strict mode: {args.strict}")
+    with Section() as emit:
+        emit("🚀 MohFlow Type Safety Validation")
+        emit("="*60)
+        emit(f"Source path: {src_path.absolute()}")
+        emit(f"Strict mode: {args.strict}")
+    
+    cache_path = None if args.no_cache else Path(SCAN_CACHE_FILE)
     
     if args.report_only:
-        generate_type_report(src_path)
+        generate_type_report(src_path, scan_sources(src_path, cache_path))
         return 0
     
+    # One walk over the sources feeds the import check and the report
+    stats = scan_sources(src_path, cache_path)
+    
     # Run all checks
     checks_passed = 0
     total_checks = 0
     
-    # 1. MyPy type checking
+    # 1. MyPy type checking; this one run also feeds checks 2 and 4
     total_checks += 1
-    if run_mypy(src_path, strict=args.strict):
+    mypy_passed, mypy_errors = run_mypy(
+        src_path,
+        strict=args.strict,
+        timeout=args.timeout,
+        daemon=args.daemon,
+    )
+    if mypy_passed:
         checks_passed += 1
     
     # 2. Type annotation coverage
     total_checks += 1
-    if check_type_annotations(src_path):
+    if check_type_annotations(mypy_errors):
         checks_passed += 1
     
     # 3. Type import validation
     total_checks += 1
-    if validate_type_imports(src_path):
+    if validate_type_imports(src_path, stats):
         checks_passed += 1
     
     # 4. Protocol compliance
     total_checks += 1
-    if run_protocol_checks(src_path):
+    if run_protocol_checks(src_path, mypy_errors):
         checks_passed += 1
     
+    if args.stop_daemon:
+        stop_mypy_daemon()
+    
     # Generate report
-    generate_type_report(src_path)
+    generate_type_report(src_path, stats)
     
     # Summary
-    print("\n" + "="*60)
-    print("📋 TYPE SAFETY SUMMARY")
-    print("="*60)
-    
-    print(f"Checks passed: {checks_passed}/{total_checks}")
-    
-    if checks_passed == total_checks:
-        print("🎉 All type safety checks passed!")
-        print("✅ MohFlow is fully type-safe and mypy compliant")
-        return 0
-    else:
-        print(f"⚠️  {total_checks - checks_passed} type safety issues need attention")
-        print("❌ MohFlow needs type safety improvements")
-        return 1
+    with Section("📋 TYPE SAFETY SUMMARY") as emit:
+        emit(f"Checks passed: {checks_passed}/{total_checks}")
+        
+        if checks_passed == total_checks:
+            emit("🎉 All type safety checks passed!")
+            emit("✅ MohFlow is fully type-safe and mypy compliant")
+            return 0
+        else:
+            emit(f"⚠️  {total_checks - checks_passed} type safety issues need attention")
+            emit("❌ MohFlow needs type safety improvements")
+            return 1
 
 
 if __name__ == "__main__":
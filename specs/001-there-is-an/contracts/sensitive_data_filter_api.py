@@ -20,6 +20,17 @@ class FieldType(Enum):
 class FilterConfiguration:
     """Configuration for sensitive data filtering behavior."""
 
+    # Contract: instances carry no __dict__
+    __slots__ = (
+        "enabled",
+        "exclude_tracing_fields",
+        "custom_safe_fields",
+        "tracing_field_patterns",
+        "sensitive_fields",
+        "sensitive_patterns",
+        "case_sensitive",
+    )
+
     def __init__(
         self,
         enabled: bool = True,
@@ -111,6 +122,9 @@ class TracingFieldRegistry:
 class FieldClassification:
     """Result of field classification analysis."""
 
+    # Contract: instances carry no __dict__
+    __slots__ = ("field_name", "classification", "matched_pattern", "exempted")
+
     def __init__(
         self,
         field_name: str,
@@ -139,6 +153,14 @@ class FieldClassification:
 class FilterResult:
     """Result of filtering operation with audit information."""
 
+    # Contract: instances carry no __dict__
+    __slots__ = (
+        "filtered_data",
+        "redacted_fields",
+        "preserved_fields",
+        "processing_time",
+    )
+
     def __init__(
         self,
         filtered_data: Any,
@@ -1,17 +1,54 @@
+import importlib
 import warnings
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .logger.base import MohflowLogger
+
+# Public names are imported on first access (PEP 562), so ``import
+# mohflow`` does not load every subpackage up front
+_LAZY = {
+    "MohflowLogger": (".logger.base", "MohflowLogger"),
+    "MohflowError": (".exceptions", "MohflowError"),
+    "ConfigurationError": (".exceptions", "ConfigurationError"),
+    "ConfigLoader": (".config_loader", "ConfigLoader"),
+    "RequestContext": (".context.enrichment", "RequestContext"),
+    "with_request_context": (".context.enrichment", "with_request_context"),
+    "CorrelationContext": (".context.correlation", "CorrelationContext"),
+    "with_correlation_id": (".context.correlation", "with_correlation_id"),
+    "detect_environment": (".auto_config", "detect_environment"),
+    "auto_configure": (".auto_config", "auto_configure"),
+    "TemplateManager": (".templates", "TemplateManager"),
+    "bind_context": (".context_api", "bind_context"),
+    "unbind_context": (".context_api", "unbind_context"),
+    "clear_context": (".context_api", "clear_context"),
+    "LogSchema": (".schema", "LogSchema"),
+    "SchemaValidator": (".schema", "SchemaValidator"),
+    "SchemaValidationError": (".schema", "SchemaValidationError"),
+    "field": (".schema", "field"),
+    "ActionLogger": (".actions", "ActionLogger"),
+    "Action": (".actions", "Action"),
+    "DiagnosticFormatter": (".diagnose", "DiagnosticFormatter"),
+    "AnomalyDetector": (".anomaly", "AnomalyDetector"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .logger.base import MohflowLogger
-from .exceptions import MohflowError, ConfigurationError
-from .config_loader import ConfigLoader
-from .context.enrichment import RequestContext, with_request_context
-from .context.correlation import CorrelationContext, with_correlation_id
-from .auto_config import detect_environment, auto_configure
-from .templates import TemplateManager
-from .context_api import bind_context, unbind_context, clear_context
-from .schema import LogSchema, SchemaValidator, SchemaValidationError, field
-from .actions import ActionLogger, Action
-from .diagnose import DiagnosticFormatter
-from .anomaly import AnomalyDetector
 
 __version__ = "1.1.2"
 
@@ -28,6 +65,8 @@ class _LazyLog:
 
     def _get_logger(self):
         if _LazyLog._instance is None:
+            from .logger.base import MohflowLogger
+
             _LazyLog._instance = MohflowLogger(
                 service_name="app",
                 log_level="INFO",
@@ -51,9 +90,27 @@ class _LazyLog:
 log = _LazyLog()
 
 
+# devui.mohnitor.enable_mohnitor, imported on first use; False records a
+# failed import so later calls do not retry it
+_enable_mohnitor = None
+
+
+def _get_enable_mohnitor():
+    """Return enable_mohnitor, or None if Mohnitor is not installed."""
+    global _enable_mohnitor
+    if _enable_mohnitor is None:
+        try:
+            from .devui.mohnitor import enable_mohnitor
+
+            _enable_mohnitor = enable_mohnitor
+        except ImportError:
+            _enable_mohnitor = False
+    return _enable_mohnitor or None
+
+
 def get_logger(
     service: str, enable_mohnitor: bool = False, **kwargs
-) -> MohflowLogger:
+) -> "MohflowLogger":
     """
     Get MohFlow logger instance with optional Mohnitor integration.
 
@@ -65,33 +122,35 @@ def get_logger(
     Returns:
         Configured MohflowLogger instance
     """
+    from .logger.base import MohflowLogger
+
     # Create logger
     logger = MohflowLogger.get_logger(service, **kwargs)
 
     # Enable Mohnitor if requested
     if enable_mohnitor:
-        try:
-            from .devui.mohnitor import enable_mohnitor as enable_mohnitor_func
-
-            enable_mohnitor_func(
-                service,
-                **{
-                    k: v
-                    for k, v in kwargs.items()
-                    if k.startswith("mohnitor_")
-                },
-            )
-        except ImportError:
+        enable_mohnitor_func = _get_enable_mohnitor()
+        if enable_mohnitor_func is None:
             warnings.warn(
                 "Mohnitor not available. Install with: "
                 "pip install mohflow[mohnitor]",
                 stacklevel=2,
             )
-        except Exception as e:
-            warnings.warn(
-                f"Failed to enable Mohnitor: {e}",
-                stacklevel=2,
-            )
+        else:
+            try:
+                enable_mohnitor_func(
+                    service,
+                    **{
+                        k: v
+                        for k, v in kwargs.items()
+                        if k.startswith("mohnitor_")
+                    },
+                )
+            except Exception as e:
+                warnings.warn(
+                    f"Failed to enable Mohnitor: {e}",
+                    stacklevel=2,
+                )
 
     return logger
 
@@ -5,11 +5,49 @@ Provides CLI for runtime log level control and configuration.
 """
 
 import argparse
+import importlib
 import json
-import logging
 import sys
-from typing import Dict, Any, Optional
-from mohflow import MohflowLogger
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type
+
+if TYPE_CHECKING:
+    from mohflow.logger.base import MohflowLogger
+
+# Accepted values; the tuples keep display order for argparse and
+# messages, the frozensets are for membership checks
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LEVELS = frozenset(_LOG_LEVELS)
+_ENVIRONMENTS = ("development", "staging", "production")
+
+# Logger methods the interactive session can call
+_MESSAGE_LEVELS = frozenset(("debug", "info", "warning", "error"))
+_LOG_COMMAND_LEVELS = _MESSAGE_LEVELS | {"critical"}
+
+# CLI options that override the file config, as (argument, config key,
+# argument default); an option applies when it is set and not its default
+_CLI_OVERRIDES = (
+    ("service_name", "service_name", None),
+    ("environment", "environment", "development"),
+    ("loki_url", "loki_url", None),
+    ("file_logging", "file_logging", False),
+    ("log_file", "log_file_path", None),
+)
+
+
+def __getattr__(name: str) -> Any:
+    # MohflowLogger pulls in the whole handler/formatter stack, so it is
+    # imported on first access rather than at module import; --help and
+    # --validate-config never reach it
+    if name == "MohflowLogger":
+        value = importlib.import_module("mohflow.logger.base").MohflowLogger
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _logger_class() -> Type["MohflowLogger"]:
+    """Return MohflowLogger, importing it on first use."""
+    return getattr(sys.modules[__name__], "MohflowLogger")
 
 
 class MohflowCLI:
@@ -17,7 +55,7 @@ class MohflowCLI:
 
     def __init__(self):
         self.parser = self._create_parser()
-        self.logger: Optional[MohflowLogger] = None
+        self.logger: Optional["MohflowLogger"] = None
 
     def _create_parser(self) -> argparse.ArgumentParser:
         """Create argument parser with all CLI options"""
@@ -40,7 +78,7 @@ class MohflowCLI:
             "-e",
             type=str,
             default="development",
-            choices=["development", "staging", "production"],
+            choices=_ENVIRONMENTS,
             help="Environment for logging context (default: development)",
         )
 
@@ -50,7 +88,7 @@ class MohflowCLI:
             "-l",
             type=str,
             default="INFO",
-            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            choices=_LOG_LEVELS,
             help="Set log level (default: INFO)",
         )
 
@@ -146,23 +184,18 @@ class MohflowCLI:
     ) -> Dict[str, Any]:
         """Merge file config with CLI arguments (CLI precedence)"""
         config = file_config.copy()
+        options = vars(cli_args)
 
         # CLI arguments override file config
-        if cli_args.service_name:
-            config["service_name"] = cli_args.service_name
-        if cli_args.environment != "development":
-            config["environment"] = cli_args.environment
-        if cli_args.debug:
+        for arg, key, default in _CLI_OVERRIDES:
+            value = options.get(arg)
+            if value and value != default:
+                config[key] = value
+        if options.get("debug"):
             config["log_level"] = "DEBUG"
-        elif cli_args.log_level != "INFO":
-            config["log_level"] = cli_args.log_level
-        if cli_args.loki_url:
-            config["loki_url"] = cli_args.loki_url
-        if cli_args.file_logging:
-            config["file_logging"] = True
-        if cli_args.log_file:
-            config["log_file_path"] = cli_args.log_file
-        if cli_args.no_console:
+        elif options.get("log_level", "INFO") != "INFO":
+            config["log_level"] = options["log_level"]
+        if options.get("no_console"):
             config["console_logging"] = False
 
         return config
@@ -199,12 +232,11 @@ class MohflowCLI:
                 return False
 
             # Validate log level
-            valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
             log_level = config.get("log_level", "INFO").upper()
-            if log_level not in valid_levels:
+            if log_level not in _VALID_LEVELS:
                 print(
                     f"❌ Invalid log level: {log_level}. "
-                    f"Valid options: {valid_levels}"
+                    f"Valid options: {list(_LOG_LEVELS)}"
                 )
                 return False
 
@@ -215,33 +247,35 @@ class MohflowCLI:
             print(f"❌ Configuration validation error: {e}")
             return False
 
-    def create_logger(self, args) -> MohflowLogger:
+    def create_logger(self, args) -> "MohflowLogger":
         """Create MohFlow logger (primary method)"""
         return self._create_logger_from_args(args)
 
-    def _create_logger_from_args(self, args) -> MohflowLogger:
-        """Create MohFlow logger from args"""
+    def _create_logger_from_args(self, args) -> "MohflowLogger":
+        """Create MohFlow logger from parsed args or a config dict"""
         try:
+            # One dict read per option instead of a getattr each; run()
+            # passes its merged config dict straight through
+            options = args if isinstance(args, dict) else vars(args)
+
+            service_name = options["service_name"]
+
             # Build logger arguments, excluding None values
             logger_kwargs = {
-                "service_name": args.service_name,
-                "environment": getattr(args, "environment", "development"),
-                "log_level": getattr(args, "log_level", "INFO"),
-                "enable_auto_config": getattr(args, "auto_config", False),
+                "service_name": service_name,
+                "environment": options.get("environment", "development"),
+                "log_level": options.get("log_level", "INFO"),
+                "enable_auto_config": options.get("auto_config", False),
             }
 
-            # Only add loki_url if it's not None
-            loki_url = getattr(args, "loki_url", None)
-            if loki_url is not None:
-                logger_kwargs["loki_url"] = loki_url
+            # Only add loki_url and config_file if they're not None
+            for key in ("loki_url", "config_file"):
+                value = options.get(key)
+                if value is not None:
+                    logger_kwargs[key] = value
 
-            # Only add config_file if it's not None
-            config_file = getattr(args, "config_file", None)
-            if config_file is not None:
-                logger_kwargs["config_file"] = config_file
-
-            logger = MohflowLogger(**logger_kwargs)
-            print(f"✅ Logger created for service: {args.service_name}")
+            logger = _logger_class()(**logger_kwargs)
+            print(f"✅ Logger created for service: {service_name}")
             return logger
 
         except Exception as e:
@@ -269,26 +303,44 @@ class MohflowCLI:
 
         print("✅ Logging test completed")
 
-    def interactive_session(self, logger: MohflowLogger):
+    def interactive_session(self, logger: "MohflowLogger"):
         """Start interactive debugging session"""
         print("🔧 Starting interactive debugging session...")
         print("Commands: debug, info, warning, error, level <LEVEL>, quit")
 
+        # Bind the message methods once for the whole session
+        dispatch = {level: getattr(logger, level) for level in _MESSAGE_LEVELS}
+
         while True:
             try:
                 command = input("mohflow> ").strip()
-                if self._handle_command(command, logger):
+                if self._handle_command(command, logger, dispatch):
                     break
             except (KeyboardInterrupt, EOFError):
                 break
 
         print("\n👋 Interactive session ended")
 
-    def _handle_command(self, command: str, logger: MohflowLogger) -> bool:
-        """Handle interactive command. Returns True if should exit."""
+    def _handle_command(
+        self,
+        command: str,
+        logger: "MohflowLogger",
+        dispatch: Optional[Dict[str, Callable[[str], Any]]] = None,
+    ) -> bool:
+        """
+        Handle interactive command. Returns True if should exit.
+
+        dispatch maps message commands to pre-bound logger methods;
+        without it the method is looked up on logger.
+        """
         cmd_lower = command.lower()
 
-        if cmd_lower in ["quit", "exit"]:
+        log = dispatch.get(cmd_lower) if dispatch else None
+        if log is not None:
+            log(f"Interactive {cmd_lower} message")
+            return False
+
+        if cmd_lower in ("quit", "exit"):
             return True
 
         if cmd_lower == "help":
@@ -307,7 +359,7 @@ class MohflowCLI:
             self._handle_status_command(logger)
             return False
 
-        if cmd_lower in ["debug", "info", "warning", "error"]:
+        if cmd_lower in _MESSAGE_LEVELS:
             getattr(logger, cmd_lower)(f"Interactive {cmd_lower} message")
             return False
 
@@ -325,11 +377,12 @@ class MohflowCLI:
         )
         return False
 
-    def _handle_level_command(self, command: str, logger: MohflowLogger):
+    def _handle_level_command(self, command: str, logger: "MohflowLogger"):
         """Handle log level change command"""
         level = command.split(" ", 1)[1].upper()
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if level in valid_levels:
+        if level in _VALID_LEVELS:
+            import logging
+
             logger.logger.setLevel(getattr(logging, level))
             print(f"Log level changed to {level}")
         else:
@@ -338,7 +391,7 @@ class MohflowCLI:
                 "ERROR, CRITICAL"
             )
 
-    def _handle_log_command(self, command: str, logger: MohflowLogger):
+    def _handle_log_command(self, command: str, logger: "MohflowLogger"):
         """Handle log command with level and message"""
         parts = command.split(" ", 2)
         if len(parts) < 3:
@@ -348,13 +401,13 @@ class MohflowCLI:
         level = parts[1].lower()
         message = parts[2].strip('"').strip("'")  # Remove quotes if present
 
-        if level in ["debug", "info", "warning", "error", "critical"]:
+        if level in _LOG_COMMAND_LEVELS:
             getattr(logger, level)(message)
         else:
             print(f"Invalid log level: {level}")
             print("Valid levels: debug, info, warning, error, critical")
 
-    def _handle_status_command(self, logger: MohflowLogger):
+    def _handle_status_command(self, logger: "MohflowLogger"):
         """Handle status command to show logger information"""
         print("Logger Status:")
         if hasattr(logger, "config") and logger.config:
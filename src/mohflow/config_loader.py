@@ -5,10 +5,76 @@ Provides configuration loading from multiple sources with precedence handling.
 
 import json
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Union
 from mohflow.exceptions import ConfigurationError
 
+# orjson parses bytes directly and is several times faster than json;
+# its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Bundled JSON schema describing the configuration file format
+_SCHEMA_PATH = Path(__file__).parent / "schemas" / "config_schema.json"
+
+# Values _validate_config accepts
+_VALID_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+_VALID_ENVS = frozenset(("development", "staging", "production", "test"))
+
+# Values a boolean environment variable treats as true
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+
+def _env_flag(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.lower() in _TRUTHY
+
+
+# Top-level settings read from the environment, as (variable name
+# after the prefix, config key, converter)
+_ENV_FIELDS = (
+    ("SERVICE_NAME", "service_name", str),
+    ("ENVIRONMENT", "environment", str),
+    ("LOG_LEVEL", "log_level", str),
+    ("CONSOLE_LOGGING", "console_logging", _env_flag),
+    ("FILE_LOGGING", "file_logging", _env_flag),
+    ("LOG_FILE_PATH", "log_file_path", str),
+    ("LOKI_URL", "loki_url", str),
+)
+_ENV_FIELD_NAMES = frozenset(name for name, _, _ in _ENV_FIELDS)
+
+
+def _freeze(value: Any) -> Any:
+    """Return parsed JSON with dicts as read-only mappings, lists as tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=8)
+def _load_schema_file(schema_path: str) -> Mapping[str, Any]:
+    """
+    Read a JSON schema once per process; failures are not cached.
+
+    Every loader shares the result, so it is frozen all the way down.
+    """
+    try:
+        with open(schema_path, "r") as f:
+            return _freeze(json.load(f))
+    except FileNotFoundError:
+        raise ConfigurationError(
+            f"Configuration schema not found: {schema_path}"
+        )
+    except json.JSONDecodeError as e:
+        raise ConfigurationError(f"Invalid JSON schema: {e}")
+
 
 class ConfigLoader:
     """
@@ -35,24 +101,14 @@ class ConfigLoader:
             env_prefix: Environment variable prefix (optional)
         """
         self.config_file = config_file
-        self.schema_path = (
-            Path(__file__).parent / "schemas" / "config_schema.json"
-        )
-        self._schema: Optional[Dict[str, Any]] = None
+        self.schema_path = _SCHEMA_PATH
+        self._schema: Optional[Mapping[str, Any]] = None
         self.env_prefix = env_prefix
 
-    def _load_schema(self) -> Dict[str, Any]:
-        """Load and cache JSON schema for validation"""
+    def _load_schema(self) -> Mapping[str, Any]:
+        """Load JSON schema for validation (read-only, shared by loaders)"""
         if self._schema is None:
-            try:
-                with open(self.schema_path, "r") as f:
-                    self._schema = json.load(f)
-            except FileNotFoundError:
-                raise ConfigurationError(
-                    f"Configuration schema not found: {self.schema_path}"
-                )
-            except json.JSONDecodeError as e:
-                raise ConfigurationError(f"Invalid JSON schema: {e}")
+            self._schema = _load_schema_file(str(self.schema_path))
         return self._schema
 
     def _load_json_config(self) -> Dict[str, Any]:
@@ -73,9 +129,8 @@ class ConfigLoader:
             )
 
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            return config if isinstance(config, dict) else {}
+            with open(config_path, "rb") as f:
+                config = _json_loads(f.read())
         except json.JSONDecodeError as e:
             raise ConfigurationError(
                 f"Invalid JSON in configuration file: {e}"
@@ -83,14 +138,20 @@ class ConfigLoader:
         except Exception as e:
             raise ConfigurationError(f"Error reading configuration file: {e}")
 
+        if not isinstance(config, dict):
+            return {}
+        # Parsed keys are fresh strings; interning them lets lookups with
+        # the literal keys used throughout MohFlow match by identity
+        return {sys.intern(key): value for key, value in config.items()}
+
     def _load_file_config(self, config_file: str) -> Dict[str, Any]:
         """Load configuration from JSON file"""
         if not os.path.exists(config_file):
             return {}
 
         try:
-            with open(config_file, "r") as f:
-                data = json.load(f)
+            with open(config_file, "rb") as f:
+                data = _json_loads(f.read())
                 return data if isinstance(data, dict) else {}
         except FileNotFoundError:
             return {}
@@ -99,39 +160,28 @@ class ConfigLoader:
 
     def _load_env_config(self) -> Dict[str, Any]:
         """Load configuration from environment variables"""
-        env_config = {}
+        env_config: Dict[str, Any] = {}
         env_prefix = self.env_prefix
+        environ = os.environ
 
         # Map environment variables to config keys
-        env_mappings = {
-            f"{env_prefix}SERVICE_NAME": "service_name",
-            f"{env_prefix}ENVIRONMENT": "environment",
-            f"{env_prefix}LOG_LEVEL": "log_level",
-            f"{env_prefix}CONSOLE_LOGGING": "console_logging",
-            f"{env_prefix}FILE_LOGGING": "file_logging",
-            f"{env_prefix}LOG_FILE_PATH": "log_file_path",
-            f"{env_prefix}LOKI_URL": "loki_url",
-        }
-
-        for env_var, config_key in env_mappings.items():
-            value = os.getenv(env_var)
+        for name, config_key, convert in _ENV_FIELDS:
+            value = environ.get(env_prefix + name)
             if value is not None:
-                # Convert string values to appropriate types
-                if config_key in ["console_logging", "file_logging"]:
-                    env_config[config_key] = value.lower() in (
-                        "true",
-                        "1",
-                        "yes",
-                        "on",
-                    )
-                else:
-                    env_config[config_key] = value
-
-        # Handle nested environment variables
-        for key, value in os.environ.items():
-            if key.startswith(env_prefix) and key not in env_mappings:
+                env_config[config_key] = convert(value)
+
+        # Handle nested environment variables. Only keys are iterated:
+        # os.environ decodes every value items() yields, and only the
+        # few prefixed variables need theirs.
+        prefix_len = len(env_prefix)
+        for key in environ:
+            if (
+                key.startswith(env_prefix)
+                and key[prefix_len:] not in _ENV_FIELD_NAMES
+            ):
+                value = environ[key]
                 # Remove prefix and convert to lowercase
-                config_key = key[len(env_prefix) :].lower()
+                config_key = key[prefix_len:].lower()
 
                 # Handle nested keys (e.g., CONTEXT_ENRICHMENT_INCLUDE_TIMESTAMP)  # noqa: E501
                 if "_" in config_key:
@@ -202,22 +252,30 @@ class ConfigLoader:
         merged: Dict[str, Any] = {}
 
         for config in configs:
-            if not config:
-                continue
+            if config:
+                self._merge_into(merged, config)
 
-            for key, value in config.items():
-                if (
-                    isinstance(value, dict)
-                    and key in merged
-                    and isinstance(merged[key], dict)
-                ):
-                    # Recursively merge nested dictionaries
-                    merged[key] = self._merge_configs(merged[key], value)
+        return merged
+
+    @staticmethod
+    def _merge_into(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+        """
+        Merge source into target in place, walking nested dicts with an
+        explicit stack. Nested dicts from source are copied, never shared,
+        so later merges cannot modify the caller's configs.
+        """
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    current = target.get(key)
+                    if not isinstance(current, dict):
+                        current = target[key] = {}
+                    stack.append((current, value))
                 else:
                     # Override with new value
-                    merged[key] = value
-
-        return merged
+                    target[key] = value
 
     def _validate_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -231,22 +289,14 @@ class ConfigLoader:
 
             # Validate log level
             if "log_level" in config:
-                valid_levels = [
-                    "DEBUG",
-                    "INFO",
-                    "WARNING",
-                    "ERROR",
-                    "CRITICAL",
-                ]
-                if config["log_level"] not in valid_levels:
+                if config["log_level"] not in _VALID_LEVELS:
                     raise ValueError(
                         f"Invalid log_level: {config['log_level']}"
                     )
 
             # Validate environment
             if "environment" in config:
-                valid_envs = ["development", "staging", "production", "test"]
-                if config["environment"] not in valid_envs:
+                if config["environment"] not in _VALID_ENVS:
                     raise ConfigurationError(
                         f"Invalid environment: {config['environment']}"
                     )
@@ -394,10 +444,12 @@ class ConfigLoader:
         }
 
         # Merge configurations (later ones override earlier ones)
-        # Precedence: runtime > env > json > default
-        final_config = self._merge_configs(
-            default_config, json_config, env_config, runtime_config
-        )
+        # Precedence: runtime > env > json > default. The defaults are
+        # built fresh per call, so they are merged into directly.
+        final_config = default_config
+        for config in (json_config, env_config, runtime_config):
+            if config:
+                self._merge_into(final_config, config)
 
         # Validate final configuration
         self._validate_config(final_config)
@@ -4,7 +4,6 @@ Provides request correlation, user context, and system metadata.
 """
 
 import os
-import time
 import uuid
 import threading
 import functools
@@ -23,6 +22,30 @@ _global_context: ContextVar[Dict[str, Any]] = ContextVar(
     "global_context", default={}
 )
 
+# Process-invariant system fields, computed once per process
+_process_info: Optional[Dict[str, Any]] = None
+
+
+def _get_process_info() -> Dict[str, Any]:
+    """Get the cached process id and hostname"""
+    global _process_info
+    if _process_info is None:
+        _process_info = {
+            CONTEXT_FIELDS.PROCESS_ID: os.getpid(),
+            CONTEXT_FIELDS.HOST_NAME: os.uname().nodename,
+        }
+    return _process_info
+
+
+def _reset_process_info() -> None:
+    """Drop the cached process info (a forked child has a new pid)"""
+    global _process_info
+    _process_info = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_process_info)
+
 
 @dataclass
 class RequestContext:
@@ -159,11 +182,6 @@ class ContextEnricher:
         self.include_global_context = include_global_context
         self.custom_enrichers = custom_enrichers or {}
 
-        # Cache system info to avoid repeated calls
-        self._system_info_cache: Optional[Dict[str, Any]] = None
-        self._cache_time: float = 0
-        self._cache_ttl: float = 300  # 5 minutes cache TTL
-
     def enrich_log_record(self, record):
         """
         Enrich log record with context information.
@@ -216,7 +234,8 @@ class ContextEnricher:
     def _add_system_info_if_enabled(self, enriched: Dict[str, Any]):
         """Add system info if enabled"""
         if self.include_system_info:
-            enriched.update(self._get_system_info())
+            enriched.update(_get_process_info())
+            enriched[CONTEXT_FIELDS.THREAD_ID] = threading.get_ident()
 
     def _add_global_context_if_enabled(self, enriched: Dict[str, Any]):
         """Add global context if enabled"""
@@ -248,25 +267,10 @@ class ContextEnricher:
         return datetime.now(timezone.utc).isoformat()
 
     def _get_system_info(self) -> Dict[str, Any]:
-        """Get cached system information"""
-        current_time = time.time()
-
-        # Return cached info if still valid
-        if (
-            self._system_info_cache is not None
-            and current_time - self._cache_time < self._cache_ttl
-        ):
-            return self._system_info_cache
-
-        # Refresh system info cache
-        self._system_info_cache = {
-            CONTEXT_FIELDS.PROCESS_ID: os.getpid(),
-            CONTEXT_FIELDS.THREAD_ID: threading.get_ident(),
-            CONTEXT_FIELDS.HOST_NAME: os.uname().nodename,
-        }
-        self._cache_time = current_time
-
-        return self._system_info_cache
+        """Get system information for the calling thread"""
+        system_info = dict(_get_process_info())
+        system_info[CONTEXT_FIELDS.THREAD_ID] = threading.get_ident()
+        return system_info
 
     def add_custom_enricher(
         self, field_name: str, enricher_func: Callable[[], Any]
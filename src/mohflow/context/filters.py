@@ -7,9 +7,83 @@ import re
 import json
 import time
 from enum import Enum
-from typing import Any, Dict, List, Pattern, Set, Union, Optional
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+    Optional,
+)
 from mohflow.static_config import SECURITY_CONFIG, REGEX_PATTERNS
 
+# Numbered backreferences and group-number conditionals; fusing
+# renumbers groups, which would silently change what these refer to
+_NUMBERED_GROUP_REF = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def _fuse_patterns(patterns: List[str], flags: int = 0) -> Tuple[Pattern, ...]:
+    """
+    Compile regex strings into as few Pattern objects as possible.
+
+    Patterns are joined into one alternation so checking a field is a
+    single search. If any pattern sets a global inline flag such as
+    ``(?i)`` or refers to groups by number, fusing would change what the
+    patterns match, so each pattern is compiled on its own instead.
+    """
+    compiled = tuple(re.compile(p, flags) for p in patterns)
+    if len(compiled) < 2:
+        return compiled
+
+    # Inline flags are detected without the caller's flags, so even a
+    # redundant (?i) keeps the pattern out of the alternation
+    plain_flags = re.compile("").flags
+    for pattern in patterns:
+        if re.compile(pattern).flags != plain_flags or (
+            _NUMBERED_GROUP_REF.search(pattern)
+        ):
+            return compiled
+
+    try:
+        return (re.compile("|".join(f"(?:{p})" for p in patterns), flags),)
+    except re.error:
+        # e.g. the same group name used in two patterns
+        return compiled
+
+
+# Upper bound on distinct field names remembered by classify_field
+_CLASSIFY_CACHE_SIZE = 4096
+
+# Built-in sensitive field names, lowercased once for safe-field checks
+_SENSITIVE_FIELDS_LOWER = frozenset(
+    f.lower() for f in SECURITY_CONFIG.SENSITIVE_FIELDS
+)
+
+# Value patterns checked by SensitiveDataFilter._is_sensitive_value
+_SENSITIVE_VALUE_RE = _fuse_patterns(
+    [
+        # Credit card numbers - with and without dashes/spaces
+        r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
+        r"\b\d{16}\b",
+        # SSN patterns - with and without dashes
+        r"\b\d{3}-\d{2}-\d{4}\b",
+        r"\b\d{9}\b",
+        # Email addresses
+        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+        # Phone numbers
+        r"\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b",  # noqa: E501
+        # API keys and tokens (common patterns)
+        r"\b[A-Za-z0-9]{32,}\b",
+        r"sk-[A-Za-z0-9]{32,}",
+        r"pk_[A-Za-z0-9]{32,}",
+        # UUIDs
+        r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b",  # noqa: E501
+    ]
+)[0]
+
 
 class FieldType(Enum):
     """Classification types for fields during filtering."""
@@ -22,6 +96,8 @@ class FieldType(Enum):
 class FieldClassification:
     """Result of field classification analysis."""
 
+    __slots__ = ("field_name", "classification", "matched_pattern", "exempted")
+
     def __init__(
         self,
         field_name: str,
@@ -80,12 +156,21 @@ class TracingFieldRegistry:
         self.case_sensitive = case_sensitive
         self._default_fields = self.DEFAULT_TRACING_FIELDS.copy()
         self.default_patterns = self.DEFAULT_TRACING_PATTERNS.copy()
-        self.custom_fields = set()
+        self._custom_fields = set()
         self.custom_patterns = []
 
+        # Field names normalized for lookup, kept in sync by the
+        # add/remove methods so checks don't rebuild them per call
+        self._default_fields_check = frozenset(
+            f.lower() if not case_sensitive else f
+            for f in self._default_fields
+        )
+        self._custom_fields_check = frozenset()
+
         # Compile patterns
         self._compiled_patterns = []
         self._all_patterns = []  # Track pattern strings for lookup
+        self._fused_patterns = ()
         self._compile_patterns()
 
     @property
@@ -93,6 +178,15 @@ class TracingFieldRegistry:
         """Return immutable copy of default fields."""
         return self._default_fields.copy()
 
+    @property
+    def custom_fields(self) -> FrozenSet[str]:
+        """Return read-only copy of custom fields.
+
+        Use add_custom_field()/remove_custom_field() to change them, so
+        the lookup set stays in sync.
+        """
+        return frozenset(self._custom_fields)
+
     def _compile_patterns(self):
         """Compile default patterns during initialization."""
         for pattern in self.default_patterns:
@@ -101,10 +195,38 @@ class TracingFieldRegistry:
                 self._all_patterns.append(pattern)
             except re.error:
                 pass  # Skip invalid patterns
+        self._fused_patterns = _fuse_patterns(self._all_patterns)
+
+    def add_custom_pattern(self, pattern: str) -> None:
+        """Add a regex pattern for tracing field detection."""
+        try:
+            compiled = re.compile(pattern)
+        except re.error:
+            raise ValueError("Invalid regex pattern")
+
+        self.custom_patterns.append(pattern)
+        self._compiled_patterns.append(compiled)
+        self._all_patterns.append(pattern)
+        self._fused_patterns = _fuse_patterns(self._all_patterns)
 
     def is_tracing_field(self, field_name: str) -> bool:
         """Check if a field name indicates a tracing context."""
-        return self.get_tracing_match(field_name) is not None
+        if field_name is None or field_name == "" or field_name.isspace():
+            return False
+
+        check_name = (
+            field_name.lower() if not self.case_sensitive else field_name
+        )
+        if (
+            check_name in self._default_fields_check
+            or check_name in self._custom_fields_check
+        ):
+            return True
+
+        for fused in self._fused_patterns:
+            if fused.search(check_name):
+                return True
+        return False
 
     def get_tracing_match(self, field_name: str) -> Optional[str]:
         """Get the pattern/field that matched for tracing, or None."""
@@ -116,29 +238,23 @@ class TracingFieldRegistry:
         )
 
         # Check default fields
-        default_fields_check = (
-            {f.lower() for f in self._default_fields}
-            if not self.case_sensitive
-            else self._default_fields
-        )
-        if check_name in default_fields_check:
+        if check_name in self._default_fields_check:
             return f"default_field:{field_name}"
 
         # Check custom fields
-        custom_fields_check = (
-            {f.lower() for f in self.custom_fields}
-            if not self.case_sensitive
-            else self.custom_fields
-        )
-        if check_name in custom_fields_check:
+        if check_name in self._custom_fields_check:
             return f"custom_field:{field_name}"
 
-        # Check patterns
-        test_name = (
-            field_name.lower() if not self.case_sensitive else field_name
-        )
+        # Check patterns; the fused regex rejects non-matching names in
+        # one search, so only hits pay for finding the matching pattern
+        for fused in self._fused_patterns:
+            if fused.search(check_name):
+                break
+        else:
+            return None
+
         for i, pattern in enumerate(self._compiled_patterns):
-            if pattern.search(test_name):
+            if pattern.search(check_name):
                 # Return the original pattern string
                 return self._all_patterns[i]
 
@@ -153,18 +269,32 @@ class TracingFieldRegistry:
         if not re.match(r"^[a-zA-Z0-9_.-]+$", field_name):
             raise ValueError("invalid field name format")
 
-        self.custom_fields.add(field_name)
+        self._custom_fields.add(field_name)
+        self._custom_fields_check = self._custom_fields_check | {
+            field_name.lower() if not self.case_sensitive else field_name
+        }
 
     def remove_custom_field(self, field_name: str) -> None:
         """Remove a custom field from the tracing exemption list."""
         if field_name in self._default_fields:
             raise ValueError("cannot remove built-in field")
-        self.custom_fields.discard(field_name)
+        self._custom_fields.discard(field_name)
+        self._custom_fields_check = frozenset(
+            f.lower() if not self.case_sensitive else f
+            for f in self._custom_fields
+        )
 
 
 class FilterResult:
     """Result of filtering operation with audit information."""
 
+    __slots__ = (
+        "filtered_data",
+        "redacted_fields",
+        "preserved_fields",
+        "processing_time",
+    )
+
     def __init__(
         self,
         filtered_data: Any,
@@ -245,6 +375,18 @@ class FilterResult:
 class FilterConfiguration:
     """Configuration for sensitive data filtering behavior."""
 
+    __slots__ = (
+        "enabled",
+        "exclude_tracing_fields",
+        "custom_safe_fields",
+        "tracing_field_patterns",
+        "sensitive_fields",
+        "sensitive_patterns",
+        "case_sensitive",
+        "_compiled_patterns",
+        "_safe_fields_lower",
+    )
+
     def __init__(
         self,
         enabled: bool = True,
@@ -374,6 +516,11 @@ class SensitiveDataFilter:
         self.max_field_length = max_field_length
         self.case_sensitive = case_sensitive
 
+        # classify_field results by exact field name; cleared whenever the
+        # fields or patterns it depends on change
+        self._classify_cache: Dict[str, FieldClassification] = {}
+        self._classify_cache_tracing = exclude_tracing_fields
+
         # Initialize tracing field registry
         self.tracing_registry = TracingFieldRegistry(
             case_sensitive=case_sensitive
@@ -413,6 +560,7 @@ class SensitiveDataFilter:
         if additional_patterns:
             base_patterns.extend(additional_patterns)
         self.sensitive_patterns = base_patterns
+        self._compile_sensitive_patterns()
 
         # Prepare field lookup set
         if not case_sensitive:
@@ -424,6 +572,29 @@ class SensitiveDataFilter:
         else:
             self.sensitive_fields_lower = self.sensitive_fields
 
+    def _compile_sensitive_patterns(self) -> None:
+        """Fuse the string entries of sensitive_patterns for field checks.
+
+        Strings that are not valid regexes are matched as substrings;
+        precompiled Pattern entries are only used for value matching.
+        """
+        regexes = []
+        substrings = []
+        for pattern in self.sensitive_patterns:
+            if not isinstance(pattern, str):
+                continue
+            try:
+                re.compile(pattern)
+                regexes.append(pattern)
+            except re.error:
+                substrings.append(pattern.lower())
+
+        self._sensitive_res = _fuse_patterns(
+            regexes, 0 if self.case_sensitive else re.IGNORECASE
+        )
+        self._sensitive_substrings = tuple(substrings)
+        self._classify_cache.clear()
+
     def _get_default_patterns(self) -> List[Pattern]:
         """Get default regex patterns for sensitive data detection"""
         patterns = [
@@ -495,6 +666,22 @@ class SensitiveDataFilter:
             FieldClassification(field_name="user_id",
                                 type=FieldType.NEUTRAL, exempted=False)
         """
+        if self.exclude_tracing_fields != self._classify_cache_tracing:
+            # exclude_tracing_fields was reassigned since results were cached
+            self._classify_cache.clear()
+            self._classify_cache_tracing = self.exclude_tracing_fields
+
+        classification = self._classify_cache.get(field_name)
+        if classification is not None:
+            return classification
+
+        classification = self._classify_field_uncached(field_name)
+        if len(self._classify_cache) < _CLASSIFY_CACHE_SIZE:
+            self._classify_cache[field_name] = classification
+        return classification
+
+    def _classify_field_uncached(self, field_name: str) -> FieldClassification:
+        """Classify a field name without consulting the cache."""
         if field_name is None or field_name == "" or field_name.isspace():
             return FieldClassification(field_name, FieldType.NEUTRAL)
 
@@ -542,17 +729,16 @@ class SensitiveDataFilter:
         field_name_lower = field_name.lower()
 
         # Check exact matches first
-        if field_name_lower in {
-            f.lower() for f in SECURITY_CONFIG.SENSITIVE_FIELDS
-        }:
+        if field_name_lower in _SENSITIVE_FIELDS_LOWER:
             raise ValueError("conflict with sensitive field")
 
         # Check if field contains sensitive patterns
-        for sensitive_field in SECURITY_CONFIG.SENSITIVE_FIELDS:
-            if sensitive_field.lower() in field_name_lower:
+        for sensitive_field in _SENSITIVE_FIELDS_LOWER:
+            if sensitive_field in field_name_lower:
                 raise ValueError("conflict with sensitive field")
 
         self.tracing_registry.add_custom_field(field_name)
+        self._classify_cache.clear()
 
     def remove_safe_field(self, field_name: str) -> None:
         """Remove a field from the safe exemption list."""
@@ -560,6 +746,7 @@ class SensitiveDataFilter:
             raise ValueError("cannot remove built-in field")
 
         self.tracing_registry.remove_custom_field(field_name)
+        self._classify_cache.clear()
 
     def add_tracing_pattern(self, pattern: str) -> None:
         """Add a regex pattern for tracing field detection."""
@@ -568,15 +755,8 @@ class SensitiveDataFilter:
         except re.error:
             raise ValueError("Invalid regex pattern")
 
-        self.tracing_registry.custom_patterns.append(pattern)
-        # Recompile patterns
-        try:
-            self.tracing_registry._compiled_patterns.append(
-                re.compile(pattern)
-            )
-            self.tracing_registry._all_patterns.append(pattern)
-        except re.error:
-            pass
+        self.tracing_registry.add_custom_pattern(pattern)
+        self._classify_cache.clear()
 
     def get_configuration(self) -> FilterConfiguration:
         """Get current filter configuration."""
@@ -584,7 +764,7 @@ class SensitiveDataFilter:
         config = FilterConfiguration(
             enabled=self.enabled,
             exclude_tracing_fields=self.exclude_tracing_fields,
-            custom_safe_fields=self.tracing_registry.custom_fields.copy(),
+            custom_safe_fields=set(self.tracing_registry.custom_fields),
             tracing_field_patterns=(
                 self.tracing_registry.custom_patterns.copy()
             ),
@@ -627,125 +807,124 @@ class SensitiveDataFilter:
             >>> result.redacted_fields
             ["api_key"]
         """
-        start_time = time.time()
+        # Monotonic integer clock; converted to float seconds only when
+        # the result is built
+        start_ns = time.perf_counter_ns()
 
         if not self.enabled:
-            end_time = time.time()
-            return FilterResult(data, [], [], end_time - start_time)
+            return FilterResult(
+                data, [], [], (time.perf_counter_ns() - start_ns) * 1e-9
+            )
 
         if data is None:
-            end_time = time.time()
-            return FilterResult(None, [], [], end_time - start_time)
+            return FilterResult(
+                None, [], [], (time.perf_counter_ns() - start_ns) * 1e-9
+            )
 
         redacted_fields = []
         preserved_fields = []
 
-        # Track visited objects to prevent circular references
-        visited = set()
-        filtered_data = self._filter_data_recursive(
-            data, redacted_fields, preserved_fields, "", visited
+        filtered_data = self._filter_data_iterative(
+            data, redacted_fields, preserved_fields
         )
 
-        end_time = time.time()
         return FilterResult(
             filtered_data,
             redacted_fields,
             preserved_fields,
-            end_time - start_time,
+            (time.perf_counter_ns() - start_ns) * 1e-9,
         )
 
-    def _filter_data_recursive(
+    def _filter_data_iterative(
         self,
         data: Any,
         redacted_fields: List[str],
         preserved_fields: List[str],
-        path: str,
-        visited: set,
     ) -> Any:
-        """Recursively filter data structure."""
-        # Handle circular references
-        if isinstance(data, (dict, list)) and id(data) in visited:
-            return "[CIRCULAR_REFERENCE]"
+        """
+        Filter a nested data structure using an explicit stack.
 
-        if isinstance(data, (dict, list)):
-            visited.add(id(data))
-            try:
-                if isinstance(data, dict):
-                    result = self._filter_dict_data(
-                        data, redacted_fields, preserved_fields, path, visited
-                    )
-                else:
-                    result = self._filter_list_data(
-                        data, redacted_fields, preserved_fields, path, visited
-                    )
-                return result
-            finally:
-                visited.remove(id(data))
-        else:
+        Containers are walked depth-first in the same order a recursive
+        traversal would use, so audit paths are reported in the same
+        order, without a Python frame per nesting level. A container that
+        is already being walked further up the stack is replaced with a
+        circular reference marker.
+        """
+        if not isinstance(data, (dict, list)):
             return data
 
-    def _filter_dict_data(
-        self,
-        data: Dict[str, Any],
-        redacted_fields: List[str],
-        preserved_fields: List[str],
-        path: str,
-        visited: set,
-    ) -> Dict[str, Any]:
-        """Filter dictionary data."""
-        filtered = {}
+        redaction_text = self.redaction_text
+        classify_field = self.classify_field
+        is_sensitive_value = self._is_sensitive_value
 
-        for key, value in data.items():
-            current_path = f"{path}.{key}" if path else key
-            classification = self.classify_field(key)
-
-            if classification.exempted:
-                # Preserve tracing field
-                preserved_fields.append(current_path)
-                filtered[key] = self._filter_data_recursive(
-                    value,
-                    redacted_fields,
-                    preserved_fields,
-                    current_path,
-                    visited,
-                )
-            elif classification.classification == FieldType.SENSITIVE:
-                # Redact sensitive field
-                redacted_fields.append(current_path)
-                filtered[key] = self.redaction_text
-            elif isinstance(value, str) and self._is_sensitive_value(value):
-                # Redact value with sensitive pattern
-                redacted_fields.append(current_path)
-                filtered[key] = self.redaction_text
-            else:
-                # Recursively process
-                filtered[key] = self._filter_data_recursive(
-                    value,
-                    redacted_fields,
-                    preserved_fields,
-                    current_path,
-                    visited,
-                )
+        if isinstance(data, dict):
+            result = {}
+            items = iter(data.items())
+        else:
+            result = []
+            items = enumerate(data)
+
+        # Each frame: (source id, filtered copy, path, item iterator)
+        stack = [(id(data), result, "", items)]
+        active = {id(data)}
+
+        while stack:
+            source_id, filtered, path, items = stack[-1]
+            is_dict = type(filtered) is dict
+
+            for key, value in items:
+                if is_dict:
+                    current_path = f"{path}.{key}" if path else key
+                    classification = classify_field(key)
+
+                    if classification.exempted:
+                        # Preserve tracing field
+                        preserved_fields.append(current_path)
+                    elif classification.classification == FieldType.SENSITIVE:
+                        # Redact sensitive field
+                        redacted_fields.append(current_path)
+                        filtered[key] = redaction_text
+                        continue
+                    elif isinstance(value, str) and is_sensitive_value(value):
+                        # Redact value with sensitive pattern
+                        redacted_fields.append(current_path)
+                        filtered[key] = redaction_text
+                        continue
+                else:
+                    current_path = f"{path}[{key}]"
+
+                if isinstance(value, (dict, list)):
+                    if id(value) in active:
+                        value = "[CIRCULAR_REFERENCE]"
+                    else:
+                        # Descend: the child copy is placed now so sibling
+                        # order is kept, and filled when its frame runs
+                        if isinstance(value, dict):
+                            child = {}
+                            child_items = iter(value.items())
+                        else:
+                            child = []
+                            child_items = enumerate(value)
+                        if is_dict:
+                            filtered[key] = child
+                        else:
+                            filtered.append(child)
+                        active.add(id(value))
+                        stack.append(
+                            (id(value), child, current_path, child_items)
+                        )
+                        break
 
-        return filtered
+                if is_dict:
+                    filtered[key] = value
+                else:
+                    filtered.append(value)
+            else:
+                # Container exhausted
+                stack.pop()
+                active.discard(source_id)
 
-    def _filter_list_data(
-        self,
-        data: List[Any],
-        redacted_fields: List[str],
-        preserved_fields: List[str],
-        path: str,
-        visited: set,
-    ) -> List[Any]:
-        """Filter list data."""
-        filtered = []
-        for i, item in enumerate(data):
-            current_path = f"{path}[{i}]"
-            filtered_item = self._filter_data_recursive(
-                item, redacted_fields, preserved_fields, current_path, visited
-            )
-            filtered.append(filtered_item)
-        return filtered
+        return result
 
     def _is_sensitive_field(self, field_name: str) -> bool:
         """
@@ -763,53 +942,27 @@ class SensitiveDataFilter:
             field_name.lower() if not self.case_sensitive else field_name
         )
 
-        for pattern in self.sensitive_patterns:
-            if isinstance(pattern, str):
-                try:
-                    # Try regex match first
-                    if re.search(
-                        pattern,
-                        check_name,
-                        re.IGNORECASE if not self.case_sensitive else 0,
-                    ):
-                        return True
-                except re.error:
-                    # Fall back to substring match for non-regex patterns
-                    if pattern.lower() in check_name:
-                        return True
+        # Cheapest checks first: exact names, then substrings, then regex
+        if check_name in self.sensitive_fields_lower:
+            return True
 
-        return check_name in self.sensitive_fields_lower
+        # Substring match for patterns that are not valid regexes
+        for substring in self._sensitive_substrings:
+            if substring in check_name:
+                return True
+
+        for fused in self._sensitive_res:
+            if fused.search(check_name):
+                return True
+
+        return False
 
     def _is_sensitive_value(self, value: str) -> bool:
         """Check if a value contains sensitive patterns"""
         if not isinstance(value, str):
             return False
 
-        # Define comprehensive regex patterns for sensitive data
-        patterns = [
-            # Credit card numbers - with and without dashes/spaces
-            r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
-            r"\b\d{16}\b",
-            # SSN patterns - with and without dashes
-            r"\b\d{3}-\d{2}-\d{4}\b",
-            r"\b\d{9}\b",
-            # Email addresses
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            # Phone numbers
-            r"\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b",  # noqa: E501
-            # API keys and tokens (common patterns)
-            r"\b[A-Za-z0-9]{32,}\b",
-            r"sk-[A-Za-z0-9]{32,}",
-            r"pk_[A-Za-z0-9]{32,}",
-            # UUIDs
-            r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b",  # noqa: E501
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, value):
-                return True
-
-        return False
+        return _SENSITIVE_VALUE_RE.search(value) is not None
 
     def _redact_sensitive_data(self, data: Any) -> Any:
         """Redact sensitive data from any data structure"""
@@ -829,12 +982,17 @@ class SensitiveDataFilter:
         if not self.enabled:
             return record
 
-        # Get all attributes and filter them
+        # Get all attributes and filter them; the same attribute names
+        # recur on every record, so their classification comes from the
+        # classify_field cache
         for attr_name in dir(record):
             if not attr_name.startswith("_") and hasattr(record, attr_name):
                 try:
                     value = getattr(record, attr_name)
-                    if self._is_sensitive_field(attr_name):
+                    if (
+                        self.classify_field(attr_name).classification
+                        is FieldType.SENSITIVE
+                    ):
                         setattr(record, attr_name, self.redaction_text)
                     elif isinstance(value, str) and self._is_sensitive_value(
                         value
@@ -960,6 +1118,7 @@ class SensitiveDataFilter:
         self.sensitive_fields.add(field_name)
         if not self.case_sensitive:
             self.sensitive_fields_lower.add(field_name.lower())
+        self._classify_cache.clear()
 
     def remove_sensitive_field(self, field_name: str):
         """Remove a field name from the sensitive fields set"""
@@ -968,16 +1127,19 @@ class SensitiveDataFilter:
         self.sensitive_fields.discard(field_name)
         if not self.case_sensitive:
             self.sensitive_fields_lower.discard(field_name.lower())
+        self._classify_cache.clear()
 
     def add_sensitive_pattern(self, pattern: Union[str, Pattern]):
         """Add a regex pattern for sensitive data detection"""
         if isinstance(pattern, str):
             pattern = re.compile(pattern)
         self.sensitive_patterns.append(pattern)
+        self._compile_sensitive_patterns()
 
     def clear_sensitive_patterns(self):
         """Clear all sensitive patterns"""
         self.sensitive_patterns.clear()
+        self._compile_sensitive_patterns()
 
 
 class HTTPDataFilter(SensitiveDataFilter):
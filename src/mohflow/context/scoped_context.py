@@ -90,13 +90,11 @@ class ScopedContextManager:
         """
         scope = ContextScope(scope_type="request", context_data=kwargs)
 
-        # Store current request context
+        # Set new request context (merged with current)
         current_context = _request_context.get({})
+        token = _request_context.set({**current_context, **kwargs})
 
         try:
-            # Set new request context (merged with current)
-            merged_context = {**current_context, **kwargs}
-            _request_context.set(merged_context)
             with self._stack_lock:
                 self._context_stack[scope.scope_id] = scope
 
@@ -104,7 +102,7 @@ class ScopedContextManager:
 
         finally:
             # Restore previous request context
-            _request_context.set(current_context)
+            _request_context.reset(token)
             with self._stack_lock:
                 self._context_stack.pop(scope.scope_id, None)
 
@@ -125,13 +123,11 @@ class ScopedContextManager:
         """
         scope = ContextScope(scope_type="thread", context_data=kwargs)
 
-        # Store current thread context
+        # Set new thread context (merged with current)
         current_context = _thread_context.get({})
+        token = _thread_context.set({**current_context, **kwargs})
 
         try:
-            # Set new thread context (merged with current)
-            merged_context = {**current_context, **kwargs}
-            _thread_context.set(merged_context)
             with self._stack_lock:
                 self._context_stack[scope.scope_id] = scope
 
@@ -139,7 +135,7 @@ class ScopedContextManager:
 
         finally:
             # Restore previous thread context
-            _thread_context.set(current_context)
+            _thread_context.reset(token)
             with self._stack_lock:
                 self._context_stack.pop(scope.scope_id, None)
 
@@ -162,13 +158,11 @@ class ScopedContextManager:
         """
         scope = ContextScope(scope_type="temporary", context_data=kwargs)
 
-        # Store current temporary context
+        # Set new temporary context (merged with current)
         current_context = _temporary_context.get({})
+        token = _temporary_context.set({**current_context, **kwargs})
 
         try:
-            # Set new temporary context (merged with current)
-            merged_context = {**current_context, **kwargs}
-            _temporary_context.set(merged_context)
             with self._stack_lock:
                 self._context_stack[scope.scope_id] = scope
 
@@ -176,7 +170,7 @@ class ScopedContextManager:
 
         finally:
             # Restore previous temporary context
-            _temporary_context.set(current_context)
+            _temporary_context.reset(token)
             with self._stack_lock:
                 self._context_stack.pop(scope.scope_id, None)
 
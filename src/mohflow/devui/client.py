@@ -7,18 +7,63 @@ Handles log forwarding to hub via WebSocket.
 import asyncio
 import json
 import logging
-import queue
+import random
+import socket
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 try:
     import websockets
 except ImportError:
     websockets = None
 
-from .types import LogEvent
+from .types import LOG_EVENT_LEVELS
+
+# Most events sent to the hub in one WebSocket frame
+SEND_BATCH_SIZE = 256
+
+# How long the connection may stay idle before a heartbeat is sent
+HEARTBEAT_INTERVAL_SECONDS = 1.0
+
+# Start of every heartbeat message, up to the timestamp value
+_HEARTBEAT_HEAD = '{"type": "heartbeat", "payload": {"timestamp": "'
+
+# Host identifier sent with every event; resolved once per process
+_HOSTNAME = socket.gethostname()
+
+# Reconnect delay after a failed or dropped hub connection; doubles per
+# consecutive failure and is reset once a connection succeeds
+RECONNECT_MIN_DELAY_SECONDS = 0.5
+RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+# Records arrive in bursts within the same second, so the formatted
+# "YYYY-MM-DDTHH:MM:SS" prefix is reused until the second changes
+_second_prefix: Tuple[int, str] = (-1, "")
+
+
+def _iso_timestamp(created: float) -> str:
+    """
+    Format a POSIX timestamp as UTC ISO 8601.
+
+    Produces the same string as
+    ``datetime.fromtimestamp(created, timezone.utc).isoformat()``
+    without allocating a datetime per record.
+    """
+    global _second_prefix
+    seconds = int(created)
+    micros = round((created - seconds) * 1_000_000)
+    if micros >= 1_000_000:
+        seconds += 1
+        micros -= 1_000_000
+    cached_second, prefix = _second_prefix
+    if cached_second != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _second_prefix = (seconds, prefix)
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
 
 
 class MohnitorForwardingHandler(logging.Handler):
@@ -37,8 +82,13 @@ class MohnitorForwardingHandler(logging.Handler):
         self.hub_port = hub_port
         self.buffer_size = buffer_size
 
-        # Non-blocking queue for log events
-        self.log_queue = queue.Queue(maxsize=buffer_size)
+        # Ring buffer of serialized events; append/popleft are atomic,
+        # so emitting threads never take a lock, and the oldest event is
+        # dropped when full. _wake tells the sender there is work.
+        self.log_queue: Deque[str] = deque(maxlen=buffer_size)
+        self._wake = threading.Event()
+        # Set by close() to cut a reconnect backoff short
+        self._closing = threading.Event()
         self.is_connected = False
         self.should_stop = False
 
@@ -51,27 +101,35 @@ class MohnitorForwardingHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """Emit log record to Mohnitor."""
         try:
-            # Convert LogRecord to LogEvent
-            log_event = LogEvent(
-                timestamp=datetime.fromtimestamp(record.created, timezone.utc),
-                level=record.levelname,
-                service=self.service,
-                message=record.getMessage(),
-                logger=record.name,
-                trace_id=getattr(record, "trace_id", None),
-                context=getattr(record, "context", {}),
-                source_host="localhost",  # Simplified
-                source_pid=record.process,
-            )
-
-            # Add to queue (non-blocking)
-            try:
-                self.log_queue.put_nowait(
-                    {"type": "log_event", "payload": log_event.to_dict()}
-                )
-            except queue.Full:
-                # Drop event if queue is full
-                pass
+            # Levels and services LogEvent would reject are not forwarded
+            level = record.levelname
+            if level not in LOG_EVENT_LEVELS or not self.service:
+                return
+
+            # Most records carry a plain string and no args, which is
+            # what getMessage() would return anyway
+            msg = record.msg
+            if record.args or type(msg) is not str:
+                msg = record.getMessage()
+
+            # Build LogEvent.to_dict() output directly from the record
+            payload = {
+                "timestamp": _iso_timestamp(record.created),
+                "level": level,
+                "service": self.service,
+                "message": msg,
+                "logger": record.name,
+                "trace_id": getattr(record, "trace_id", None),
+                "context": getattr(record, "context", {}),
+                "source_host": _HOSTNAME,
+                "source_pid": record.process,
+                "received_at": None,
+            }
+
+            # Serialize here so the sender only joins strings; an
+            # unserializable context drops this record alone
+            self.log_queue.append(json.dumps(payload))
+            self._wake.set()
 
         except Exception:
             # Never crash on logging
@@ -82,12 +140,28 @@ class MohnitorForwardingHandler(logging.Handler):
         if not websockets:
             return
 
-        while not self.should_stop:
-            try:
-                asyncio.run(self._send_events())
-            except Exception:
-                # Retry after delay
-                time.sleep(5)
+        # One event loop for every connection attempt
+        loop = asyncio.new_event_loop()
+        delay = RECONNECT_MIN_DELAY_SECONDS
+        try:
+            while not self.should_stop:
+                self.is_connected = False
+                try:
+                    loop.run_until_complete(self._send_events())
+                except Exception:
+                    pass
+
+                if self.is_connected:
+                    # The connection worked before dropping; retry soon
+                    delay = RECONNECT_MIN_DELAY_SECONDS
+                    self.is_connected = False
+
+                # Retry after delay, with jitter so processes sharing a
+                # hub do not reconnect in lockstep
+                self._closing.wait(delay + random.uniform(0, delay / 2))
+                delay = min(delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+        finally:
+            loop.close()
 
     async def _send_events(self) -> None:
         """Send queued events via WebSocket."""
@@ -97,35 +171,56 @@ class MohnitorForwardingHandler(logging.Handler):
             async with websockets.connect(uri) as websocket:
                 self.is_connected = True
 
+                # Heartbeats are spliced from a pre-serialized template;
+                # only the timestamp and queue depth change. Frames stay
+                # text because the hub reads them with receive_text().
+                heartbeat_tail = (
+                    f'", "pid": {threading.get_ident()}, "events_queued": '
+                )
+
+                def heartbeat() -> str:
+                    return (
+                        _HEARTBEAT_HEAD
+                        + _iso_timestamp(time.time())
+                        + heartbeat_tail
+                        + str(len(self.log_queue))
+                        + "}}"
+                    )
+
                 # Send heartbeat first
-                heartbeat = {
-                    "type": "heartbeat",
-                    "payload": {
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                        + "Z",
-                        "pid": threading.get_ident(),
-                        "events_queued": self.log_queue.qsize(),
-                    },
-                }
-                await websocket.send(json.dumps(heartbeat))
+                await websocket.send(heartbeat())
 
                 # Process queued events
+                loop = asyncio.get_running_loop()
+                last_sent = time.monotonic()
                 while not self.should_stop:
                     try:
-                        # Get event from queue (with timeout)
-                        try:
-                            event = self.log_queue.get(timeout=1.0)
-                            await websocket.send(json.dumps(event))
-                            self.log_queue.task_done()
-                        except queue.Empty:
+                        # Clear before draining so an event appended after
+                        # the drain still wakes the wait below
+                        self._wake.clear()
+                        batch = self._drain_queue()
+                        if batch:
+                            await websocket.send(
+                                '{"type": "log_batch", "payload": ['
+                                + ", ".join(batch)
+                                + "]}"
+                            )
+                            last_sent = time.monotonic()
+                            continue
+
+                        idle = time.monotonic() - last_sent
+                        if idle >= HEARTBEAT_INTERVAL_SECONDS:
                             # Send periodic heartbeat
-                            heartbeat["payload"]["timestamp"] = datetime.now(
-                                timezone.utc
-                            ).isoformat()
-                            heartbeat["payload"][
-                                "events_queued"
-                            ] = self.log_queue.qsize()
-                            await websocket.send(json.dumps(heartbeat))
+                            await websocket.send(heartbeat())
+                            last_sent = time.monotonic()
+                            idle = 0.0
+
+                        # Wait off the event loop for new events
+                        await loop.run_in_executor(
+                            None,
+                            self._wake.wait,
+                            HEARTBEAT_INTERVAL_SECONDS - idle,
+                        )
 
                     except websockets.exceptions.ConnectionClosed:
                         break
@@ -134,9 +229,21 @@ class MohnitorForwardingHandler(logging.Handler):
             self.is_connected = False
             # Will retry in _sender_loop
 
+    def _drain_queue(self) -> List[str]:
+        """Take up to SEND_BATCH_SIZE serialized events off the queue."""
+        batch: List[str] = []
+        try:
+            while len(batch) < SEND_BATCH_SIZE:
+                batch.append(self.log_queue.popleft())
+        except IndexError:
+            pass
+        return batch
+
     def close(self) -> None:
         """Close the handler and stop background thread."""
         self.should_stop = True
+        self._wake.set()
+        self._closing.set()
         if self.sender_thread.is_alive():
             self.sender_thread.join(timeout=2)
         super().close()
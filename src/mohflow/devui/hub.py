@@ -296,65 +296,16 @@ class MohnitorHub:
             msg_type = data.get("type")
 
             if msg_type == "log_event":
-                # Performance monitoring
-                start_time = time.time() * 1000  # ms
-
-                # Add log event to buffer
-                payload = data["payload"]
-                log_event = LogEvent.from_dict(payload)
-                log_event.set_received_at()
-
-                # Update event size estimate for optimization
-                if self.performance_enabled:
-                    event_size = memory_optimizer.estimate_event_size(
-                        log_event
-                    )
-                    self.avg_event_size = (self.avg_event_size * 0.9) + (
-                        event_size * 0.1
-                    )
-
-                # Add to ring buffer
-                if len(self.event_buffer) >= self.buffer_size:
-                    self.dropped_events += 1
-                    if self.performance_enabled:
-                        performance_monitor.record_event_dropped()
-                else:
-                    self.event_buffer.append(log_event)
-                    if self.performance_enabled:
-                        performance_monitor.record_event_processed()
-
-                # Update connection stats
-                if connection_id in self.connections:
-                    self.connections[connection_id].events_sent += 1
-                    self.connections[connection_id].update_heartbeat()
+                await self._ingest_log_event(connection_id, data["payload"])
 
-                # Optimized broadcast to UI clients
-                if self.performance_enabled and self.ui_websockets:
-                    # Use caching and batching for better performance
-                    event_key = f"{log_event.service}:{log_event.level}:{hash(log_event.message)}"
-                    cached_payload = event_cache.get(event_key)
-
-                    if not cached_payload:
-                        cached_payload = json.dumps(log_event.to_dict())
-                        event_cache.put(event_key, cached_payload)
-
-                    # Add to batch for efficient sending
-                    message_batcher.add_message(
-                        {
-                            "type": "log_event",
-                            "payload": json.loads(cached_payload),
-                        }
-                    )
-                else:
-                    # Fallback to direct broadcast
-                    await self._broadcast_to_ui(
-                        {"type": "log_event", "payload": log_event.to_dict()}
-                    )
-
-                # Record latency
-                if self.performance_enabled:
-                    latency = (time.time() * 1000) - start_time
-                    performance_monitor.record_broadcast_latency(latency)
+            elif msg_type == "log_batch":
+                # Client sends queued events in one frame; a bad event
+                # must not drop the rest of the batch
+                for payload in data["payload"]:
+                    try:
+                        await self._ingest_log_event(connection_id, payload)
+                    except Exception as e:
+                        print(f"Error handling client message: {e}")
 
             elif msg_type == "heartbeat":
                 # Update connection heartbeat
@@ -364,6 +315,65 @@ class MohnitorHub:
         except (json.JSONDecodeError, Exception) as e:
             print(f"Error handling client message: {e}")
 
+    async def _ingest_log_event(self, connection_id: str, payload: dict):
+        """Buffer one client log event and broadcast it to UI clients."""
+        # Performance monitoring
+        start_time = time.time() * 1000  # ms
+
+        # Add log event to buffer
+        log_event = LogEvent.from_dict(payload)
+        log_event.set_received_at()
+
+        # Update event size estimate for optimization
+        if self.performance_enabled:
+            event_size = memory_optimizer.estimate_event_size(log_event)
+            self.avg_event_size = (self.avg_event_size * 0.9) + (
+                event_size * 0.1
+            )
+
+        # Add to ring buffer
+        if len(self.event_buffer) >= self.buffer_size:
+            self.dropped_events += 1
+            if self.performance_enabled:
+                performance_monitor.record_event_dropped()
+        else:
+            self.event_buffer.append(log_event)
+            if self.performance_enabled:
+                performance_monitor.record_event_processed()
+
+        # Update connection stats
+        if connection_id in self.connections:
+            self.connections[connection_id].events_sent += 1
+            self.connections[connection_id].update_heartbeat()
+
+        # Optimized broadcast to UI clients
+        if self.performance_enabled and self.ui_websockets:
+            # Use caching and batching for better performance
+            event_key = f"{log_event.service}:{log_event.level}:{hash(log_event.message)}"
+            cached_payload = event_cache.get(event_key)
+
+            if not cached_payload:
+                cached_payload = json.dumps(log_event.to_dict())
+                event_cache.put(event_key, cached_payload)
+
+            # Add to batch for efficient sending
+            message_batcher.add_message(
+                {
+                    "type": "log_event",
+                    "payload": json.loads(cached_payload),
+                }
+            )
+        else:
+            # Fallback to direct broadcast
+            await self._broadcast_to_ui(
+                {"type": "log_event", "payload": log_event.to_dict()}
+            )
+
+        # Record latency
+        if self.performance_enabled:
+            latency = (time.time() * 1000) - start_time
+            performance_monitor.record_broadcast_latency(latency)
+
     async def _broadcast_to_ui(self, message: dict):
         """Broadcast message to all UI WebSocket connections."""
         if not self.ui_websockets:
@@ -13,6 +13,9 @@ import os
 import ipaddress
 import re
 
+# Levels a LogEvent accepts
+LOG_EVENT_LEVELS = frozenset({"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"})
+
 
 def utcnow() -> datetime:
     """Get current UTC time with timezone awareness."""
@@ -145,10 +148,10 @@ class LogEvent:
 
     def _validate_level(self):
         """Validate log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"}
-        if self.level not in valid_levels:
+        if self.level not in LOG_EVENT_LEVELS:
             raise ValueError(
-                f"Invalid log level: {self.level}. Must be one of {valid_levels}"
+                f"Invalid log level: {self.level}. "
+                f"Must be one of {sorted(LOG_EVENT_LEVELS)}"
             )
 
     def _validate_service(self):
@@ -66,8 +66,9 @@ class OrjsonFormatter(logging.Formatter):
         self.timestamp_field = timestamp_field
         self.timestamp_format = timestamp_format
 
-        # orjson options
-        self._orjson_options = orjson.OPT_APPEND_NEWLINE if HAS_ORJSON else 0
+        # orjson options; no OPT_APPEND_NEWLINE because logging handlers
+        # already append their terminator to each formatted record
+        self._orjson_options = 0
         if not ensure_ascii and HAS_ORJSON:
             self._orjson_options |= orjson.OPT_NON_STR_KEYS
         if sort_keys and HAS_ORJSON:
@@ -98,19 +99,18 @@ class OrjsonFormatter(logging.Formatter):
 
         # Serialize to JSON
         if HAS_ORJSON:
-            return orjson.dumps(log_data, option=self._orjson_options).decode(
-                "utf-8"
-            )
+            return orjson.dumps(
+                log_data,
+                default=self._json_default,
+                option=self._orjson_options,
+            ).decode("utf-8")
         else:
-            return (
-                json.dumps(
-                    log_data,
-                    ensure_ascii=self.ensure_ascii,
-                    indent=self.indent,
-                    sort_keys=self.sort_keys,
-                    default=self._json_default,
-                )
-                + "\n"
+            return json.dumps(
+                log_data,
+                ensure_ascii=self.ensure_ascii,
+                indent=self.indent,
+                sort_keys=self.sort_keys,
+                default=self._json_default,
             )
 
     def _create_log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
@@ -120,10 +120,9 @@ class StructuredFormatter(OrjsonFormatter):
                     log_data[field] = getattr(record, field)
 
         # Extra fields from record
+        reserved_fields = self._get_reserved_fields()
         for key, value in record.__dict__.items():
-            if key not in self._get_reserved_fields() and not key.startswith(
-                "_"
-            ):
+            if key not in reserved_fields and not key.startswith("_"):
                 # Apply field processor if available
                 if key in self.field_processors:
                     try:
@@ -1,7 +1,7 @@
 import logging
 import time
 import warnings
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 from pathlib import Path
 from mohflow.config import LogConfig
 from mohflow.formatters import (
@@ -51,6 +51,23 @@ except ImportError:
     HAS_OTEL = False
 
 
+def _render(message: str, args: Tuple[Any, ...]) -> str:
+    """
+    Apply %-style args to message the way logging.LogRecord does.
+
+    Mismatched args return the unformatted message instead of raising,
+    since logging reports formatting errors rather than propagating them.
+    """
+    if not args:
+        return message
+    try:
+        if len(args) == 1 and isinstance(args[0], dict) and args[0]:
+            return message % args[0]
+        return message % args
+    except Exception:
+        return message
+
+
 class MohflowLogger(ContextualLogger):
     """Enhanced MohFlow logger with auto-configuration and context awareness"""
 
@@ -89,6 +106,7 @@ class MohflowLogger(ContextualLogger):
         burst_limit: Optional[int] = None,
         adaptive_sampling: bool = False,
         level_sample_rates: Optional[Dict[str, float]] = None,
+        sampler: Optional[AdaptiveSampler] = None,
         # Auto-metrics parameters
         enable_auto_metrics: bool = False,
         metrics_config: str = "default",  # "default", "web_service",
@@ -207,9 +225,9 @@ class MohflowLogger(ContextualLogger):
                     compliance_standards_enum
                 )
 
-        # Initialize log sampling
-        self.sampler = None
-        if enable_sampling:
+        # Initialize log sampling; a pre-built sampler is used as is
+        self.sampler = sampler
+        if sampler is None and enable_sampling:
             # Map string strategy to enum
             strategy_map = {
                 "random": SamplingStrategy.RANDOM,
@@ -391,97 +409,163 @@ class MohflowLogger(ContextualLogger):
         else:  # "structured" (default)
             return StructuredFormatter(**formatter_config)
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def is_enabled_for(self, level: str = "INFO") -> bool:
+        """
+        Check whether a record at ``level`` passes the level threshold.
+
+        Mirrors ``logging.Logger.isEnabledFor`` so callers can skip
+        building expensive messages for disabled levels. Sampling is not
+        consulted; it is decided by the log call itself.
+
+        Raises:
+            ValueError: If ``level`` is not a known logging level name
+        """
+        levelno = logging.getLevelName(level.upper())
+        if not isinstance(levelno, int):
+            raise ValueError(f"Unknown log level: {level}")
+        return self.logger.isEnabledFor(levelno)
+
+    def _sampled_out(
+        self,
+        level: str,
+        message: str,
+        args: Tuple[Any, ...],
+        component: Optional[str],
+    ) -> bool:
+        """Return True when the sampler drops this record."""
+        if not self.sampler:
+            return False
+
+        # Deterministic sampling hashes the message, so it needs the
+        # rendered text; every other strategy can keep the cheap template
+        if (
+            args
+            and self.sampler.config.strategy is SamplingStrategy.DETERMINISTIC
+        ):
+            message = _render(message, args)
+
+        result = self.sampler.should_sample(
+            level=level, component=component, message=message
+        )
+        return not result.should_log
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info message"""
-        if self.sampler:
-            result = self.sampler.should_sample(
-                level="INFO",
-                component=kwargs.get("component"),
-                message=message,
-            )
-            if not result.should_log:
-                return
+        if self._sampled_out("INFO", message, args, kwargs.get("component")):
+            return
 
         # Process metrics before logging
-        self._process_metrics(message, "INFO", **kwargs)
+        if self.metrics_generator:
+            self._process_metrics(_render(message, args), "INFO", **kwargs)
 
         extra = self._prepare_extra(kwargs)
         extra["level"] = "INFO"
-        self.logger.info(message, extra=extra)
+        self.logger.info(message, *args, extra=extra)
 
     def error(
-        self, message: str, exc_info: bool = True, **kwargs: Any
+        self,
+        message: str,
+        *args: Any,
+        exc_info: bool = True,
+        **kwargs: Any,
     ) -> None:
         """Log error message"""
-        if self.sampler:
-            result = self.sampler.should_sample(
-                level="ERROR",
-                component=kwargs.get("component"),
-                message=message,
-            )
-            if not result.should_log:
-                return
+        if self._sampled_out("ERROR", message, args, kwargs.get("component")):
+            return
 
         # Process metrics before logging
-        self._process_metrics(message, "ERROR", **kwargs)
+        if self.metrics_generator:
+            self._process_metrics(_render(message, args), "ERROR", **kwargs)
 
         extra = self._prepare_extra(kwargs)
         extra["level"] = "ERROR"
-        self.logger.error(message, exc_info=exc_info, extra=extra)
+        self.logger.error(message, *args, exc_info=exc_info, extra=extra)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message"""
-        if self.sampler:
-            result = self.sampler.should_sample(
-                level="WARNING",
-                component=kwargs.get("component"),
-                message=message,
-            )
-            if not result.should_log:
-                return
+        if self._sampled_out(
+            "WARNING", message, args, kwargs.get("component")
+        ):
+            return
 
         # Process metrics before logging
-        self._process_metrics(message, "WARNING", **kwargs)
+        if self.metrics_generator:
+            self._process_metrics(_render(message, args), "WARNING", **kwargs)
 
         extra = self._prepare_extra(kwargs)
         extra["level"] = "WARNING"
-        self.logger.warning(message, extra=extra)
+        self.logger.warning(message, *args, extra=extra)
 
-    def debug(self, message: str, **kwargs: Any) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message"""
-        if self.sampler:
-            result = self.sampler.should_sample(
-                level="DEBUG",
-                component=kwargs.get("component"),
-                message=message,
-            )
-            if not result.should_log:
-                return
+        if self._sampled_out("DEBUG", message, args, kwargs.get("component")):
+            return
 
         # Process metrics before logging
-        self._process_metrics(message, "DEBUG", **kwargs)
+        if self.metrics_generator:
+            self._process_metrics(_render(message, args), "DEBUG", **kwargs)
 
         extra = self._prepare_extra(kwargs)
         extra["level"] = "DEBUG"
-        self.logger.debug(message, extra=extra)
+        self.logger.debug(message, *args, extra=extra)
 
-    def critical(self, message: str, **kwargs: Any) -> None:
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log critical message"""
-        if self.sampler:
-            result = self.sampler.should_sample(
-                level="CRITICAL",
-                component=kwargs.get("component"),
-                message=message,
-            )
-            if not result.should_log:
-                return
+        if self._sampled_out(
+            "CRITICAL", message, args, kwargs.get("component")
+        ):
+            return
 
         # Process metrics before logging
-        self._process_metrics(message, "CRITICAL", **kwargs)
+        if self.metrics_generator:
+            self._process_metrics(_render(message, args), "CRITICAL", **kwargs)
 
         extra = self._prepare_extra(kwargs)
         extra["level"] = "CRITICAL"
-        self.logger.critical(message, extra=extra)
+        self.logger.critical(message, *args, extra=extra)
+
+    def log_batch(
+        self, records: Iterable[Tuple[str, str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Log several records, sampling them under one sampler lock.
+
+        Args:
+            records: (level, message, fields) tuples, e.g.
+                ("INFO", "User login", {"user_id": 1})
+
+        Raises:
+            ValueError: If any record has an unknown level name; nothing
+                from the batch is sampled or logged
+        """
+        batch: List[Tuple[str, int, str, Dict[str, Any]]] = []
+        for level, message, fields in records:
+            level = level.upper()
+            levelno = logging.getLevelName(level)
+            if not isinstance(levelno, int):
+                raise ValueError(f"Unknown log level: {level}")
+            batch.append((level, levelno, message, fields))
+
+        if self.sampler and batch:
+            results = self.sampler.should_sample_batch(
+                [
+                    (level, fields.get("component"), message)
+                    for level, _, message, fields in batch
+                ]
+            )
+            batch = [
+                record
+                for record, result in zip(batch, results)
+                if result.should_log
+            ]
+
+        for level, levelno, message, fields in batch:
+            if self.metrics_generator:
+                self._process_metrics(message, level, **fields)
+
+            extra = self._prepare_extra(fields)
+            extra["level"] = level
+            self.logger.log(levelno, message, extra=extra)
 
     def _load_configuration(
         self,
@@ -537,6 +621,12 @@ class MohflowLogger(ContextualLogger):
             merged.update(enriched_extra)
             enriched_extra = merged
 
+        # Merge scoped context entered via request_context() and friends
+        scoped = self.context_manager.get_current_context()
+        if scoped:
+            scoped.update(enriched_extra)
+            enriched_extra = scoped
+
         # Apply context enrichment
         if self.context_enricher:
             enriched_extra = self.context_enricher.enrich_dict(enriched_extra)
@@ -14,7 +14,17 @@ This module provides:
 import re
 import time
 import threading
-from typing import Dict, Any, Optional, List, Tuple, Union, Pattern, Callable
+from typing import (
+    Dict,
+    Any,
+    Optional,
+    List,
+    Tuple,
+    Union,
+    Pattern,
+    Callable,
+    Sequence,
+)
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 from enum import Enum
@@ -441,15 +451,17 @@ class AutoMetricsGenerator:
                     continue
 
                 numeric_values = [v for v, _, _ in values]
+                total = sum(numeric_values)
+                p50, p95, p99 = self._percentiles(numeric_values, (50, 95, 99))
                 summary["histograms"][metric_name] = {
                     "count": len(numeric_values),
-                    "sum": sum(numeric_values),
+                    "sum": total,
                     "min": min(numeric_values),
                     "max": max(numeric_values),
-                    "avg": sum(numeric_values) / len(numeric_values),
-                    "p50": self._percentile(numeric_values, 50),
-                    "p95": self._percentile(numeric_values, 95),
-                    "p99": self._percentile(numeric_values, 99),
+                    "avg": total / len(numeric_values),
+                    "p50": p50,
+                    "p95": p95,
+                    "p99": p99,
                 }
 
             # Gauges
@@ -495,18 +507,30 @@ class AutoMetricsGenerator:
 
     def _percentile(self, values: List[float], percentile: float) -> float:
         """Calculate percentile of values."""
+        return self._percentiles(values, (percentile,))[0]
+
+    def _percentiles(
+        self, values: List[float], percentiles: Sequence[float]
+    ) -> List[float]:
+        """Calculate several percentiles of values with a single sort."""
         if not values:
-            return 0.0
+            return [0.0] * len(percentiles)
 
         sorted_values = sorted(values)
-        k = (len(sorted_values) - 1) * percentile / 100.0
-        f = int(k)
-        c = k - f
-
-        if f + 1 < len(sorted_values):
-            return sorted_values[f] * (1 - c) + sorted_values[f + 1] * c
-        else:
-            return sorted_values[f]
+        last = len(sorted_values) - 1
+        results = []
+        for percentile in percentiles:
+            k = last * percentile / 100.0
+            f = int(k)
+            c = k - f
+
+            if f < last:
+                results.append(
+                    sorted_values[f] * (1 - c) + sorted_values[f + 1] * c
+                )
+            else:
+                results.append(sorted_values[f])
+        return results
 
     def export_prometheus_metrics(self) -> str:
         """Export metrics in Prometheus format."""
@@ -544,8 +568,11 @@ class AutoMetricsGenerator:
                 )
 
                 # Quantiles
-                for quantile in [0.5, 0.9, 0.95, 0.99]:
-                    value = self._percentile(numeric_values, quantile * 100)
+                quantiles = (0.5, 0.9, 0.95, 0.99)
+                quantile_values = self._percentiles(
+                    numeric_values, [q * 100 for q in quantiles]
+                )
+                for quantile, value in zip(quantiles, quantile_values):
                     lines.append(
                         (
                             f'{metric_name}{{quantile="{quantile}"}} '
@@ -624,14 +651,17 @@ class AutoMetricsGenerator:
                         continue
 
                     numeric_values = [v for v, _, _ in values]
+                    p50, p95, p99 = self._percentiles(
+                        numeric_values, (50, 95, 99)
+                    )
                     latency_stats[metric_name] = {
                         "count": len(numeric_values),
                         "avg_ms": sum(numeric_values) / len(numeric_values),
                         "min_ms": min(numeric_values),
                         "max_ms": max(numeric_values),
-                        "p50_ms": self._percentile(numeric_values, 50),
-                        "p95_ms": self._percentile(numeric_values, 95),
-                        "p99_ms": self._percentile(numeric_values, 99),
+                        "p50_ms": p50,
+                        "p95_ms": p95,
+                        "p99_ms": p99,
                     }
 
         return latency_stats
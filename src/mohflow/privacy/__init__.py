@@ -13,6 +13,7 @@ from .pii_detector import (
     PIILevel,
     PIIDetectionResult,
     detect_pii,
+    detect_pii_batch,
     scan_for_pii,
     generate_privacy_report,
     get_pii_detector,
@@ -25,6 +26,7 @@ __all__ = [
     "PIILevel",
     "PIIDetectionResult",
     "detect_pii",
+    "detect_pii_batch",
     "scan_for_pii",
     "generate_privacy_report",
     "get_pii_detector",
@@ -9,10 +9,18 @@ classification techniques.
 import math
 import re
 import hashlib
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+import threading
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
 
+_DIGIT = re.compile(r"\d")
+_ASCII_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+# Bounds for detect_pii_cached
+_RESULT_CACHE_SIZE = 4096
+_MAX_CACHED_LENGTH = 512
+
 
 # PII Classification Levels
 class PIILevel(Enum):
@@ -37,6 +45,15 @@ class PIIDetectionResult:
     field_name: Optional[str] = None
 
 
+def _is_scannable(value: Any) -> bool:
+    """Return True for leaf values that can carry PII.
+
+    Booleans are skipped: they are ints, but their text is only ever
+    "True" or "False".
+    """
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
 class MLPIIDetector:
     """
     Machine Learning-based PII detector with pattern recognition.
@@ -63,6 +80,12 @@ class MLPIIDetector:
         self._setup_patterns()
         self._setup_ml_features()
 
+        # Memoized results keyed by a digest of the value, never the raw
+        # value, and stored without redacted_value (which keeps part of
+        # the original text), so cached entries don't keep PII in memory
+        self._result_cache: Dict[Tuple[bytes, Optional[str]], Any] = {}
+        self._cache_lock = threading.Lock()
+
     def _setup_patterns(self) -> None:
         """Setup regex patterns for known PII types."""
 
@@ -124,6 +147,26 @@ class MLPIIDetector:
             PIILevel.LOW: self.low_patterns,
         }
 
+        # Traits a value must have before a built-in pattern can match
+        # (see _text_traits); patterns whose traits are missing are
+        # skipped without running the regex
+        self.pattern_prerequisites = {
+            "ssn": {"digit"},
+            "credit_card": {"digit"},
+            "phone": {"digit"},
+            "passport": {"digit", "upper"},
+            "drivers_license": {"digit", "upper"},
+            "email": {"@", "."},
+            "ip_address": {"digit", "."},
+            "date_birth": {"digit"},
+            "bank_account": {"digit"},
+            "name": {"upper"},
+            "address": {"digit"},
+            "zip_code": {"digit"},
+            "medical_record": {"digit", "upper"},
+            "uuid": {"-"},
+        }
+
     def _setup_ml_features(self) -> None:
         """Setup ML-based feature extraction and classification."""
 
@@ -182,6 +225,16 @@ class MLPIIDetector:
             <= 20,  # Common PII length range
         }
 
+    def _text_traits(self, text: str) -> set:
+        """Collect the pattern prerequisites present in text."""
+        chars = set(text)
+        traits = chars.intersection("@.-")
+        if _DIGIT.search(text):
+            traits.add("digit")
+        if not chars.isdisjoint(_ASCII_UPPER):
+            traits.add("upper")
+        return traits
+
     def calculate_entropy(self, text: str) -> float:
         """Calculate Shannon entropy of text (bits per character)."""
         if not text:
@@ -328,8 +381,13 @@ class MLPIIDetector:
         max_confidence = 0.0
 
         # Pattern-based detection
+        traits = self._text_traits(text)
+        prerequisites = self.pattern_prerequisites
         for level, patterns in self.all_patterns.items():
             for pii_type, pattern in patterns.items():
+                required = prerequisites.get(pii_type)
+                if required and not required <= traits:
+                    continue
                 if pattern.search(text):
                     detected_types.append(pii_type)
                     if level.value != "none":
@@ -363,6 +421,86 @@ class MLPIIDetector:
             field_name=field_name,
         )
 
+    def detect_pii_cached(
+        self, value: Any, field_name: Optional[str] = None
+    ) -> PIIDetectionResult:
+        """
+        Detect PII like detect_pii, memoizing results for short strings.
+
+        Repeated values (common in logs) are served from a bounded cache
+        instead of re-running every pattern and the ML heuristics. Each
+        call returns its own copy, so callers may mutate the result.
+        """
+        if not isinstance(value, str) or len(value) > _MAX_CACHED_LENGTH:
+            return self.detect_pii(value, field_name)
+
+        digest = hashlib.blake2b(
+            value.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        key = (digest, field_name)
+
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+
+        if cached is None:
+            result = self.detect_pii(value, field_name)
+            cached = replace(
+                result,
+                detected_types=list(result.detected_types),
+                redacted_value="",
+            )
+            with self._cache_lock:
+                if len(self._result_cache) >= _RESULT_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._result_cache[next(iter(self._result_cache))]
+                self._result_cache[key] = cached
+            return result
+
+        # Blank values have no text to redact (see detect_pii)
+        redacted_value = (
+            self._redact_value(value, cached.level, cached.detected_types)
+            if cached.original_length
+            else ""
+        )
+        return replace(
+            cached,
+            detected_types=list(cached.detected_types),
+            redacted_value=redacted_value,
+        )
+
+    def detect_pii_batch(
+        self,
+        values: Iterable[Any],
+        field_names: Optional[Iterable[Optional[str]]] = None,
+    ) -> List[PIIDetectionResult]:
+        """
+        Detect PII in many values in one call.
+
+        Args:
+            values: Values to analyze
+            field_names: Optional field name per value, same length as values
+
+        Returns:
+            One PIIDetectionResult per value, in order
+        """
+        values = list(values)
+        if field_names is None:
+            names: List[Optional[str]] = [None] * len(values)
+        else:
+            names = list(field_names)
+            if len(names) != len(values):
+                raise ValueError(
+                    "field_names must have the same length as values"
+                )
+
+        detect = self.detect_pii_cached
+        return [detect(value, name) for value, name in zip(values, names)]
+
+    def clear_cache(self) -> None:
+        """Drop all memoized detection results."""
+        with self._cache_lock:
+            self._result_cache.clear()
+
     def _get_pattern_confidence(self, pii_type: str, text: str) -> float:
         """Get confidence score for pattern-based detection."""
         confidence_map = {
@@ -461,21 +599,21 @@ class MLPIIDetector:
                 for key, value in obj.items():
                     field_path = f"{path}.{key}" if path else key
 
-                    # Check the key itself for PII indicators
-                    if isinstance(value, (str, int, float)):
+                    # Recurse into nested structures; leaves are checked
+                    # here, once, with the key as context
+                    if isinstance(value, (dict, list, tuple)):
+                        _scan_recursive(value, field_path, depth + 1)
+                    elif _is_scannable(value):
                         result = self.detect_pii(value, field_name=key)
                         if result.level != PIILevel.NONE:
                             results[field_path] = result
 
-                    # Recurse into nested structures
-                    _scan_recursive(value, field_path, depth + 1)
-
             elif isinstance(obj, (list, tuple)):
                 for i, item in enumerate(obj):
                     field_path = f"{path}[{i}]"
                     _scan_recursive(item, field_path, depth + 1)
 
-            elif isinstance(obj, (str, int, float)) and obj is not None:
+            elif _is_scannable(obj):
                 result = self.detect_pii(obj)
                 if result.level != PIILevel.NONE:
                     results[path or "root"] = result
@@ -483,14 +621,27 @@ class MLPIIDetector:
         _scan_recursive(data, "", 0)
         return results
 
-    def get_privacy_report(self, data: Any) -> Dict[str, Any]:
+    def get_privacy_report(
+        self,
+        data: Any = None,
+        *,
+        detections: Optional[Dict[str, PIIDetectionResult]] = None,
+    ) -> Dict[str, Any]:
         """
         Generate a comprehensive privacy report for data.
 
+        Args:
+            data: Data structure to analyze
+            detections: Results of an earlier scan_data_structure(data)
+                call; when given, data is not scanned again
+
         Returns:
             Dictionary with privacy analysis and recommendations
         """
-        pii_results = self.scan_data_structure(data)
+        if detections is None:
+            pii_results = self.scan_data_structure(data)
+        else:
+            pii_results = detections
 
         # Aggregate statistics
         level_counts = {}
@@ -630,9 +781,18 @@ def get_pii_detector(
 def detect_pii(
     value: Any, field_name: Optional[str] = None
 ) -> PIIDetectionResult:
-    """Convenience function to detect PII in a value."""
+    """Convenience function to detect PII in a value (memoized)."""
+    detector = get_pii_detector()
+    return detector.detect_pii_cached(value, field_name)
+
+
+def detect_pii_batch(
+    values: Iterable[Any],
+    field_names: Optional[Iterable[Optional[str]]] = None,
+) -> List[PIIDetectionResult]:
+    """Convenience function to detect PII in many values."""
     detector = get_pii_detector()
-    return detector.detect_pii(value, field_name)
+    return detector.detect_pii_batch(values, field_names)
 
 
 def scan_for_pii(data: Any) -> Dict[str, PIIDetectionResult]:
@@ -641,7 +801,11 @@ def scan_for_pii(data: Any) -> Dict[str, PIIDetectionResult]:
     return detector.scan_data_structure(data)
 
 
-def generate_privacy_report(data: Any) -> Dict[str, Any]:
+def generate_privacy_report(
+    data: Any = None,
+    *,
+    detections: Optional[Dict[str, PIIDetectionResult]] = None,
+) -> Dict[str, Any]:
     """Convenience function to generate privacy report."""
     detector = get_pii_detector()
-    return detector.get_privacy_report(data)
+    return detector.get_privacy_report(data, detections=detections)
@@ -12,12 +12,23 @@ This module provides:
 import time
 import threading
 import random
-import hashlib
-from typing import Dict, Optional, Any
+import zlib
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from collections import deque
 from enum import Enum
 
+# Deterministic sampling compares a 32-bit fingerprint against
+# sample_rate * _FINGERPRINT_SPAN
+_FINGERPRINT_SPAN = 1 << 32
+
+
+@lru_cache(maxsize=4096)
+def _fingerprint(key: str) -> int:
+    """Return a 32-bit hash of key that is stable across processes."""
+    return zlib.crc32(key.encode())
+
 
 class SamplingStrategy(Enum):
     """Available sampling strategies."""
@@ -96,10 +107,10 @@ class SlidingWindowCounter:
                 current_time - (bucket_count - i) * self.bucket_seconds
             )
 
-    def increment(self, count: int = 1) -> None:
-        """Increment counter for current time."""
+    def increment(self, count: int = 1, now: Optional[float] = None) -> None:
+        """Increment counter for current time (or now, if given)."""
         with self._lock:
-            current_time = time.time()
+            current_time = time.time() if now is None else now
             self._cleanup_old_buckets(current_time)
 
             # Add to current bucket
@@ -117,10 +128,12 @@ class SlidingWindowCounter:
                 self.buckets.append(count)
                 self.bucket_timestamps.append(current_time)
 
-    def get_count(self, window_seconds: Optional[int] = None) -> int:
+    def get_count(
+        self, window_seconds: Optional[int] = None, now: Optional[float] = None
+    ) -> int:
         """Get count for specified window (or full window if None)."""
         with self._lock:
-            current_time = time.time()
+            current_time = time.time() if now is None else now
             self._cleanup_old_buckets(current_time)
 
             if window_seconds is None:
@@ -135,12 +148,14 @@ class SlidingWindowCounter:
 
             return total
 
-    def get_rate(self, window_seconds: Optional[int] = None) -> float:
+    def get_rate(
+        self, window_seconds: Optional[int] = None, now: Optional[float] = None
+    ) -> float:
         """Get rate (count per second) for specified window."""
         if window_seconds is None:
             window_seconds = self.window_seconds
 
-        count = self.get_count(window_seconds)
+        count = self.get_count(window_seconds, now)
         return count / window_seconds if window_seconds > 0 else 0.0
 
     def _cleanup_old_buckets(self, current_time: float) -> None:
@@ -229,71 +244,110 @@ class AdaptiveSampler:
             SamplingResult with decision and metadata
         """
         with self._lock:
-            # Periodic cleanup
-            self._maybe_cleanup()
+            return self._should_sample_locked(
+                level, component, message, time.time(), **kwargs
+            )
+
+    def should_sample_batch(
+        self,
+        requests: Sequence[Tuple[str, Optional[str], Optional[str]]],
+    ) -> List[SamplingResult]:
+        """
+        Determine sampling for several logs under a single lock acquisition.
+
+        The clock is read once and every request in the batch is counted
+        at that instant.
+
+        Args:
+            requests: (level, component, message) tuples, in log order
+
+        Returns:
+            One SamplingResult per request, in order
+        """
+        with self._lock:
+            now = time.time()
+            sample = self._should_sample_locked
+            return [
+                sample(level, component, message, now)
+                for level, component, message in requests
+            ]
+
+    def _should_sample_locked(
+        self,
+        level: str,
+        component: Optional[str],
+        message: Optional[str],
+        now: float,
+        **kwargs: Any,
+    ) -> SamplingResult:
+        """Sampling decision body; the caller must hold self._lock."""
+        # Periodic cleanup
+        self._maybe_cleanup(now)
 
-            # Increment total logs counter
-            self.total_logs.increment()
+        # Increment total logs counter
+        self.total_logs.increment(now=now)
 
-            # Update per-level counter
-            if level not in self.level_counters:
-                self.level_counters[level] = SlidingWindowCounter(
+        # Update per-level counter
+        if level not in self.level_counters:
+            self.level_counters[level] = SlidingWindowCounter(
+                window_seconds=self.config.window_size_seconds
+            )
+        self.level_counters[level].increment(now=now)
+
+        # Update per-component counter
+        if component:
+            if component not in self.component_counters:
+                self.component_counters[component] = SlidingWindowCounter(
                     window_seconds=self.config.window_size_seconds
                 )
-            self.level_counters[level].increment()
-
-            # Update per-component counter
-            if component:
-                if component not in self.component_counters:
-                    self.component_counters[component] = SlidingWindowCounter(
-                        window_seconds=self.config.window_size_seconds
-                    )
-                self.component_counters[component].increment()
-
-            # Check rate limiting first
-            rate_limit_result = self._check_rate_limits()
-            if not rate_limit_result.should_log:
+            self.component_counters[component].increment(now=now)
+
+        # Check rate limiting first; no counters means no limits configured
+        if self.rate_limit_counter or self.burst_counter:
+            rate_limit_result = self._check_rate_limits(now)
+            if rate_limit_result is not None:
                 return rate_limit_result
 
-            # Determine sampling rate to use
-            sample_rate = self._get_effective_sample_rate(level, component)
+        # Determine sampling rate to use
+        sample_rate = self._get_effective_sample_rate(level, component)
 
-            # Make sampling decision
-            should_log = self._make_sampling_decision(
-                sample_rate, level, message, **kwargs
-            )
+        # Make sampling decision
+        should_log = self._make_sampling_decision(
+            sample_rate, level, message, **kwargs
+        )
 
-            # Update adaptive sampling if enabled
-            if self.config.enable_adaptive:
-                self._update_adaptive_sampling()
+        # Update adaptive sampling if enabled
+        if self.config.enable_adaptive:
+            self._update_adaptive_sampling(now)
 
-            # Record sampling result
-            if should_log:
-                self.sampled_logs.increment()
+        # Record sampling result
+        if should_log:
+            self.sampled_logs.increment(now=now)
 
-            return SamplingResult(
-                should_log=should_log,
-                sample_rate_used=sample_rate,
-                strategy_used=self.config.strategy,
-                reason=(
-                    f"Sampling at {sample_rate:.3f} rate using "
-                    f"{self.config.strategy.value} strategy"
-                ),
-                stats={
-                    "total_rate": self.total_logs.get_rate(60),
-                    "sampled_rate": self.sampled_logs.get_rate(60),
-                    "effective_sample_rate": sample_rate,
-                },
-            )
+        return SamplingResult(
+            should_log=should_log,
+            sample_rate_used=sample_rate,
+            strategy_used=self.config.strategy,
+            reason=(
+                f"Sampling at {sample_rate:.3f} rate using "
+                f"{self.config.strategy.value} strategy"
+            ),
+            stats={
+                "total_rate": self.total_logs.get_rate(60, now),
+                "sampled_rate": self.sampled_logs.get_rate(60, now),
+                "effective_sample_rate": sample_rate,
+            },
+        )
 
-    def _check_rate_limits(self) -> SamplingResult:
-        """Check if rate limits allow logging."""
+    def _check_rate_limits(self, now: float) -> Optional[SamplingResult]:
+        """Return a drop result if a rate limit is hit, else None."""
 
         # Check burst limit
         if (
             self.config.burst_limit
             and self.burst_counter
-            and self.burst_counter.get_count() >= self.config.burst_limit
+            and self.burst_counter.get_count(now=now)
+            >= self.config.burst_limit
         ):
             return SamplingResult(
                 should_log=False,
@@ -309,7 +363,7 @@ class AdaptiveSampler:
         if (
             self.config.max_logs_per_second
             and self.rate_limit_counter
-            and self.rate_limit_counter.get_rate(1)
+            and self.rate_limit_counter.get_rate(1, now)
             >= self.config.max_logs_per_second
         ):
             return SamplingResult(
@@ -324,16 +378,11 @@ class AdaptiveSampler:
 
         # Rate limits passed
         if self.rate_limit_counter:
-            self.rate_limit_counter.increment()
+            self.rate_limit_counter.increment(now=now)
         if self.burst_counter:
-            self.burst_counter.increment()
+            self.burst_counter.increment(now=now)
 
-        return SamplingResult(
-            should_log=True,
-            sample_rate_used=1.0,
-            strategy_used=SamplingStrategy.RATE_LIMITED,
-            reason="Rate limits passed",
-        )
+        return None
 
     def _get_effective_sample_rate(
         self, level: str, component: Optional[str]
@@ -373,30 +422,20 @@ class AdaptiveSampler:
         if sample_rate <= 0.0:
             return False
 
-        if self.config.strategy == SamplingStrategy.RANDOM:
-            return self._random.random() < sample_rate
-
-        elif self.config.strategy == SamplingStrategy.DETERMINISTIC:
+        if self.config.strategy is SamplingStrategy.DETERMINISTIC:
             # Use hash of message/context for deterministic sampling
             hash_input = (
                 f"{level}:{message or ''}:{kwargs.get('component', '')}"
             )
-            hash_value = int(
-                hashlib.sha256(hash_input.encode()).hexdigest(), 16
-            )
-            return (hash_value % 10000) < (sample_rate * 10000)
-
-        elif self.config.strategy == SamplingStrategy.ADAPTIVE:
-            # Adaptive uses random but adjusts rate based on load
-            return self._random.random() < sample_rate
+            return _fingerprint(hash_input) < sample_rate * _FINGERPRINT_SPAN
 
-        else:
-            # Default to random
-            return self._random.random() < sample_rate
+        # Every other strategy is a random draw; adaptive sampling only
+        # changes sample_rate, and unknown strategies fall back to random
+        return self._random.random() < sample_rate
 
-    def _update_adaptive_sampling(self) -> None:
+    def _update_adaptive_sampling(self, now: Optional[float] = None) -> None:
         """Update adaptive sampling rate based on current load."""
-        current_time = time.time()
+        current_time = time.time() if now is None else now
 
         # Update adaptive sampling every window
         if (
@@ -405,7 +444,7 @@ class AdaptiveSampler:
         ):
 
             current_rate = self.total_logs.get_rate(
-                self.config.adaptive_window_seconds
+                self.config.adaptive_window_seconds, current_time
             )
             target_rate = self.config.adaptive_target_rate
 
@@ -429,9 +468,9 @@ class AdaptiveSampler:
 
             self._last_adaptive_update = current_time
 
-    def _maybe_cleanup(self) -> None:
+    def _maybe_cleanup(self, now: Optional[float] = None) -> None:
         """Periodic cleanup of old data."""
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         if (
             current_time - self._last_cleanup
             >= self.config.cleanup_interval_seconds
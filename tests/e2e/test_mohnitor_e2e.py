@@ -651,12 +651,11 @@ class TestForwardingHandler:
             logger.info("handler test message")
 
             # Event should be in the queue
-            assert not handler.log_queue.empty()
-            queued = handler.log_queue.get_nowait()
-            assert queued["type"] == "log_event"
-            assert queued["payload"]["message"] == "handler test message"
-            assert queued["payload"]["level"] == "INFO"
-            assert queued["payload"]["service"] == "handler-test"
+            assert handler.log_queue
+            queued = json.loads(handler.log_queue.popleft())
+            assert queued["message"] == "handler test message"
+            assert queued["level"] == "INFO"
+            assert queued["service"] == "handler-test"
         finally:
             logger.removeHandler(handler)
             handler.close()
@@ -680,7 +679,7 @@ class TestForwardingHandler:
                 logger.info(f"msg-{i}")
 
             # Should not crash, queue should be at max 2
-            assert handler.log_queue.qsize() <= 2
+            assert len(handler.log_queue) <= 2
         finally:
             logger.removeHandler(handler)
             handler.close()
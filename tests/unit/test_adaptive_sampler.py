@@ -12,6 +12,7 @@ from mohflow.sampling.adaptive_sampler import (
     SamplingResult,
     SamplingStrategy,
     SlidingWindowCounter,
+    _fingerprint,
     create_development_sampler,
     create_high_volume_sampler,
     create_production_sampler,
@@ -321,6 +322,63 @@ class TestShouldSampleBasic:
         assert "random" in result.reason.lower() or "0.5" in result.reason
 
 
+# -----------------------------------------------------------
+# AdaptiveSampler.should_sample_batch
+# -----------------------------------------------------------
+
+
+class TestShouldSampleBatch:
+    """Batch decisions match per-call decisions and update stats."""
+
+    def test_one_result_per_request(self):
+        cfg = SamplingConfig(
+            sample_rate=1.0, level_sample_rates={"DEBUG": 0.0}
+        )
+        sampler = AdaptiveSampler(cfg)
+        results = sampler.should_sample_batch(
+            [("INFO", None, "a"), ("DEBUG", None, "b"), ("ERROR", "db", "c")]
+        )
+        assert [r.should_log for r in results] == [True, False, True]
+
+    def test_counters_updated(self):
+        sampler = AdaptiveSampler(SamplingConfig(sample_rate=1.0))
+        sampler.should_sample_batch([("INFO", "api", None)] * 5)
+        stats = sampler.get_stats()
+        assert stats["total_logs_count"] == 5
+        assert stats["sampled_logs_count"] == 5
+        assert stats["component_stats"]["api"]["count"] == 5
+
+    def test_clock_read_once_per_batch(self):
+        cfg = SamplingConfig(
+            sample_rate=0.5, max_logs_per_second=1000, burst_limit=2000
+        )
+        sampler = AdaptiveSampler(cfg)
+        requests = [("INFO", "api", "m")] * 10
+        sampler.should_sample_batch(requests)  # create per-key counters
+        with patch(
+            "mohflow.sampling.adaptive_sampler.time.time",
+            return_value=time.time(),
+        ) as mock_time:
+            sampler.should_sample_batch(requests)
+        assert mock_time.call_count == 1
+
+    def test_empty_batch(self):
+        sampler = AdaptiveSampler(SamplingConfig())
+        assert sampler.should_sample_batch([]) == []
+
+    def test_deterministic_matches_single_calls(self):
+        cfg = SamplingConfig(
+            sample_rate=0.5, strategy=SamplingStrategy.DETERMINISTIC
+        )
+        requests = [("INFO", None, f"msg-{i}") for i in range(20)]
+        batch = AdaptiveSampler(cfg).should_sample_batch(requests)
+        single = AdaptiveSampler(cfg)
+        assert [r.should_log for r in batch] == [
+            single.should_sample(level, component, message).should_log
+            for level, component, message in requests
+        ]
+
+
 # -----------------------------------------------------------
 # Per-level sampling
 # -----------------------------------------------------------
@@ -496,6 +554,22 @@ class TestDeterministicSampling:
         result = sampler.should_sample(level="INFO", message="hi")
         assert result.should_log is False
 
+    def test_deterministic_rate_is_respected(self):
+        cfg = SamplingConfig(
+            sample_rate=0.1,
+            strategy=SamplingStrategy.DETERMINISTIC,
+        )
+        sampler = AdaptiveSampler(cfg)
+        kept = sum(
+            sampler.should_sample(level="INFO", message=f"m{i}").should_log
+            for i in range(5000)
+        )
+        assert 350 < kept < 650
+
+    def test_deterministic_decision_stable_across_processes(self):
+        # The fingerprint must not depend on PYTHONHASHSEED
+        assert _fingerprint("INFO:Login attempt:") == 0xB60B765C
+
 
 # -----------------------------------------------------------
 # Random sampling strategy
@@ -980,6 +1054,12 @@ class TestEdgeCases:
         # Should still produce both outcomes via the default
         assert outcomes == {True, False}
 
+    def test_rate_limit_check_skipped_without_limits(self):
+        sampler = AdaptiveSampler(SamplingConfig(sample_rate=1.0))
+        with patch.object(sampler, "_check_rate_limits") as mock_check:
+            assert sampler.should_sample(level="INFO").should_log
+        mock_check.assert_not_called()
+
     def test_kwargs_forwarded_to_sampling_decision(self):
         cfg = SamplingConfig(
             sample_rate=0.5,
@@ -694,6 +694,14 @@ class TestPercentile:
         p50 = self.gen._percentile(values, 50)
         assert p50 == 30.0
 
+    def test_percentiles_match_single_calls(self):
+        values = [50.0, 10.0, 30.0, 20.0, 40.0, 7.0]
+        expected = [self.gen._percentile(values, p) for p in (0, 50, 95, 100)]
+        assert self.gen._percentiles(values, (0, 50, 95, 100)) == expected
+
+    def test_percentiles_empty(self):
+        assert self.gen._percentiles([], (50, 99)) == [0.0, 0.0]
+
 
 # ──────────────────────────────────────────────────────────────
 # AutoMetricsGenerator – get_metrics_summary
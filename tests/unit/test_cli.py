@@ -2,6 +2,8 @@
 
 import pytest
 import io
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 from mohflow.cli import MohflowCLI, main
 
@@ -68,6 +70,25 @@ class TestMohflowCLI:
             enable_auto_config=True,
         )
 
+    @patch("mohflow.cli.MohflowLogger")
+    def test_create_logger_from_config_dict(self, mock_logger_class):
+        """Test logger creation from the merged config dict run() uses."""
+        config = {
+            "service_name": "test-service",
+            "log_level": "WARNING",
+            "loki_url": None,
+            "console_logging": False,
+        }
+
+        self.cli.create_logger(config)
+
+        mock_logger_class.assert_called_once_with(
+            service_name="test-service",
+            log_level="WARNING",
+            environment="development",
+            enable_auto_config=False,
+        )
+
     @patch("builtins.open")
     @patch("json.load")
     def test_validate_config_valid_file(self, mock_json_load, mock_open):
@@ -346,3 +367,25 @@ class TestMohflowCLI:
         # This would test the actual argument parser setup
         # but requires mocking sys.argv or using subprocess
         pass
+
+    def test_import_does_not_load_logger(self):
+        """Importing the CLI leaves the logger stack unimported."""
+        code = (
+            "import sys, mohflow.cli; "
+            "print('mohflow.logger.base' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_parser_accepts_clustered_short_options(self):
+        """Short flags can be combined, as argparse allows."""
+        args = self.cli.parser.parse_args(["-is", "svc"])
+        assert args.interactive is True
+        assert args.service_name == "svc"
+        assert args.test_logging is False
+        assert args.validate_config is False
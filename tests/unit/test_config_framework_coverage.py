@@ -12,6 +12,7 @@ import json
 import os
 import platform
 import subprocess
+import sys
 from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import (
@@ -33,6 +34,7 @@ from mohflow.auto_config import (
 )
 from mohflow.config_loader import (
     ConfigLoader,
+    _load_schema_file,
     load_config,
 )
 from mohflow.exceptions import ConfigurationError
@@ -1397,8 +1399,19 @@ class TestConfigLoaderLoadSchema:
         with pytest.raises(ConfigurationError, match="schema not found"):
             loader._load_schema()
 
+    def test_load_schema_shared_across_loaders(self):
+        first = ConfigLoader()._load_schema()
+        second = ConfigLoader()._load_schema()
+        assert first is second
+        with pytest.raises(TypeError):
+            first["title"] = "changed"
+        with pytest.raises(TypeError):
+            first["properties"]["service_name"] = {}
+        assert isinstance(first["required"], tuple)
+
     def test_load_schema_invalid_json(self):
         loader = ConfigLoader()
+        _load_schema_file.cache_clear()
         with patch(
             "builtins.open",
             mock_open(read_data="not json{{{"),
@@ -1439,6 +1452,13 @@ class TestConfigLoaderLoadJsonConfig:
         result = loader._load_json_config()
         assert result == {"service_name": "test"}
 
+    def test_keys_are_interned(self, tmp_path):
+        cfg_file = tmp_path / "config.json"
+        cfg_file.write_text(json.dumps({"service_name": "test"}))
+        loader = ConfigLoader(config_file=str(cfg_file))
+        (key,) = loader._load_json_config()
+        assert key is sys.intern("service_name")
+
     def test_invalid_json(self, tmp_path):
         cfg_file = tmp_path / "bad.json"
         cfg_file.write_text("not valid json{{{")
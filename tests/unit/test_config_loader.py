@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import os
 from unittest.mock import patch, mock_open
 from mohflow.config_loader import ConfigLoader
 
@@ -136,6 +137,30 @@ class TestConfigLoader:
 
         assert result == base
 
+    def test_merge_configs_does_not_modify_inputs(self):
+        """Test merged nested dicts are copies of the inputs."""
+        base = {"handlers": {"loki": {"batch_size": 100}}}
+        override = {"handlers": {"loki": {"timeout": 5}}}
+
+        result = self.loader._merge_configs(base, override)
+        result["handlers"]["loki"]["batch_size"] = 1
+
+        assert base == {"handlers": {"loki": {"batch_size": 100}}}
+        assert override == {"handlers": {"loki": {"timeout": 5}}}
+        assert result["handlers"]["loki"] is not base["handlers"]["loki"]
+
+    def test_load_config_merges_runtime_over_defaults(self):
+        """Test nested runtime values merge into the default config."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = self.loader.load_config(
+                service_name="svc",
+                handlers={"loki": {"batch_size": 10}},
+            )
+
+        assert config["handlers"]["loki"]["batch_size"] == 10
+        assert config["handlers"]["loki"]["timeout"] == 10
+        assert config["handlers"]["file"]["backup_count"] == 5
+
     def test_validate_config_success(self):
         """Test successful configuration validation."""
         config = {
@@ -234,3 +234,43 @@ class TestClassifyField:
         assert (
             median_time < 0.1
         ), f"Performance test failed: median {median_time:.3f}s > 0.1s"
+
+    def test_classify_field_results_cached_per_name(self):
+        """Test repeated names are classified once and keep their casing"""
+        filter_obj = SensitiveDataFilter(exclude_tracing_fields=True)
+
+        first = filter_obj.classify_field("Trace_ID")
+        assert filter_obj.classify_field("Trace_ID") is first
+        assert filter_obj.classify_field("trace_id").field_name == "trace_id"
+        assert first.field_name == "Trace_ID"
+
+    def test_classify_field_cache_invalidated_on_changes(self):
+        """Test field and pattern changes are seen by later classifications"""
+        filter_obj = SensitiveDataFilter(exclude_tracing_fields=True)
+
+        assert (
+            filter_obj.classify_field("order_ref").classification
+            == FieldType.NEUTRAL
+        )
+        filter_obj.add_safe_field("order_ref")
+        assert (
+            filter_obj.classify_field("order_ref").classification
+            == FieldType.TRACING
+        )
+        filter_obj.remove_safe_field("order_ref")
+        assert (
+            filter_obj.classify_field("order_ref").classification
+            == FieldType.NEUTRAL
+        )
+
+        filter_obj.add_sensitive_field("order_ref")
+        assert (
+            filter_obj.classify_field("order_ref").classification
+            == FieldType.SENSITIVE
+        )
+
+        filter_obj.exclude_tracing_fields = False
+        assert (
+            filter_obj.classify_field("trace_id").classification
+            == FieldType.NEUTRAL
+        )
@@ -278,3 +278,49 @@ class TestEnhancedFilterData:
         # Should have processed the data (may truncate circular parts)
         assert isinstance(result, FilterResult)
         assert result.filtered_data is not None
+
+    def test_filter_data_deep_nesting_beyond_recursion_limit(self):
+        """Test filter_data walks nesting deeper than the recursion limit"""
+        import sys
+
+        filter_obj = SensitiveDataFilter()
+        depth = sys.getrecursionlimit() + 100
+
+        data = {"password": "secret"}
+        for _ in range(depth):
+            data = {"child": [data]}
+
+        result = filter_obj.filter_data_with_audit(data)
+
+        node = result.filtered_data
+        for _ in range(depth):
+            node = node["child"][0]
+        assert node == {"password": "[REDACTED]"}
+        assert len(result.redacted_fields) == 1
+        assert result.redacted_fields[0].endswith("child[0].password")
+
+    def test_filter_data_shared_reference_not_circular(self):
+        """Test a container referenced twice is filtered at both places"""
+        filter_obj = SensitiveDataFilter()
+        shared = {"password": "secret", "name": "x"}
+
+        result = filter_obj.filter_data_with_audit([shared, {"s": shared}])
+
+        assert result.filtered_data == [
+            {"password": "[REDACTED]", "name": "x"},
+            {"s": {"password": "[REDACTED]", "name": "x"}},
+        ]
+        assert result.redacted_fields == ["[0].password", "[1].s.password"]
+
+    def test_filter_data_processing_time_ignores_wall_clock(self):
+        """Test processing_time uses a monotonic clock, not time.time()"""
+        from unittest.mock import patch
+
+        filter_obj = SensitiveDataFilter()
+        wall_clock = iter([1000.0, 999.0, 998.0])
+
+        with patch("time.time", side_effect=lambda: next(wall_clock)):
+            result = filter_obj.filter_data_with_audit({"password": "x"})
+
+        assert result.processing_time >= 0
+        assert result.redacted_fields == ["password"]
@@ -137,3 +137,11 @@ class TestFieldClassification:
 
         assert classification1 == classification2
         assert classification1 != classification3
+
+    def test_field_classification_uses_slots(self):
+        """Test FieldClassification instances carry no __dict__"""
+        classification = FieldClassification("user_id", FieldType.NEUTRAL)
+
+        assert not hasattr(classification, "__dict__")
+        with pytest.raises(AttributeError):
+            classification.extra = True
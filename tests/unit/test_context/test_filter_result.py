@@ -218,3 +218,11 @@ class TestFilterResult:
         assert result.filtered_data == nested_data
         assert "user.credentials" in result.redacted_fields
         assert "user.correlation_id" in result.preserved_fields
+
+    def test_filter_result_uses_slots(self):
+        """Test FilterResult instances carry no per-instance __dict__"""
+        result = FilterResult({}, [], [], 0.0)
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = True
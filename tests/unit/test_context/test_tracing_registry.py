@@ -182,6 +182,54 @@ class TestTracingFieldRegistry:
         assert "removable_field" not in registry.custom_fields
         assert registry.is_tracing_field("removable_field") is False
 
+    def test_custom_fields_is_read_only(self):
+        """Test custom_fields can't drift from the lookup set"""
+        registry = TracingFieldRegistry()
+        registry.add_custom_field("my_trace_key")
+
+        with pytest.raises(AttributeError):
+            registry.custom_fields.add("other_trace_key")
+        with pytest.raises(AttributeError):
+            registry.custom_fields = {"other_trace_key"}
+
+        assert registry.custom_fields == {"my_trace_key"}
+        assert registry.is_tracing_field("my_trace_key") is True
+        assert registry.is_tracing_field("other_trace_key") is False
+
+    def test_add_custom_pattern(self):
+        """Test custom patterns join the fused tracing regex"""
+        registry = TracingFieldRegistry()
+
+        assert registry.get_tracing_match("order_ref") is None
+        registry.add_custom_pattern(r".*_ref$")
+        assert registry.custom_patterns == [r".*_ref$"]
+        assert registry.get_tracing_match("order_ref") == r".*_ref$"
+        assert registry.get_tracing_match("trace_x") == r"^trace_.*"
+
+        with pytest.raises(ValueError, match="Invalid regex"):
+            registry.add_custom_pattern("[unclosed")
+
+    def test_is_tracing_field_agrees_with_get_tracing_match(self):
+        """Test the boolean fast path matches get_tracing_match"""
+        for case_sensitive in (False, True):
+            registry = TracingFieldRegistry(case_sensitive=case_sensitive)
+            registry.add_custom_field("Order_Ref")
+            for name in (
+                "trace_id",
+                "TRACE_ID",
+                "order_ref",
+                "Order_Ref",
+                "Span_x",
+                "user_request_id",
+                "user_id",
+                "",
+                "  ",
+                None,
+            ):
+                assert registry.is_tracing_field(name) is (
+                    registry.get_tracing_match(name) is not None
+                )
+
     def test_remove_custom_field_not_affect_builtin(self):
         """Test remove_custom_field does not affect built-in fields"""
         registry = TracingFieldRegistry()
@@ -1,10 +1,25 @@
 """Tests for devui/client.py to improve coverage."""
 
+import json
 import logging
 import queue
 import pytest
 from unittest.mock import patch, MagicMock
-from mohflow.devui.client import MohnitorForwardingHandler
+from datetime import datetime, timezone
+from mohflow.devui.client import (
+    SEND_BATCH_SIZE,
+    _HOSTNAME,
+    MohnitorForwardingHandler,
+    _iso_timestamp,
+)
+from mohflow.devui.types import LogEvent
+
+
+class _Text(str):
+    """str subclass whose str() differs from its value."""
+
+    def __str__(self):
+        return "custom"
 
 
 class TestMohnitorForwardingHandler:
@@ -36,7 +51,99 @@ class TestMohnitorForwardingHandler:
                 exc_info=None,
             )
             handler.emit(record)
-            assert handler.log_queue.qsize() == 1
+            assert len(handler.log_queue) == 1
+            handler.should_stop = True
+
+    def test_emit_payload_matches_log_event(self):
+        with patch.object(
+            MohnitorForwardingHandler,
+            "_sender_loop",
+        ):
+            handler = MohnitorForwardingHandler(service="test")
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="test.py",
+                lineno=1,
+                msg="hello %s",
+                args=("world",),
+                exc_info=None,
+            )
+            handler.emit(record)
+            event = handler.log_queue.popleft()
+            expected = LogEvent(
+                timestamp=datetime.fromtimestamp(record.created, timezone.utc),
+                level="ERROR",
+                service="test",
+                message="hello world",
+                logger="test",
+                source_host=_HOSTNAME,
+                source_pid=record.process,
+            ).to_dict()
+            assert json.loads(event) == expected
+            handler.should_stop = True
+
+    def test_emit_skips_levels_log_event_rejects(self):
+        with patch.object(
+            MohnitorForwardingHandler,
+            "_sender_loop",
+        ):
+            handler = MohnitorForwardingHandler(service="test")
+            record = logging.LogRecord(
+                name="test",
+                level=logging.WARNING,
+                pathname="test.py",
+                lineno=1,
+                msg="hello",
+                args=None,
+                exc_info=None,
+            )
+            handler.emit(record)
+            assert len(handler.log_queue) == 0
+            handler.should_stop = True
+
+    @pytest.mark.parametrize(
+        "msg, args",
+        [
+            ("plain", None),
+            ("100%", ()),
+            ("value %d", (7,)),
+            (ValueError("boom"), None),
+            (_Text("x"), None),
+        ],
+    )
+    def test_emit_message_matches_get_message(self, msg, args):
+        with patch.object(
+            MohnitorForwardingHandler,
+            "_sender_loop",
+        ):
+            handler = MohnitorForwardingHandler(service="test")
+            record = logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=1,
+                msg=msg,
+                args=args,
+                exc_info=None,
+            )
+            handler.emit(record)
+            event = json.loads(handler.log_queue.popleft())
+            assert event["message"] == record.getMessage()
+            handler.should_stop = True
+
+    def test_drain_queue_caps_batch_size(self):
+        with patch.object(
+            MohnitorForwardingHandler,
+            "_sender_loop",
+        ):
+            handler = MohnitorForwardingHandler(service="test")
+            events = [str(i) for i in range(SEND_BATCH_SIZE + 5)]
+            for event in events:
+                handler.log_queue.append(event)
+            assert handler._drain_queue() == events[:SEND_BATCH_SIZE]
+            assert handler._drain_queue() == events[SEND_BATCH_SIZE:]
+            assert handler._drain_queue() == []
             handler.should_stop = True
 
     def test_emit_queue_full(self):
@@ -55,8 +162,10 @@ class TestMohnitorForwardingHandler:
                 exc_info=None,
             )
             handler.emit(record)
-            handler.emit(record)  # Queue full
-            assert handler.log_queue.qsize() == 1
+            record.msg = "newer"
+            handler.emit(record)  # Queue full, oldest event dropped
+            assert len(handler.log_queue) == 1
+            assert json.loads(handler.log_queue[0])["message"] == "newer"
             handler.should_stop = True
 
     def test_emit_error_suppressed(self):
@@ -65,9 +174,9 @@ class TestMohnitorForwardingHandler:
             "_sender_loop",
         ):
             handler = MohnitorForwardingHandler(service="test")
-            # Break LogEvent creation
+            # Break event creation
             with patch(
-                "mohflow.devui.client.LogEvent",
+                "mohflow.devui.client._iso_timestamp",
                 side_effect=Exception("boom"),
             ):
                 record = logging.LogRecord(
@@ -82,6 +191,14 @@ class TestMohnitorForwardingHandler:
                 handler.emit(record)  # Should not raise
             handler.should_stop = True
 
+    @pytest.mark.parametrize(
+        "created",
+        [0.5, 1700000000.0, 1700000000.9999996, 1700000000.123456],
+    )
+    def test_iso_timestamp_matches_datetime(self, created):
+        expected = datetime.fromtimestamp(created, timezone.utc).isoformat()
+        assert _iso_timestamp(created) == expected
+
     def test_close(self):
         with patch.object(
             MohnitorForwardingHandler,
@@ -102,3 +219,28 @@ class TestMohnitorForwardingHandler:
         with patch("mohflow.devui.client.websockets", None):
             handler._sender_loop()
         handler.should_stop = True
+
+    def test_sender_loop_backs_off_exponentially(self):
+        with patch.object(
+            MohnitorForwardingHandler,
+            "_sender_loop",
+        ):
+            handler = MohnitorForwardingHandler(service="test")
+
+        delays = []
+
+        def record_wait(timeout):
+            delays.append(timeout)
+            if len(delays) == 8:
+                handler.should_stop = True
+            return False
+
+        fake_websockets = MagicMock()
+        fake_websockets.connect.side_effect = OSError("refused")
+        handler._closing.wait = record_wait
+        with patch("mohflow.devui.client.websockets", fake_websockets):
+            handler._sender_loop()
+
+        expected = [0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+        for delay, base in zip(delays, expected):
+            assert base <= delay <= base * 1.5
@@ -190,6 +190,35 @@ class TestContextEnricher:
         # Same process_id from cache
         assert r1["process_id"] == r2["process_id"]
 
+    def test_system_info_thread_id_per_thread(self):
+        import threading
+
+        enricher = ContextEnricher(
+            include_system_info=True,
+            include_timestamp=False,
+            include_global_context=False,
+            include_request_context=False,
+        )
+        enricher.enrich_dict({})  # populate the process cache
+        results = {}
+
+        def worker():
+            results["ident"] = threading.get_ident()
+            results["enriched"] = enricher.enrich_dict({})
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert results["enriched"]["thread_id"] == results["ident"]
+
+    def test_process_info_reset(self):
+        from mohflow.context import enrichment
+
+        enrichment._get_process_info()
+        enrichment._reset_process_info()
+        assert enrichment._process_info is None
+        assert "hostname" in enrichment._get_process_info()
+
 
 class TestContextFunctions:
     def test_set_get_clear_request_context(self):
@@ -2,9 +2,11 @@
 
 import json
 import pytest
+import re
 from mohflow.context.filters import (
     SensitiveDataFilter,
     HTTPDataFilter,
+    _fuse_patterns,
 )
 
 
@@ -104,6 +106,48 @@ class TestSensitiveDataFilterMethods:
         result = f.filter_data({"api_key": "sk-abc123xyz"})
         assert result["api_key"] == f.redaction_text
 
+    def test_clear_sensitive_patterns_updates_field_checks(self):
+        f = SensitiveDataFilter(sensitive_fields=set())
+        f.sensitive_fields_lower.clear()
+        assert f._is_sensitive_field("user_password") is True
+        f.clear_sensitive_patterns()
+        assert f._is_sensitive_field("user_password") is False
+
+    def test_invalid_regex_pattern_matches_as_substring(self):
+        f = SensitiveDataFilter(additional_patterns=["secret[("])
+        assert f._is_sensitive_field("my_SECRET[(_value") is True
+        assert f._is_sensitive_field("username") is False
+
+    def test_unfusable_patterns_compiled_individually(self):
+        # A leading global flag is invalid once joined into an alternation
+        f = SensitiveDataFilter(additional_patterns=["(?i)^PIN$"])
+        assert len(f._sensitive_res) == len(f.sensitive_patterns)
+        assert f._is_sensitive_field("pin") is True
+        assert f._is_sensitive_field("user_name") is False
+
+
+class TestFusePatterns:
+    def test_plain_patterns_fused(self):
+        fused = _fuse_patterns(["^a$", "^b$"], re.IGNORECASE)
+        assert len(fused) == 1
+        assert fused[0].search("B")
+
+    def test_global_flag_not_spread_to_other_patterns(self):
+        compiled = _fuse_patterns(["(?i)^pin$", "^Token$"])
+        assert len(compiled) == 2
+        assert not any(p.search("TOKEN") for p in compiled)
+        assert any(p.search("PIN") for p in compiled)
+
+    def test_numbered_backreference_not_fused(self):
+        compiled = _fuse_patterns(["^x$", r"^(\w)\1$"])
+        assert len(compiled) == 2
+        assert any(p.search("aa") for p in compiled)
+        assert not any(p.search("ab") for p in compiled)
+
+    def test_duplicate_group_names_not_fused(self):
+        compiled = _fuse_patterns(["(?P<k>a)", "(?P<k>b)"])
+        assert len(compiled) == 2
+
 
 class TestHTTPDataFilter:
     def test_init_creates_filter(self):
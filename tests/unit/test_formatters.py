@@ -132,6 +132,19 @@ class TestOrjsonFormatter:
         data = json.loads(output)
         assert "stack_info" in data
 
+    def test_handler_writes_one_line_per_record(self):
+        import io
+
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(OrjsonFormatter())
+        handler.emit(_make_record())
+        handler.emit(_make_record())
+        lines = stream.getvalue().split("\n")
+        assert lines[-1] == ""
+        assert len(lines) == 3
+        assert all(json.loads(line) for line in lines[:-1])
+
     def test_indent_option(self):
         fmt = OrjsonFormatter(indent=2)
         record = _make_record()
@@ -160,6 +173,17 @@ class TestOrjsonFormatter:
         result = fmt._json_default(set([1, 2, 3]))
         assert isinstance(result, str)
 
+    def test_format_non_serializable_extra(self):
+        class Obj:
+            def __init__(self):
+                self.x = 1
+
+        fmt = OrjsonFormatter()
+        record = _make_record(tags={1, 2}, obj=Obj())
+        data = json.loads(fmt.format(record))
+        assert isinstance(data["tags"], str)
+        assert data["obj"] == {"x": 1}
+
 
 class TestFastJSONFormatter:
     """Test FastJSONFormatter presets."""
@@ -433,6 +433,27 @@ class TestHubWebSocket:
 
         assert len(self.hub.event_buffer) == 1
 
+    @pytest.mark.asyncio
+    async def test_ws_client_log_batch(self):
+        """Every event in a log_batch frame is buffered."""
+        self.hub.performance_enabled = False
+        from starlette.testclient import TestClient
+
+        client = TestClient(self.hub.app)
+        events = [
+            _make_log_event(message=f"msg {i}").to_dict() for i in range(3)
+        ]
+        events.insert(1, {"level": "INFO"})  # malformed, skipped
+
+        with client.websocket_connect("/ws?service=svc") as ws:
+            ws.send_text(json.dumps({"type": "log_batch", "payload": events}))
+            import time
+
+            time.sleep(0.05)
+
+        messages = [event.message for event in self.hub.event_buffer]
+        assert messages == ["msg 0", "msg 1", "msg 2"]
+
     @pytest.mark.asyncio
     async def test_ws_client_dropped_events(self):
         """Events are dropped when buffer is full."""
@@ -100,3 +100,27 @@ class TestHubFallback:
         # Should be able to log without crashing
         logger.info("Test message")
         logger.error("Test error")
+
+    def test_enable_mohnitor_import_cached(self):
+        """The Mohnitor import is resolved once and then reused."""
+        import sys
+        from unittest.mock import patch
+
+        import mohflow
+
+        mohflow._enable_mohnitor = None
+        first = mohflow._get_enable_mohnitor()
+        # A cached reference must not go back through the import system
+        with patch.dict(sys.modules, {"mohflow.devui.mohnitor": None}):
+            assert mohflow._get_enable_mohnitor() is first
+
+    def test_missing_mohnitor_warns(self):
+        """A failed Mohnitor import warns instead of raising."""
+        import mohflow
+
+        mohflow._enable_mohnitor = False
+        try:
+            with pytest.warns(UserWarning, match="Mohnitor not available"):
+                mohflow.get_logger("no-mohnitor-svc", enable_mohnitor=True)
+        finally:
+            mohflow._enable_mohnitor = None
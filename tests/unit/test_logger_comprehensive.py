@@ -27,7 +27,11 @@ from mohflow.formatters.structured_formatter import (
     DevelopmentFormatter,
     ProductionFormatter,
 )
-from mohflow.sampling import SamplingStrategy
+from mohflow.sampling import (
+    AdaptiveSampler,
+    SamplingConfig,
+    SamplingStrategy,
+)
 
 # ------------------------------------------------------------------
 # Helpers & fixtures
@@ -364,6 +368,24 @@ class TestPrepareExtra:
         finally:
             clear_context()
 
+    def test_request_context_merged(self, minimal_logger):
+        with minimal_logger.request_context(request_id="r1", path="/x"):
+            result = minimal_logger._prepare_extra({"extra": "val"})
+        assert result["request_id"] == "r1"
+        assert result["path"] == "/x"
+        assert result["extra"] == "val"
+
+    def test_extra_overrides_request_context(self, minimal_logger):
+        with minimal_logger.request_context(key="scoped"):
+            result = minimal_logger._prepare_extra({"key": "explicit"})
+        assert result["key"] == "explicit"
+
+    def test_request_context_reset_on_exit(self, minimal_logger):
+        with minimal_logger.request_context(request_id="r1"):
+            pass
+        result = minimal_logger._prepare_extra({})
+        assert "request_id" not in result
+
     def test_context_enricher_applied(self, enriched_logger):
         result = enriched_logger._prepare_extra({"a": 1})
         # The enricher adds system info; at minimum, extra
@@ -390,6 +412,18 @@ class TestProcessMetrics:
         # Just ensure no error; we can also spy on the generator
         metrics_logger._process_metrics("Request processed in 200ms", "INFO")
 
+    def test_metrics_see_formatted_message(self, metrics_logger):
+        with patch.object(metrics_logger, "_process_metrics") as mock_pm:
+            metrics_logger.info("Request processed in %dms", 200)
+        mock_pm.assert_called_once_with("Request processed in 200ms", "INFO")
+
+    def test_metrics_mismatched_args_do_not_raise(self, metrics_logger):
+        with patch.object(
+            metrics_logger, "_process_metrics"
+        ) as mock_pm, patch.object(metrics_logger.logger, "info"):
+            metrics_logger.info("Request processed in %dms", "slow")
+        mock_pm.assert_called_once_with("Request processed in %dms", "INFO")
+
     def test_metrics_processing_error_swallowed(self, metrics_logger):
         metrics_logger.metrics_generator.process_log_record = Mock(
             side_effect=RuntimeError("oops")
@@ -551,6 +585,130 @@ class TestSamplingIntegration:
             logger.critical("msg")
             mock_crit.assert_not_called()
 
+    def test_deterministic_sampling_uses_rendered_message(self):
+        """Templated messages must not share one deterministic decision."""
+        logger = MohflowLogger(
+            service_name="det-svc",
+            enable_sampling=True,
+            sample_rate=0.5,
+            sampling_strategy="deterministic",
+            console_logging=False,
+            enable_context_enrichment=False,
+            enable_sensitive_data_filter=False,
+        )
+        with patch.object(logger.logger, "info") as mock_inner:
+            for i in range(200):
+                logger.info("Message %d", i)
+            templated = mock_inner.call_count
+
+        with patch.object(logger.logger, "info") as mock_inner:
+            for i in range(200):
+                logger.info(f"Message {i}")
+            rendered = mock_inner.call_count
+
+        assert 0 < templated < 200
+        assert templated == rendered
+
+    def test_is_enabled_for_respects_level(self, minimal_logger):
+        minimal_logger.logger.setLevel(logging.WARNING)
+        assert minimal_logger.is_enabled_for("error")
+        assert not minimal_logger.is_enabled_for("info")
+
+    def test_is_enabled_for_unknown_level(self, minimal_logger):
+        with pytest.raises(ValueError, match="Unknown log level"):
+            minimal_logger.is_enabled_for("TRACE")
+
+    def test_is_enabled_for_does_not_sample(self, sampling_logger):
+        """The guard leaves sampling to the log call that follows."""
+        dropping = MohflowLogger(
+            service_name="enabled-svc",
+            enable_sampling=True,
+            sample_rate=0.0,
+            sampling_strategy="random",
+            console_logging=False,
+            enable_context_enrichment=False,
+            enable_sensitive_data_filter=False,
+        )
+        assert sampling_logger.is_enabled_for("INFO")
+        assert dropping.is_enabled_for("INFO")
+        assert sampling_logger.get_sampling_stats()["total_logs_count"] == 0
+        with patch.object(dropping.logger, "info") as mock_inner:
+            dropping.info("still sampled")
+            mock_inner.assert_not_called()
+
+    def test_args_not_formatted_when_sampled_out(self):
+        """%-style args are left unformatted for dropped records."""
+        logger = MohflowLogger(
+            service_name="lazy-args-svc",
+            enable_sampling=True,
+            sample_rate=0.0,
+            sampling_strategy="random",
+            console_logging=False,
+            enable_context_enrichment=False,
+            enable_sensitive_data_filter=False,
+        )
+        arg = MagicMock()
+        logger.info("value %s", arg)
+        arg.__str__.assert_not_called()
+
+    def test_log_batch_samples_once_per_batch(self, sampling_logger):
+        """log_batch takes one sampler call for the whole batch."""
+        records = [("info", f"batched {i}", {"n": i}) for i in range(3)]
+        with patch.object(
+            sampling_logger.sampler,
+            "should_sample_batch",
+            wraps=sampling_logger.sampler.should_sample_batch,
+        ) as spy, patch.object(sampling_logger.logger, "log") as mock_log:
+            sampling_logger.log_batch(records)
+        spy.assert_called_once()
+        assert mock_log.call_count == 3
+        assert mock_log.call_args.args == (logging.INFO, "batched 2")
+        assert mock_log.call_args.kwargs["extra"]["n"] == 2
+
+    def test_log_batch_drops_sampled_out(self):
+        logger = MohflowLogger(
+            service_name="batch-drop-svc",
+            enable_sampling=True,
+            sample_rate=0.0,
+            sampling_strategy="random",
+            console_logging=False,
+            enable_context_enrichment=False,
+            enable_sensitive_data_filter=False,
+        )
+        with patch.object(logger.logger, "log") as mock_log:
+            logger.log_batch([("ERROR", "dropped", {})])
+        mock_log.assert_not_called()
+
+    def test_log_batch_rejects_unknown_level(self, sampling_logger):
+        """A bad level fails the whole batch before anything is logged."""
+        records = [("INFO", "first", {}), ("TRACE", "second", {})]
+        with patch.object(
+            sampling_logger.sampler, "should_sample_batch"
+        ) as mock_sample, patch.object(
+            sampling_logger.logger, "log"
+        ) as mock_log:
+            with pytest.raises(ValueError, match="TRACE"):
+                sampling_logger.log_batch(records)
+        mock_sample.assert_not_called()
+        mock_log.assert_not_called()
+
+    def test_prebuilt_sampler_used(self):
+        """A sampler passed in is used instead of building one."""
+        sampler = AdaptiveSampler(SamplingConfig(sample_rate=0.0))
+        with patch(
+            "mohflow.logger.base.AdaptiveSampler", wraps=AdaptiveSampler
+        ) as mock_cls:
+            logger = MohflowLogger(
+                service_name="prebuilt-sampler-svc",
+                enable_sampling=True,
+                sampler=sampler,
+                console_logging=False,
+                enable_context_enrichment=False,
+                enable_sensitive_data_filter=False,
+            )
+        mock_cls.assert_not_called()
+        assert logger.sampler is sampler
+
     def test_level_sample_rates(self):
         """Per-level sample rates should work."""
         logger = MohflowLogger(
@@ -771,6 +929,12 @@ class TestCriticalLogLevel:
         assert len(records) == 1
         assert "boom" in records[0].message
 
+    def test_critical_formats_args(self, minimal_logger, caplog):
+        with caplog.at_level(logging.CRITICAL):
+            minimal_logger.critical("disk %s at %d%%", "/var", 99)
+        records = [r for r in caplog.records if r.levelname == "CRITICAL"]
+        assert records[0].getMessage() == "disk /var at 99%"
+
 
 class TestDebugLogLevel:
     def test_debug_logs(self, caplog):
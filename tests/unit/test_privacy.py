@@ -9,6 +9,7 @@ Covers:
 import json
 import logging
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -17,6 +18,7 @@ from mohflow.privacy.pii_detector import (
     PIILevel,
     PIIDetectionResult,
     detect_pii,
+    detect_pii_batch,
     scan_for_pii,
     generate_privacy_report,
     get_pii_detector,
@@ -276,6 +278,104 @@ class TestDetectPII:
         # should not crash; numeric converted to str
         assert isinstance(r, PIIDetectionResult)
 
+    # --- Cached detection ------------------------------------
+
+    def test_cached_matches_uncached(self, detector):
+        value = "user@example.com"
+        assert detector.detect_pii_cached(
+            value, "email"
+        ) == detector.detect_pii(value, "email")
+
+    def test_cached_reuses_result(self, detector):
+        detector.detect_pii_cached("123-45-6789")
+        with patch.object(detector, "detect_pii") as mock_detect:
+            detector.detect_pii_cached("123-45-6789")
+            mock_detect.assert_not_called()
+        assert len(detector._result_cache) == 1
+
+    def test_cached_keys_on_field_name(self, detector):
+        detector.detect_pii_cached("abc", "ssn")
+        detector.detect_pii_cached("abc", "note")
+        assert len(detector._result_cache) == 2
+
+    def test_cached_returns_independent_copies(self, detector):
+        first = detector.detect_pii_cached("user@example.com")
+        first.detected_types.append("mutated")
+        second = detector.detect_pii_cached("user@example.com")
+        assert "mutated" not in second.detected_types
+
+    def test_cached_does_not_store_raw_value(self, detector):
+        detector.detect_pii_cached("user@example.com")
+        ((digest, _),) = detector._result_cache.keys()
+        assert isinstance(digest, bytes)
+        assert b"user@example.com" not in digest
+        (cached,) = detector._result_cache.values()
+        assert cached.redacted_value == ""
+
+    @pytest.mark.parametrize(
+        "value",
+        ["user@example.com", "4111111111111111", "hello", "   ", ""],
+    )
+    def test_cache_hit_matches_uncached(self, detector, value):
+        detector.detect_pii_cached(value)
+        assert detector.detect_pii_cached(value) == detector.detect_pii(value)
+
+    def test_cache_bypassed_for_non_strings(self, detector):
+        detector.detect_pii_cached(123456789)
+        assert detector._result_cache == {}
+
+    def test_clear_cache(self, detector):
+        detector.detect_pii_cached("user@example.com")
+        detector.clear_cache()
+        assert detector._result_cache == {}
+
+    # --- Batch detection -------------------------------------
+
+    def test_batch_matches_single_calls(self, detector):
+        values = ["user@example.com", "hello", "123-45-6789", "hello"]
+        names = ["email", None, "ssn", None]
+        results = detector.detect_pii_batch(values, names)
+        assert results == [
+            detector.detect_pii(v, n) for v, n in zip(values, names)
+        ]
+
+    def test_batch_without_field_names(self, detector):
+        results = detector.detect_pii_batch(iter(["a", "b"]))
+        assert [r.field_name for r in results] == [None, None]
+
+    def test_batch_field_names_length_mismatch(self, detector):
+        with pytest.raises(ValueError):
+            detector.detect_pii_batch(["a", "b"], ["only_one"])
+
+    # --- Pattern prerequisites -------------------------------
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "user@example.com",
+            "123-45-6789",
+            "John Doe",
+            "AB1234567",
+            "550e8400-e29b-41d4-a716-446655440000",
+            "plain lowercase text",
+        ],
+    )
+    def test_prerequisites_match_full_scan(self, value):
+        """Skipping patterns must not change the result."""
+        full_scan = MLPIIDetector()
+        full_scan.pattern_prerequisites = {}
+        assert MLPIIDetector().detect_pii(value) == full_scan.detect_pii(value)
+
+    def test_text_traits(self, detector):
+        assert detector._text_traits("Ab1@x.y-z") == {
+            "digit",
+            "upper",
+            "@",
+            ".",
+            "-",
+        }
+        assert detector._text_traits("abc") == set()
+
 
 class TestRedactValue:
     """Tests for MLPIIDetector._redact_value."""
@@ -369,6 +469,26 @@ class TestScanDataStructure:
         # May or may not detect low-level patterns in "ok"
         assert isinstance(results, dict)
 
+    def test_bool_leaves_are_skipped(self, detector):
+        with patch.object(
+            detector, "detect_pii", wraps=detector.detect_pii
+        ) as spy:
+            results = detector.scan_data_structure(
+                {"ssn_verified": True, "items": [False]}
+            )
+        assert results == {}
+        spy.assert_not_called()
+
+    def test_dict_leaf_detected_once_with_field_name(self, detector):
+        with patch.object(
+            detector, "detect_pii", wraps=detector.detect_pii
+        ) as spy:
+            results = detector.scan_data_structure(
+                {"user": {"email": "user@example.com"}}
+            )
+        spy.assert_called_once_with("user@example.com", field_name="email")
+        assert results["user.email"].field_name == "email"
+
 
 class TestGetPrivacyReport:
 
@@ -399,6 +519,14 @@ class TestGetPrivacyReport:
         assert report["pii_fields_detected"] > 0
         assert report["risk_score"] >= 0
 
+    def test_precomputed_detections_not_rescanned(self, detector):
+        data = {"email": "user@example.com", "note": "hello"}
+        detections = detector.scan_data_structure(data)
+        with patch.object(detector, "scan_data_structure") as mock_scan:
+            report = detector.get_privacy_report(data, detections=detections)
+        mock_scan.assert_not_called()
+        assert report == detector.get_privacy_report(data)
+
 
 class TestCountFields:
 
@@ -488,6 +616,12 @@ class TestConvenienceFunctions:
         assert isinstance(r, PIIDetectionResult)
         assert "email" in r.detected_types
 
+    def test_detect_pii_batch_convenience(self):
+        results = detect_pii_batch(["user@example.com", "42"])
+        assert len(results) == 2
+        assert "email" in results[0].detected_types
+        assert results[1].detected_types == []
+
     def test_scan_for_pii_convenience(self):
         results = scan_for_pii({"email": "user@example.com"})
         assert isinstance(results, dict)
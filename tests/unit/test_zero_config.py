@@ -1,6 +1,9 @@
 """Tests for F1: Zero-Config Quickstart — `from mohflow import log`."""
 
 import logging
+import subprocess
+import sys
+
 import pytest
 
 
@@ -114,3 +117,26 @@ class TestLazyLogSingleton:
             "critical",
         ]:
             assert callable(getattr(log, method))
+
+
+class TestLazyPackageImports:
+    """Public names in mohflow are imported on first access."""
+
+    def test_import_does_not_load_logger(self):
+        code = (
+            "import sys, mohflow; "
+            "assert 'mohflow.logger.base' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_all_names_resolve(self):
+        import mohflow
+
+        for name in mohflow.__all__:
+            assert getattr(mohflow, name) is not None
+
+    def test_unknown_name_raises(self):
+        import mohflow
+
+        with pytest.raises(AttributeError):
+            mohflow.not_a_public_name